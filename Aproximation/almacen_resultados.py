@@ -0,0 +1,150 @@
+# almacen_resultados.py
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+import numpy as np
+
+from compilador import normalizar
+from validador_intervalos import acotar_alrededor
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS intervalos (
+    expr TEXT, a REAL, b REAL, delta REAL, escaneo TEXT, intervalos TEXT, fecha REAL,
+    PRIMARY KEY (expr, a, b, delta, escaneo)
+);
+CREATE TABLE IF NOT EXISTS raices (
+    expr TEXT, tipo TEXT, metodo TEXT, tol REAL, a REAL, b REAL, raiz REAL, fila TEXT, fecha REAL,
+    PRIMARY KEY (expr, tipo, metodo, tol, a, b)
+);
+CREATE INDEX IF NOT EXISTS raices_por_valor ON raices (expr, tipo, raiz);
+"""
+
+
+class AlmacenResultados:
+    """
+    Guarda en SQLite los intervalos encontrados y las raíces convergidas.
+
+    Las claves usan la expresión normalizada y los parámetros exactos
+    (intervalo, delta, tolerancia, método), así que repetir una ejecución
+    idéntica devuelve los resultados sin recalcular. Las raíces guardadas
+    también sirven de punto de partida para ejecuciones parecidas (otra
+    tolerancia, otro método u otro intervalo de búsqueda).
+
+    Cada operación abre su propia conexión, de modo que el almacén se puede
+    usar desde el hilo de trabajo y desde el de la interfaz.
+
+    Args:
+        ruta (str): Archivo de la base de datos; se crea si no existe.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        with closing(self._conectar()) as con:
+            con.executescript(_ESQUEMA)
+
+    def _conectar(self):
+        return sqlite3.connect(self.ruta, timeout=10)
+
+    # ---- Intervalos ----
+    def intervalos(self, expr_str, a, b, delta, escaneo="uniforme"):
+        """Devuelve los intervalos guardados para esta búsqueda exacta, o None."""
+        with closing(self._conectar()) as con:
+            fila = con.execute("SELECT intervalos FROM intervalos WHERE expr=? AND a=? AND b=? AND delta=? "
+                               "AND escaneo=?", (normalizar(expr_str), a, b, delta, escaneo)).fetchone()
+        return None if fila is None else [tuple(par) for par in json.loads(fila[0])]
+
+    def guardar_intervalos(self, expr_str, a, b, delta, intervalos, escaneo="uniforme"):
+        with closing(self._conectar()) as con, con:
+            con.execute("INSERT OR REPLACE INTO intervalos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (normalizar(expr_str), a, b, delta, escaneo, json.dumps(list(intervalos)), time.time()))
+
+    # ---- Raíces ----
+    def raiz(self, expr_str, tipo, metodo, tol, a, b):
+        """
+        Devuelve la fila final guardada para este problema exacto, o None.
+
+        Args:
+            expr_str (str): f(x) o, en punto fijo, g(x).
+            tipo (str): "raiz" o "punto_fijo".
+            metodo (str): Descripción del método y sus opciones.
+            tol (float): Tolerancia.
+            a, b (float): Intervalo resuelto (en punto fijo, a = b = x0).
+        """
+        with closing(self._conectar()) as con:
+            fila = con.execute("SELECT fila FROM raices WHERE expr=? AND tipo=? AND metodo=? AND tol=? AND a=? "
+                               "AND b=?", (normalizar(expr_str), tipo, metodo, tol, a, b)).fetchone()
+        return None if fila is None else tuple(json.loads(fila[0]))
+
+    def guardar_raiz(self, expr_str, tipo, metodo, tol, a, b, raiz, fila):
+        """Guarda la raíz convergida y la fila final que la produjo."""
+        with closing(self._conectar()) as con, con:
+            con.execute("INSERT OR REPLACE INTO raices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (normalizar(expr_str), tipo, metodo, tol, a, b, float(raiz),
+                         json.dumps([v.item() if hasattr(v, "item") else v for v in fila]), time.time()))
+
+    def raiz_cercana(self, expr_str, tipo, x, a=None, b=None):
+        """
+        Devuelve la raíz guardada más cercana a x (de cualquier método y
+        tolerancia), opcionalmente restringida a [a, b], o None.
+        """
+        consulta = "SELECT raiz FROM raices WHERE expr=? AND tipo=?"
+        parametros = [normalizar(expr_str), tipo]
+        if a is not None and b is not None:
+            consulta += " AND raiz BETWEEN ? AND ?"
+            parametros += [min(a, b), max(a, b)]
+        consulta += " ORDER BY abs(raiz - ?) LIMIT 1"
+        parametros.append(x)
+        with closing(self._conectar()) as con:
+            fila = con.execute(consulta, parametros).fetchone()
+        return None if fila is None else fila[0]
+
+    # ---- Ejecuciones por intervalos (filas (i, a, b, xr, fr, error)) ----
+    def preparar_intervalos(self, f_lambd, expr_str, metodo, tol, extremos):
+        """
+        Separa los intervalos ya resueltos con estos parámetros de los pendientes.
+
+        Los pendientes que contienen una raíz guardada (de cualquier método o
+        tolerancia) arrancan acotados alrededor de ella.
+
+        Args:
+            f_lambd (callable): Función compilada.
+            expr_str (str): f(x).
+            metodo (str): Descripción del método y sus opciones.
+            tol (float): Tolerancia.
+            extremos (array): Intervalos (n, 2).
+
+        Returns:
+            tuple: (servidas, pendientes, inicio): pares (k, fila_final) ya
+                   guardados, índices k por resolver y sus intervalos de arranque.
+        """
+        servidas, pendientes, inicio = [], [], []
+        for k, (a_i, b_i) in enumerate(np.asarray(extremos, dtype=float).reshape(-1, 2).tolist()):
+            fila = self.raiz(expr_str, "raiz", metodo, tol, a_i, b_i)
+            if fila is not None:
+                servidas.append((k, fila))
+                continue
+            pendientes.append(k)
+            previa = self.raiz_cercana(expr_str, "raiz", (a_i + b_i) / 2, a_i, b_i)
+            inicio.append((a_i, b_i) if previa is None else
+                          acotar_alrededor(f_lambd, a_i, b_i, previa, tol * max(1.0, abs(previa))))
+        return servidas, pendientes, np.array(inicio, dtype=float).reshape(-1, 2)
+
+    def guardar_filas(self, expr_str, metodo, tol, a, b, filas):
+        """Guarda la fila final de un intervalo si el método convergió."""
+        if not filas:
+            return
+        final = filas[-1]
+        _, _, _, xr, fr, error = final
+        if abs(fr) < np.finfo(float).eps or (error is not None and error < tol):
+            self.guardar_raiz(expr_str, "raiz", metodo, tol, a, b, xr, final)
+
+    def limpiar(self):
+        """Borra todos los resultados guardados."""
+        with closing(self._conectar()) as con, con:
+            con.execute("DELETE FROM intervalos")
+            con.execute("DELETE FROM raices")
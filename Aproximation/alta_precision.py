@@ -0,0 +1,346 @@
+# alta_precision.py
+import numpy as np
+
+from compilador import compilar_mpmath
+from instrumentacion import medir_fase
+from metodo import interpolacion_lineal_iter
+from punto_fijo import compilar_punto_fijo, punto_fijo_iter
+
+# Dígitos decimales de mpmath cuando no se indica otra precisión
+DPS_POR_DEFECTO = 50
+
+# Radio relativo máximo de los encierros verificados (o la tolerancia, si es mayor)
+RADIO_MAX_VERIFICACION = 1e-6
+
+
+def _escala(x):
+    return max(1.0, abs(x))
+
+
+def estancado_interpolacion(filas, f_lambd, tol):
+    """
+    Decide, sin salir de float64, si Regula Falsi se estancó antes de la tolerancia.
+
+    La distancia a la raíz se estima con un paso de Newton |f(xr) / f'(xr)|.
+    La derivada es la pendiente secante de las dos últimas aproximaciones, sin
+    evaluaciones extra; con una sola fila se usan diferencias centradas. Con
+    raíces mal condicionadas f(xr) es ruido de redondeo o la derivada es casi
+    nula, y la estimación supera la tolerancia aunque el error entre
+    iteraciones sea pequeño o |f(xr)| < eps. Una tolerancia por debajo del
+    redondeo de float64 siempre escala.
+
+    Args:
+        filas (list): Filas (i, a, b, xr, fr, error) de la ejecución en float64.
+        f_lambd (callable): Función compilada.
+        tol (float): Tolerancia relativa.
+
+    Returns:
+        bool: True si conviene pulir la raíz con mpmath.
+    """
+    if not filas:
+        return False
+    _, _, _, xr, fr, _ = filas[-1]
+    if not np.isfinite(xr):
+        return False
+    xr = np.float64(xr)
+    with np.errstate(all="ignore"):
+        if len(filas) > 1 and filas[-2][3] != xr:
+            pendiente = (fr - filas[-2][4]) / (xr - filas[-2][3])
+        else:
+            h = np.sqrt(np.finfo(float).eps) * _escala(xr)
+            pendiente = (f_lambd(xr + h) - f_lambd(xr - h)) / (2 * h)
+        distancia = abs(fr / pendiente) if pendiente != 0 else np.inf
+    # NaN también cuenta como estancado
+    return not max(distancia, np.finfo(float).eps * abs(xr)) <= tol * _escala(xr)
+
+
+def estancado_punto_fijo(filas, tol):
+    """
+    Decide, sin salir de float64, si la iteración de punto fijo se estancó.
+
+    Con convergencia lineal de razón L (estimada con los dos últimos errores)
+    la distancia al punto fijo es del orden de error * L / (1 - L); si L >= 1
+    o la estimación supera la tolerancia, la iteración no garantiza el
+    resultado. Si los errores crecen lejos del redondeo la iteración diverge
+    y no hay nada que pulir.
+
+    Args:
+        filas (list): Filas (i, x_n, error) de la ejecución en float64.
+        tol (float): Tolerancia absoluta, como en punto_fijo.
+
+    Returns:
+        bool: True si conviene pulir el punto fijo con mpmath.
+    """
+    if not filas:
+        return False
+    _, x, error = filas[-1]
+    # Los iterados pueden ser enteros enormes de Python, que np.isfinite no acepta
+    if not abs(x) < np.inf or not error < np.inf:
+        return False
+    redondeo = np.finfo(float).eps * _escala(x)
+    if len(filas) < 2:
+        return not error < tol
+    anterior = filas[-2][2]
+    razon = error / anterior if anterior else (0.0 if error == 0 else np.inf)
+    if razon > 1 and error > 1e3 * redondeo:
+        return False
+    distancia = error * razon / (1 - razon) if razon < 1 else np.inf
+    return not max(distancia, redondeo) < tol
+
+
+def _pulir(f, df, d2f, x, a=None, b=None, max_pasos=50):
+    """
+    Newton modificado x - f f' / (f'^2 - f f'') en la precisión actual de
+    mpmath; converge cuadráticamente también con raíces múltiples. Si [a, b]
+    encierra un cambio de signo, los pasos que salen de él se reemplazan por
+    bisección.
+
+    Returns:
+        tuple: (pasos, x): pasos es una lista de (x, f(x), error) y x la última
+               aproximación, o pasos vacío si la iteración no converge o no
+               reduce |f| (por ejemplo, porque se acerca a un polo).
+    """
+    import mpmath
+
+    meta = mpmath.mpf(10) ** (3 - mpmath.mp.dps)
+    x = mpmath.mpf(x)
+    fx = f(x)
+    f_inicial = abs(fx)
+    encierra = a is not None and b is not None and f(mpmath.mpf(a)) * f(mpmath.mpf(b)) < 0
+    if encierra:
+        a, b = mpmath.mpf(a), mpmath.mpf(b)
+        fa = f(a)
+
+    pasos = []
+    for _ in range(max_pasos):
+        if fx == 0:
+            break
+        d1 = df(x)
+        denominador = d1 * d1 - fx * d2f(x)
+        # En un punto crítico (f' = 0) el paso es nulo sin que x sea raíz
+        nuevo = x - fx * d1 / denominador if denominador != 0 and d1 != 0 else None
+        if encierra:
+            # Se achica el intervalo con el signo de f(x) y se biseca si el paso sale de
+            # él (salvo que el paso ya sea del orden de la precisión de trabajo)
+            if mpmath.sign(fx) == mpmath.sign(fa):
+                a, fa = x, fx
+            else:
+                b = x
+            if nuevo is None or (not a <= nuevo <= b and abs(nuevo - x) > meta * abs(x)):
+                nuevo = (a + b) / 2
+        if nuevo is None or not mpmath.isfinite(nuevo):
+            return [], x
+
+        error = abs((nuevo - x) / nuevo) if nuevo != 0 else abs(nuevo - x)
+        x, fx = nuevo, f(nuevo)
+        pasos.append((x, fx, error))
+        if error <= meta:
+            break
+    else:
+        if pasos and pasos[-1][2] > mpmath.sqrt(meta):
+            return [], x
+    if pasos and not (fx == 0 or abs(fx) < f_inicial):
+        return [], x
+    return pasos, x
+
+
+def _encierro(prueba, x, radio, radio_max):
+    """
+    Busca un intervalo [x - r, x + r] que la prueba con aritmética de
+    intervalos certifique, agrandando r de `radio` a `radio_max`. Devuelve
+    (lo, hi) o None.
+    """
+    import mpmath
+    from mpmath import iv
+
+    x, r = mpmath.mpf(x), mpmath.mpf(radio)
+    while r <= radio_max:
+        lo, hi = x - r, x + r
+        try:
+            if prueba(iv.mpf(lo), iv.mpf(hi), iv.mpf([lo, hi])):
+                return lo, hi
+        except Exception:
+            # Función sin versión de intervalos o fuera de su dominio
+            return None
+        r *= 100
+    return None
+
+
+def _radio(pasos, dps):
+    # Radio relativo inicial del encierro: el último paso de pulido, o la
+    # precisión de trabajo si el pulido terminó en un cero exacto de f
+    x, fx, error = pasos[-1]
+    return max(float(error) if fx != 0 else 0.0, 10.0 ** (3 - dps))
+
+
+def _acotado(y):
+    return y.a > -np.inf and y.b < np.inf
+
+
+def _signos_opuestos(y_lo, y_hi):
+    return (y_lo.b < 0 < y_hi.a) or (y_hi.b < 0 < y_lo.a)
+
+
+def _con_precision(dps, calculo):
+    # mpmath.iv no tiene workdps: su precisión se fija y se restaura a mano
+    import mpmath
+    from mpmath import iv
+
+    anterior = iv.prec
+    try:
+        with mpmath.workdps(dps):
+            iv.dps = dps
+            return calculo()
+    finally:
+        iv.prec = anterior
+
+
+@medir_fase("alta_precision")
+def refinar_interpolacion(filas, f_str, f_lambd, tol, dps=DPS_POR_DEFECTO, verificar=False, max_pasos=50):
+    """
+    Pule con mpmath la raíz de una ejecución de Regula Falsi que se estancó en float64.
+
+    Si estancado_interpolacion indica que float64 alcanzó la tolerancia no se
+    hace nada (salvo verificar, si se pide), así que el costo extra en
+    problemas bien condicionados es una evaluación de f. Si no, se parte de
+    la última aproximación y se itera Newton modificado con `dps` dígitos,
+    sobre la expresión tal como se escribió.
+
+    Args:
+        filas (list): Filas (i, a, b, xr, fr, error) de la ejecución en float64.
+        f_str (str): f(x) como string.
+        f_lambd (callable): f compilada para float64.
+        tol (float): Tolerancia relativa.
+        dps (int): Dígitos decimales de mpmath.
+        verificar (bool): Si es True, busca un encierro [lo, hi] donde la
+            aritmética de intervalos de mpmath certifica un cambio de signo
+            de f (y que f está acotada, es decir, sin polos).
+        max_pasos (int): Pasos máximos de pulido.
+
+    Returns:
+        tuple: (nuevas, raiz, encierro): filas de pulido con el formato de
+               Regula Falsi (vacía si no hizo falta o no convergió), la raíz
+               como mpmath.mpf (None si no se pulió) y el encierro (lo, hi)
+               como mpmath.mpf (None si no se pidió o no se pudo certificar).
+    """
+    if not filas:
+        return [], None, None
+    i, a, b, xr, _, _ = filas[-1]
+    escalar = estancado_interpolacion(filas, f_lambd, tol)
+    if not escalar and not verificar:
+        return [], None, None
+
+    def calculo():
+        import mpmath
+
+        nuevas, raiz = [], None
+        radio = np.finfo(float).eps * _escala(xr)
+        if escalar:
+            f = compilar_mpmath(f_str)[1]
+            pasos, x = _pulir(f, compilar_mpmath(f_str, 1)[1], compilar_mpmath(f_str, 2)[1], xr, a, b, max_pasos)
+            if pasos:
+                raiz = x
+                nuevas = [(i + k, a, b, float(xk), float(fxk), float(error))
+                          for k, (xk, fxk, error) in enumerate(pasos, start=1)]
+                radio = _radio(pasos, dps) * _escala(xr)
+
+        encierro = None
+        if verificar:
+            f_iv = compilar_mpmath(f_str, intervalos=True)[1]
+            centro = raiz if raiz is not None else mpmath.mpf(xr)
+            encierro = _encierro(lambda lo, hi, todo: _signos_opuestos(f_iv(lo), f_iv(hi)) and _acotado(f_iv(todo)),
+                                 centro, radio, max(tol, RADIO_MAX_VERIFICACION) * _escala(xr))
+        return nuevas, raiz, encierro
+
+    return _con_precision(dps, calculo)
+
+
+@medir_fase("alta_precision")
+def refinar_punto_fijo(filas, g_str, tol, dps=DPS_POR_DEFECTO, verificar=False, max_pasos=50):
+    """
+    Pule con mpmath el punto fijo de una iteración que se estancó en float64.
+
+    Se resuelve g(x) - x = 0 con Newton modificado y `dps` dígitos a partir
+    del último iterado.
+
+    Args:
+        filas (list): Filas (i, x_n, error) de la ejecución en float64 (basta
+            con las dos últimas).
+        g_str (str): g(x) como string.
+        tol (float): Tolerancia absoluta, como en punto_fijo.
+        dps (int): Dígitos decimales de mpmath.
+        verificar (bool): Si es True, busca un encierro X = [lo, hi] con g(X)
+            contenido en X (existencia de un punto fijo por el teorema de
+            Brouwer) o, si no, con un cambio de signo certificado de g(x) - x.
+        max_pasos (int): Pasos máximos de pulido.
+
+    Returns:
+        tuple: (nuevas, raiz, encierro) como en refinar_interpolacion, con
+               filas (i, x_n, error).
+    """
+    if not filas:
+        return [], None, None
+    i, x_n, _ = filas[-1]
+    escalar = estancado_punto_fijo(filas, tol)
+    if not escalar and not verificar:
+        return [], None, None
+
+    def calculo():
+        import mpmath
+
+        nuevas, raiz = [], None
+        radio = np.finfo(float).eps * _escala(x_n)
+        if escalar:
+            g = compilar_mpmath(g_str)[1]
+            dg, d2g = compilar_mpmath(g_str, 1)[1], compilar_mpmath(g_str, 2)[1]
+            pasos, x = _pulir(lambda t: g(t) - t, lambda t: dg(t) - 1, d2g, x_n, max_pasos=max_pasos)
+            if pasos:
+                raiz = x
+                # El error de punto fijo es absoluto: |x_nuevo - x_anterior|
+                previos = [mpmath.mpf(x_n)] + [xk for xk, _, _ in pasos[:-1]]
+                nuevas = [(i + k, float(xk), float(abs(xk - xp)))
+                          for k, ((xk, _, _), xp) in enumerate(zip(pasos, previos), start=1)]
+                radio = _radio(pasos, dps) * _escala(x_n)
+
+        encierro = None
+        if verificar:
+            g_iv = compilar_mpmath(g_str, intervalos=True)[1]
+            centro = raiz if raiz is not None else mpmath.mpf(x_n)
+
+            def prueba(lo, hi, todo):
+                imagen = g_iv(todo)
+                if not _acotado(imagen):
+                    return False
+                return (todo.a <= imagen.a and imagen.b <= todo.b) or _signos_opuestos(g_iv(lo) - lo, g_iv(hi) - hi)
+
+            encierro = _encierro(prueba, centro, radio, max(tol, RADIO_MAX_VERIFICACION) * _escala(x_n))
+        return nuevas, raiz, encierro
+
+    return _con_precision(dps, calculo)
+
+
+def interpolacion_lineal_precisa(f_str, f_lambd, a, b, tol, max_iter, use_tol, dps=DPS_POR_DEFECTO,
+                                 verificar=False):
+    """
+    Regula Falsi en float64 con escalado a mpmath solo si se estanca.
+
+    Returns:
+        tuple: (filas, raiz, encierro), con las filas de pulido al final.
+    """
+    filas = list(interpolacion_lineal_iter(f_lambd, a, b, tol, max_iter, use_tol))
+    nuevas, raiz, encierro = refinar_interpolacion(filas, f_str, f_lambd, tol, dps, verificar)
+    return filas + nuevas, raiz, encierro
+
+
+def punto_fijo_preciso(g_str, x0, tol, max_iter, use_aitken, dps=DPS_POR_DEFECTO, verificar=False,
+                       backend="numpy"):
+    """
+    Punto fijo en float64 con escalado a mpmath solo si se estanca.
+
+    Returns:
+        tuple: (filas, raiz, encierro), con las filas de pulido al final.
+    """
+    g_lambd, _, _ = compilar_punto_fijo(g_str, "0", backend)
+    filas = list(punto_fijo_iter(g_lambd, x0, tol, max_iter, use_aitken))
+    nuevas, raiz, encierro = refinar_punto_fijo(filas, g_str, tol, dps, verificar)
+    return filas + nuevas, raiz, encierro
@@ -0,0 +1,403 @@
+"""
+Banco de pruebas de rendimiento para la búsqueda de intervalos y los métodos de raíces.
+
+No importa Tk ni matplotlib. Para cada función del catálogo mide tiempo,
+evaluaciones de f, iteraciones y memoria pico de cada método y configuración
+de búsqueda, escribe los resultados en JSON y puede compararlos contra una
+base guardada para detectar regresiones.
+
+Uso:
+    python benchmark.py --salida resultados.json
+    python benchmark.py --guardar-base benchmark_base.json
+    python benchmark.py --comparar benchmark_base.json --umbral 0.25
+    python benchmark.py --arranque
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from alta_precision import interpolacion_lineal_precisa
+from bucles_numba import interpolacion_lineal_numba, punto_fijo_numba
+from compilador import backends_disponibles, compilar, compilar_derivada
+from metodo import interpolacion_lineal, interpolacion_lineal_lotes
+from metodos_rapidos import brent, newton, secante, steffensen
+from polinomios import coeficientes_polinomio, resolver_polinomio
+from punto_fijo import punto_fijo_iter, punto_fijo_lotes
+from validador_intervalos import buscar_intervalos, buscar_intervalos_adaptativo
+
+# Catálogo de funciones representativas: (nombre, f(x), a, b, delta)
+CATALOGO_RAICES = [
+    ("polinomio", "x**3 - 2x - 5", -3.0, 3.0, 0.1),
+    ("polinomio_grado_alto", "(x-1)*(x-2)*(x-3)*(x-4)*(x-5) - 0.5", 0.0, 6.0, 0.05),
+    ("polinomio_raiz_doble", "(x-1)**2*(x-3)", 0.0, 4.0, 0.3),
+    ("trascendente", "exp(-x) - x", -1.0, 2.0, 0.1),
+    ("oscilatoria", "sin(50x)", 0.0, 10.0, 0.01),
+    ("con_huecos", "log(x) + sqrt(x) - 1", -2.0, 5.0, 0.05),
+]
+
+# Funciones de iteración de punto fijo: (nombre, g(x), x0)
+CATALOGO_PUNTO_FIJO = [
+    ("coseno", "cos(x)", 1.0),
+    ("exponencial", "exp(-x)", 0.5),
+    ("lenta", "x - 0.01*(x**2 - 2)", 1.0),
+]
+
+TOL = 1e-10
+MAX_ITER = 500
+
+# Módulos cuyo arranque se mide y dependencias que no deben cargarse al importarlos
+MODULOS_ARRANQUE = ("interfaz", "cli")
+MODULOS_PESADOS = ("sympy", "matplotlib")
+
+
+class Contador:
+    """Envuelve una función compilada y cuenta los puntos evaluados."""
+
+    def __init__(self, f):
+        self.f = f
+        self.evaluaciones = 0
+
+    def __call__(self, x):
+        self.evaluaciones += int(np.size(x))
+        return self.f(x)
+
+
+def medir(funcion, repeticiones):
+    """
+    Ejecuta `funcion()` varias veces y devuelve el mejor tiempo, la
+    memoria pico y lo que devuelva la última ejecución.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(tiempos), pico, resultado
+
+
+def _escaneos(nombre, fx_str, a, b, delta, repeticiones):
+    _, f = compilar(fx_str)
+    _, df = compilar_derivada(fx_str)
+    configuraciones = {
+        "escalar": lambda c: buscar_intervalos(fx_str, a, b, delta, vectorizado=False, f_lambd=c),
+        "vectorizado": lambda c: buscar_intervalos(fx_str, a, b, delta, f_lambd=c),
+        "vectorizado_fino": lambda c: buscar_intervalos(fx_str, a, b, delta / 100, f_lambd=c),
+        "adaptativo": lambda c: buscar_intervalos_adaptativo(fx_str, a, b, delta, f_lambd=c,
+                                                             df_lambd=df),
+    }
+    for config, escaneo in configuraciones.items():
+        contador = Contador(f)
+
+        def correr():
+            contador.evaluaciones = 0
+            return escaneo(contador)
+
+        tiempo, pico, intervalos = medir(correr, repeticiones)
+        yield {"caso": nombre, "tipo": "escaneo", "metodo": config, "tiempo_s": tiempo,
+               "evaluaciones": contador.evaluaciones, "iteraciones": None, "memoria_pico_bytes": pico,
+               "raices": len(intervalos)}
+
+
+def _solvers(nombre, fx_str, a, b, delta, repeticiones):
+    _, f = compilar(fx_str)
+    _, df = compilar_derivada(fx_str)
+    intervalos = np.array(buscar_intervalos(fx_str, a, b, delta), dtype=float).reshape(-1, 2)
+    with np.errstate(all="ignore"):
+        validos = f(intervalos[:, 0]) * f(intervalos[:, 1]) <= 0
+    intervalos = intervalos[np.broadcast_to(validos, intervalos[:, 0].shape)]
+    pares = intervalos.tolist()
+
+    def por_intervalo(metodo, **extra):
+        def resolver(c):
+            filas = []
+            for a_i, b_i in pares:
+                filas.append(metodo(c, a_i, b_i, TOL, MAX_ITER, True, **extra)[0])
+            return filas
+        return resolver
+
+    metodos = {
+        "regula_falsi": lambda c: [interpolacion_lineal(c, a_i, b_i, TOL, MAX_ITER, True) for a_i, b_i in pares],
+        # Igual a regula_falsi salvo en las raíces que se estancan, que se pulen con mpmath
+        "regula_falsi_mp": lambda c: [interpolacion_lineal_precisa(fx_str, c, a_i, b_i, TOL, MAX_ITER, True)[0]
+                                      for a_i, b_i in pares],
+        "regula_falsi_lotes": lambda c: interpolacion_lineal_lotes(c, intervalos[:, 0], intervalos[:, 1], TOL,
+                                                                   MAX_ITER, True),
+        "illinois_lotes": lambda c: interpolacion_lineal_lotes(c, intervalos[:, 0], intervalos[:, 1], TOL, MAX_ITER,
+                                                               True, "illinois"),
+        "brent": por_intervalo(brent),
+        "newton": por_intervalo(newton, df_lambd=df),
+        "secante": por_intervalo(secante),
+        "steffensen": por_intervalo(steffensen),
+    }
+    for metodo, resolver in metodos.items():
+        contador = Contador(f)
+
+        def correr():
+            contador.evaluaciones = 0
+            return resolver(contador)
+
+        tiempo, pico, filas = medir(correr, repeticiones)
+        yield {"caso": nombre, "tipo": "solver", "metodo": metodo, "tiempo_s": tiempo,
+               "evaluaciones": contador.evaluaciones, "iteraciones": sum(len(r) for r in filas),
+               "memoria_pico_bytes": pico, "raices": sum(1 for r in filas if r)}
+
+
+def _backends(nombre, fx_str, a, b, delta, repeticiones):
+    # Cada backend disponible en la malla fina y en el Regula Falsi escalar
+    intervalos = buscar_intervalos(fx_str, a, b, delta)
+    for backend in backends_disponibles():
+        _, f = compilar(fx_str, backend)
+        configuraciones = {
+            "escaneo_fino": lambda c: buscar_intervalos(fx_str, a, b, delta / 100, f_lambd=c),
+            "regula_falsi": lambda c: [interpolacion_lineal(c, a_i, b_i, TOL, MAX_ITER, True)
+                                       for a_i, b_i in intervalos],
+        }
+        for config, correr_con in configuraciones.items():
+            contador = Contador(f)
+
+            def correr():
+                contador.evaluaciones = 0
+                return correr_con(contador)
+
+            tiempo, pico, salida = medir(correr, repeticiones)
+            yield {"caso": nombre, "tipo": "backend", "metodo": f"{backend}_{config}", "tiempo_s": tiempo,
+                   "evaluaciones": contador.evaluaciones, "iteraciones": None, "memoria_pico_bytes": pico,
+                   "raices": sum(1 for r in salida if r)}
+
+    if "numba" in backends_disponibles():
+        # Función y bucle compilados juntos: las evaluaciones se deducen de las
+        # filas (f(a), f(b) y una por iteración), igual que las cuenta Contador
+        tiempo, pico, salida = medir(lambda: [interpolacion_lineal_numba(fx_str, a_i, b_i, TOL, MAX_ITER, True)
+                                              for a_i, b_i in intervalos], repeticiones)
+        yield {"caso": nombre, "tipo": "backend", "metodo": "numba_bucle_regula_falsi", "tiempo_s": tiempo,
+               "evaluaciones": sum(len(filas) + 2 for filas in salida), "iteraciones": None,
+               "memoria_pico_bytes": pico, "raices": sum(1 for r in salida if r)}
+
+
+def _polinomio(nombre, fx_str, a, b, repeticiones):
+    # Vía rápida de la matriz compañera (detección incluida), solo para polinomios
+    if coeficientes_polinomio(fx_str) is None:
+        return
+    contador = Contador(compilar(fx_str)[1])
+    df = compilar_derivada(fx_str)[1]
+
+    def correr():
+        contador.evaluaciones = 0
+        return resolver_polinomio(coeficientes_polinomio(fx_str), a, b, f_lambd=contador, df_lambd=df)
+
+    tiempo, pico, (filas, _) = medir(correr, repeticiones)
+    yield {"caso": nombre, "tipo": "polinomio", "metodo": "matriz_companera", "tiempo_s": tiempo,
+           "evaluaciones": contador.evaluaciones, "iteraciones": sum(len(f) for f in filas),
+           "memoria_pico_bytes": pico, "raices": len(filas)}
+
+
+def _punto_fijo(nombre, g_str, x0, repeticiones):
+    _, g = compilar(g_str)
+    for use_aitken in (False, True):
+        contador = Contador(g)
+
+        def correr():
+            contador.evaluaciones = 0
+            return list(punto_fijo_iter(contador, x0, TOL, MAX_ITER, use_aitken))
+
+        tiempo, pico, filas = medir(correr, repeticiones)
+        yield {"caso": nombre, "tipo": "punto_fijo", "metodo": "aitken" if use_aitken else "estandar",
+               "tiempo_s": tiempo, "evaluaciones": contador.evaluaciones, "iteraciones": len(filas),
+               "memoria_pico_bytes": pico, "raices": 1 if filas and filas[-1][2] < TOL else 0}
+
+        if "numba" in backends_disponibles():
+            # La escalera tiene x0 más un punto por evaluación de g
+            tiempo, pico, (filas, x_vals) = medir(lambda: punto_fijo_numba(g_str, x0, TOL, MAX_ITER, use_aitken),
+                                                  repeticiones)
+            yield {"caso": nombre, "tipo": "punto_fijo",
+                   "metodo": "numba_aitken" if use_aitken else "numba_estandar", "tiempo_s": tiempo,
+                   "evaluaciones": len(x_vals) - 1, "iteraciones": len(filas), "memoria_pico_bytes": pico,
+                   "raices": 1 if filas and filas[-1][2] < TOL else 0}
+
+    x0s = np.linspace(x0 - 1, x0 + 1, 10000)
+    tiempo, pico, (_, iteraciones, estado) = medir(lambda: punto_fijo_lotes(g_str, x0s, TOL, MAX_ITER, True),
+                                                   repeticiones)
+    yield {"caso": nombre, "tipo": "punto_fijo", "metodo": "aitken_lotes_10000", "tiempo_s": tiempo,
+           "evaluaciones": None, "iteraciones": int(iteraciones.sum()), "memoria_pico_bytes": pico,
+           "raices": int((estado == 0).sum())}
+
+
+def medir_arranque(modulo, repeticiones=3):
+    """
+    Mide el tiempo de importación de un módulo en un proceso nuevo con
+    `python -X importtime` y detecta qué dependencias pesadas carga.
+
+    Returns:
+        dict: Fila de resultados con tipo "arranque" y la lista "pesados".
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    mejor, pesados, error = None, [], None
+    for _ in range(repeticiones):
+        proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"], cwd=directorio,
+                                 capture_output=True, text=True)
+        if proceso.returncode != 0:
+            error = proceso.stderr.strip().splitlines()[-1] if proceso.stderr.strip() else "error desconocido"
+            break
+
+        total, cargados = None, set()
+        for linea in proceso.stderr.splitlines():
+            if not linea.startswith("import time:") or "|" not in linea:
+                continue
+            _, acumulado, nombre = (parte.strip() for parte in linea[len("import time:"):].split("|"))
+            if not acumulado.isdigit():
+                continue
+            cargados.add(nombre.split(".")[0])
+            if nombre == modulo:
+                total = int(acumulado) / 1e6
+        if total is not None and (mejor is None or total < mejor):
+            mejor = total
+        pesados = sorted(cargados.intersection(MODULOS_PESADOS))
+
+    fila = {"caso": modulo, "tipo": "arranque", "metodo": "importtime", "tiempo_s": mejor or 0.0,
+            "evaluaciones": None, "iteraciones": None, "memoria_pico_bytes": 0, "raices": 0, "pesados": pesados}
+    if error is not None:
+        fila["error"] = error
+    return fila
+
+
+def ejecutar_arranque(repeticiones=3):
+    """Mide el arranque de MODULOS_ARRANQUE y devuelve el mismo formato que ejecutar_benchmarks."""
+    return {
+        "metadatos": {"python": sys.version.split()[0], "plataforma": platform.platform(),
+                      "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeticiones": repeticiones},
+        "resultados": [medir_arranque(modulo, repeticiones) for modulo in MODULOS_ARRANQUE],
+    }
+
+
+def ejecutar_benchmarks(repeticiones=3, filtro=None):
+    """
+    Ejecuta todo el catálogo y devuelve un diccionario con metadatos y resultados.
+
+    Args:
+        repeticiones (int): Ejecuciones por medición (se reporta el mejor tiempo).
+        filtro (str): Si se indica, solo se ejecutan los casos cuyo nombre lo contiene.
+    """
+    resultados = []
+    for nombre, fx_str, a, b, delta in CATALOGO_RAICES:
+        if filtro and filtro not in nombre:
+            continue
+        resultados.extend(_escaneos(nombre, fx_str, a, b, delta, repeticiones))
+        resultados.extend(_solvers(nombre, fx_str, a, b, delta, repeticiones))
+        resultados.extend(_backends(nombre, fx_str, a, b, delta, repeticiones))
+        resultados.extend(_polinomio(nombre, fx_str, a, b, repeticiones))
+    for nombre, g_str, x0 in CATALOGO_PUNTO_FIJO:
+        if filtro and filtro not in nombre:
+            continue
+        resultados.extend(_punto_fijo(nombre, g_str, x0, repeticiones))
+
+    return {
+        "metadatos": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeticiones": repeticiones,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(actual, base, umbral=0.25):
+    """
+    Compara dos ejecuciones y devuelve la lista de regresiones.
+
+    Se marca regresión si el tiempo crece más que `umbral` (fracción) o si
+    aumentan las evaluaciones o las iteraciones, o si se encuentran menos raíces.
+    """
+    indice = {(r["caso"], r["tipo"], r["metodo"]): r for r in base["resultados"]}
+    regresiones = []
+    for r in actual["resultados"]:
+        previo = indice.get((r["caso"], r["tipo"], r["metodo"]))
+        if previo is None:
+            continue
+        motivos = []
+        if previo["tiempo_s"] > 0 and r["tiempo_s"] > previo["tiempo_s"] * (1 + umbral):
+            motivos.append(f"tiempo {previo['tiempo_s']:.4g}s -> {r['tiempo_s']:.4g}s")
+        for campo in ("evaluaciones", "iteraciones"):
+            if previo[campo] is not None and r[campo] is not None and r[campo] > previo[campo]:
+                motivos.append(f"{campo} {previo[campo]} -> {r[campo]}")
+        if r["raices"] < previo["raices"]:
+            motivos.append(f"raíces {previo['raices']} -> {r['raices']}")
+        nuevos = set(r.get("pesados", [])) - set(previo.get("pesados", []))
+        if nuevos:
+            motivos.append(f"carga al arrancar: {', '.join(sorted(nuevos))}")
+        if motivos:
+            regresiones.append((r["caso"], r["tipo"], r["metodo"], motivos))
+    return regresiones
+
+
+def _imprimir_tabla(datos):
+    print(f"{'caso':<22}{'tipo':<12}{'método':<20}{'tiempo (ms)':>12}{'evals':>10}{'iters':>8}{'mem (KiB)':>11}"
+          f"{'raíces':>8}")
+    for r in datos["resultados"]:
+        evals = "-" if r["evaluaciones"] is None else r["evaluaciones"]
+        iters = "-" if r["iteraciones"] is None else r["iteraciones"]
+        print(f"{r['caso']:<22}{r['tipo']:<12}{r['metodo']:<20}{r['tiempo_s'] * 1e3:>12.3f}{evals:>10}{iters:>8}"
+              f"{r['memoria_pico_bytes'] / 1024:>11.1f}{r['raices']:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de búsqueda de intervalos y métodos de raíces.")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--filtro", help="Ejecuta solo los casos cuyo nombre contiene este texto.")
+    parser.add_argument("--salida", help="Archivo JSON donde escribir los resultados.")
+    parser.add_argument("--guardar-base", help="Guarda los resultados como nueva base de comparación.")
+    parser.add_argument("--comparar", help="Archivo JSON base contra el cual comparar.")
+    parser.add_argument("--umbral", type=float, default=0.25, help="Aumento de tiempo tolerado (fracción).")
+    parser.add_argument("--arranque", action="store_true",
+                        help="Mide solo el tiempo de importación de la interfaz y la CLI.")
+    args = parser.parse_args(argv)
+
+    if args.arranque:
+        datos = ejecutar_arranque(args.repeticiones)
+        fallo = False
+        for r in datos["resultados"]:
+            if "error" in r:
+                print(f"{r['caso']:<12} no se pudo importar: {r['error']}")
+                continue
+            print(f"{r['caso']:<12} {r['tiempo_s'] * 1e3:>9.1f} ms   pesados: {', '.join(r['pesados']) or '-'}")
+            if r["pesados"]:
+                print(f"ERROR: {r['caso']} carga {', '.join(r['pesados'])} al importarse.")
+                fallo = True
+    else:
+        with np.errstate(all="ignore"):
+            datos = ejecutar_benchmarks(args.repeticiones, args.filtro)
+        _imprimir_tabla(datos)
+        fallo = False
+
+    for ruta in (args.salida, args.guardar_base):
+        if ruta:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(datos, archivo, indent=2, ensure_ascii=False)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(datos, base, args.umbral)
+        for caso, tipo, metodo, motivos in regresiones:
+            print(f"REGRESIÓN {caso}/{tipo}/{metodo}: {'; '.join(motivos)}")
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto a la base.")
+    return 1 if fallo else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# bucles_numba.py
+import numpy as np
+
+from compilador import compilar, compilar_numba
+from instrumentacion import medir_fase
+
+# Bucles escalares de Regula Falsi y punto fijo compilados con Numba junto con
+# la función (compilador.compilar_numba), de modo que ninguna iteración vuelve a
+# pasar por el intérprete. Numba se importa y los bucles se compilan la primera
+# vez que se usan; sin Numba se recurre a las versiones de metodo y punto_fijo.
+# Cada función distinta especializa el bucle, así que la primera llamada con una
+# expresión nueva incluye la compilación.
+
+_bucles = {}
+
+
+def _compilar_bucles():
+    """Compila (una sola vez) los bucles con numba.njit y los devuelve."""
+    if _bucles:
+        return _bucles
+    import numba
+
+    eps = np.finfo(float).eps
+
+    @numba.njit(error_model="numpy")
+    def regula_falsi(f, a, b, tol, max_iter, use_tol):
+        # Mismas filas y criterios que metodo.interpolacion_lineal_iter; el
+        # aviso de denominador nulo se devuelve como bandera para imprimirlo fuera
+        filas = np.empty((max(max_iter, 1), 6))
+        fa = f(a)
+        fb = f(b)
+
+        if a == b and fa == 0:
+            filas[0, 0], filas[0, 1], filas[0, 2] = 1, a, b
+            filas[0, 3], filas[0, 4], filas[0, 5] = a, fa, 0.0
+            return filas[:1], False
+
+        xr_old = a
+        n = 0
+        for i in range(1, max_iter + 1):
+            if abs(fa - fb) < eps:
+                return filas[:n], True
+
+            xr = b - fb * (a - b) / (fa - fb)
+            fr = f(xr)
+            if xr != 0:
+                error = abs((xr - xr_old) / xr)
+            else:
+                error = abs(xr - xr_old)
+
+            filas[n, 0], filas[n, 1], filas[n, 2] = i, a, b
+            filas[n, 3], filas[n, 4], filas[n, 5] = xr, fr, error
+            n += 1
+
+            if abs(fr) < eps:
+                break
+            if use_tol and error < tol:
+                break
+
+            if fa * fr < 0:
+                b, fb = xr, fr
+            else:
+                a, fa = xr, fr
+            xr_old = xr
+        return filas[:n], False
+
+    @numba.njit(error_model="numpy")
+    def punto_fijo(g, x0, tol, max_iter, use_aitken):
+        # Mismas filas y escalera que punto_fijo.punto_fijo_iter
+        filas = np.empty((max(max_iter, 1), 3))
+        x_vals = np.empty(2 * max_iter + 1)
+        x_vals[0] = x0
+        n, m = 0, 1
+
+        x_i = x0
+        for i in range(1, max_iter + 1):
+            if not use_aitken:
+                x_nuevo = g(x_i)
+                x_vals[m] = x_nuevo
+                m += 1
+            else:
+                x_i_1 = g(x_i)
+                x_i_2 = g(x_i_1)
+                x_vals[m], x_vals[m + 1] = x_i_1, x_i_2
+                m += 2
+
+                denominador = (x_i_2 - x_i_1) - (x_i_1 - x_i)
+                if abs(denominador) < 1e-12:
+                    return filas[:n], x_vals[:m], True
+                x_nuevo = x_i - ((x_i_1 - x_i) ** 2) / denominador
+
+            error = abs(x_nuevo - x_i)
+            filas[n, 0], filas[n, 1], filas[n, 2] = i, x_nuevo, error
+            n += 1
+            if error < tol:
+                break
+            x_i = x_nuevo
+        return filas[:n], x_vals[:m], False
+
+    _bucles.update(regula_falsi=regula_falsi, punto_fijo=punto_fijo)
+    return _bucles
+
+
+@medir_fase("resolver")
+def interpolacion_lineal_numba(fx_str, a, b, tol, max_iter, use_tol):
+    """
+    Regula Falsi con la función y el bucle compilados con Numba.
+
+    Los argumentos son los de metodo.interpolacion_lineal, salvo que la función
+    se recibe como texto. Si Numba no está disponible o no puede compilar la
+    expresión, se usa metodo.interpolacion_lineal con el backend math.
+
+    Returns:
+        list: Filas (i, a, b, xr, fr, error), iguales a las de interpolacion_lineal.
+    """
+    f = compilar_numba(fx_str)
+    if f is None:
+        from metodo import interpolacion_lineal
+        return interpolacion_lineal(compilar(fx_str, "math")[1], a, b, tol, max_iter, use_tol)
+
+    filas, denominador_nulo = _compilar_bucles()["regula_falsi"](f, float(a), float(b), float(tol),
+                                                                 int(max_iter), bool(use_tol))
+    if denominador_nulo:
+        print("Advertencia: f(a) y f(b) son muy similares, el método puede fallar.")
+    return [(int(i), *fila) for i, *fila in filas.tolist()]
+
+
+@medir_fase("resolver")
+def punto_fijo_numba(g_str, x0, tol, max_iter, use_aitken):
+    """
+    Iteración de punto fijo con g y el bucle compilados con Numba.
+
+    Los argumentos son los de punto_fijo.punto_fijo_iter, salvo que g se recibe
+    como texto. Si Numba no está disponible o no puede compilar g, se itera con
+    punto_fijo_iter y el backend math.
+
+    Returns:
+        tuple: (resultados, x_vals_iter), con las mismas filas (i, x_n, error)
+               y la misma escalera que punto_fijo.punto_fijo.
+    """
+    g = compilar_numba(g_str)
+    if g is None:
+        from punto_fijo import punto_fijo_iter
+        x_vals_iter = []
+        resultados = list(punto_fijo_iter(compilar(g_str, "math")[1], x0, tol, max_iter, use_aitken,
+                                          x_vals_iter))
+        return resultados, x_vals_iter
+
+    filas, x_vals, denominador_nulo = _compilar_bucles()["punto_fijo"](g, float(x0), float(tol), int(max_iter),
+                                                                       bool(use_aitken))
+    if denominador_nulo:
+        print("El denominador de Aitken es cero. Deteniendo.")
+    return [(int(i), x_n, error) for i, x_n, error in filas.tolist()], x_vals.tolist()
@@ -0,0 +1,105 @@
+# cache_evaluaciones.py
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CacheEvaluaciones:
+    """
+    Memoriza los valores de f(x) durante una ejecución, con x como clave exacta.
+
+    Se crea una por ejecución y se pasa como función compilada al escaneo, a
+    los métodos y a las gráficas, de modo que un punto ya evaluado (extremos
+    de los intervalos, iterados que la gráfica vuelve a pedir) no se evalúa
+    de nuevo. Las llamadas con escalares y con arreglos pequeños consultan la
+    caché punto a punto; los arreglos grandes (mallas) se evalúan de una vez
+    y de ellos solo se guardan los puntos vecinos a un cambio de signo, que
+    son los extremos de intervalo que después piden los métodos. Al superar
+    `tam_max` se descartan las entradas más antiguas.
+
+    Args:
+        f (callable): Función compilada para arreglos.
+        f_escalar (callable): Función para puntos sueltos (por defecto, f).
+        f_malla (callable): Función para arreglos grandes (por defecto, f).
+        tam_max (int): Número máximo de puntos guardados.
+        max_consulta (int): Tamaño máximo de arreglo que se consulta punto a punto.
+    """
+
+    def __init__(self, f, f_escalar=None, f_malla=None, tam_max=65536, max_consulta=1024):
+        if tam_max < 1:
+            raise ValueError("El tamaño de la caché debe ser positivo.")
+        self.f = f
+        self.f_escalar = f_escalar if f_escalar is not None else f
+        self.f_malla = f_malla if f_malla is not None else f
+        self.tam_max = tam_max
+        self.max_consulta = max_consulta
+        self._valores = OrderedDict()
+        self.evaluaciones = 0
+        self.ahorradas = 0
+
+    def __call__(self, x):
+        if isinstance(x, float) or np.ndim(x) == 0:
+            return self._escalar(x)
+        return self._arreglo(np.asarray(x, dtype=float))
+
+    def __len__(self):
+        return len(self._valores)
+
+    def _escalar(self, x):
+        clave = float(x)
+        valor = self._valores.get(clave)
+        if valor is not None:
+            self.ahorradas += 1
+            return valor
+        # Si f lanza una excepción el punto no se guarda y el error llega al llamador
+        valor = self.f_escalar(x)
+        self.evaluaciones += 1
+        self._guardar([clave], [valor])
+        return valor
+
+    def _arreglo(self, x):
+        if x.size > self.max_consulta:
+            y = self.f_malla(x)
+            self.evaluaciones += x.size
+            # Guardar la malla entera cuesta más que evaluarla
+            xs, ys = x.ravel(), np.broadcast_to(y, x.shape).ravel()
+            with np.errstate(invalid="ignore"):
+                signos = np.sign(ys)
+                cambio = np.flatnonzero(np.isfinite(ys[:-1]) & np.isfinite(ys[1:]) & (signos[:-1] * signos[1:] <= 0))
+            indices = np.union1d(cambio, cambio + 1)
+            self._guardar(xs[indices].tolist(), ys[indices].tolist())
+            return y
+
+        claves = x.ravel().tolist()
+        y = np.empty(len(claves))
+        faltan = []
+        for i, clave in enumerate(claves):
+            valor = self._valores.get(clave)
+            if valor is None:
+                faltan.append(i)
+            else:
+                y[i] = valor
+
+        if faltan:
+            indices = np.array(faltan)
+            nuevos = np.broadcast_to(self.f(x.ravel()[indices]), indices.shape)
+            y[indices] = nuevos
+            self.evaluaciones += len(faltan)
+            self._guardar([claves[i] for i in faltan], nuevos.tolist())
+        self.ahorradas += len(claves) - len(faltan)
+        return y.reshape(x.shape)
+
+    def _guardar(self, claves, valores):
+        self._valores.update(zip(claves, valores))
+        while len(self._valores) > self.tam_max:
+            self._valores.popitem(last=False)
+
+    def resumen(self):
+        """Devuelve evaluaciones reales, evaluaciones ahorradas y puntos guardados."""
+        return {"evaluaciones": self.evaluaciones, "ahorradas": self.ahorradas, "puntos": len(self._valores)}
+
+    def texto_resumen(self):
+        """Resumen de una línea, pensado para la barra de estado."""
+        total = self.evaluaciones + self.ahorradas
+        porcentaje = 100 * self.ahorradas / total if total else 0.0
+        return f"Caché: {self.evaluaciones} puntos evaluados, {self.ahorradas} ahorrados ({porcentaje:.0f}%)."
@@ -0,0 +1,319 @@
+"""
+Punto de entrada de línea de comandos, sin Tk ni matplotlib.
+
+Lee un lote de trabajos desde CSV, JSON o JSONL y escribe un resultado por
+trabajo en formato JSONL (a stdout o a un archivo), a medida que terminan.
+
+Campos de cada trabajo:
+    id         Identificador opcional (por defecto, el número de línea).
+    expr       f(x) para "interpolacion" (y para verificación en "punto_fijo").
+    metodo     "interpolacion" (Regula Falsi), "punto_fijo", "sistema_newton" o
+               "sistema_punto_fijo".
+    a, b       Intervalo de búsqueda (interpolacion).
+    delta      Paso de la búsqueda de intervalos (interpolacion, por defecto 0.5).
+    g          g(x) (punto_fijo).
+    x0         Valor inicial (punto_fijo). En los sistemas, un punto [x, y, ...]
+               o una lista de puntos; en CSV, componentes separadas por ";".
+    aitken     Usar aceleración de Aitken (punto_fijo, por defecto false).
+    ecuaciones Componentes de F (sistema_newton) o de G (sistema_punto_fijo),
+               como lista o separadas por ";".
+    variables  Nombres de las variables del sistema, en orden (opcional).
+    aceleracion  "aitken" o "anderson" (sistema_punto_fijo, opcional).
+    tol        Tolerancia (por defecto 1e-8).
+    max_iter   Número máximo de iteraciones (por defecto 100).
+    backend    Backend de evaluación: numpy, math, numexpr o numba (por
+               defecto, el de --backend). Si no está disponible se usa numpy.
+    polinomio  Si f(x) es un polinomio, calcular todas sus raíces reales en [a, b]
+               con la matriz compañera en lugar de escanear (interpolacion, por
+               defecto, el de --polinomios). Cada raíz informa su multiplicidad.
+    precision  Dígitos de mpmath para el modo de alta precisión (interpolacion y
+               punto_fijo; por defecto, el de --precision, o desactivado). Se
+               itera en float64 y, solo si se estanca, la raíz se pule con
+               mpmath; se informa en "raiz_mp" como texto.
+    verificar  Con precision, buscar un encierro certificado con aritmética de
+               intervalos ("encierro", como texto; por defecto, --verificar).
+    almacen    Base SQLite de resultados (por defecto, la de --almacen). Con
+               ella, las búsquedas y raíces ya calculadas no se recalculan y
+               los intervalos con una raíz previa arrancan acotados (interpolacion).
+
+Uso:
+    python cli.py trabajos.csv --salida resultados.jsonl --procesos 4
+    python cli.py trabajos.jsonl --backend numexpr
+    python cli.py trabajos.csv --almacen resultados.sqlite
+    python cli.py trabajos.csv --polinomios
+    python cli.py trabajos.csv --precision 50 --verificar
+"""
+import argparse
+import contextlib
+import csv
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from alta_precision import refinar_interpolacion, refinar_punto_fijo
+from almacen_resultados import AlmacenResultados
+from cache_evaluaciones import CacheEvaluaciones
+from compilador import BACKENDS, compilar, compilar_derivada
+from metodo import interpolacion_lineal_lotes
+from polinomios import coeficientes_polinomio, resolver_polinomio
+from punto_fijo import CONVERGIO, punto_fijo
+from sistemas import newton_sistema, punto_fijo_sistema
+from validador_intervalos import buscar_intervalos
+
+METODOS = ("interpolacion", "punto_fijo", "sistema_newton", "sistema_punto_fijo")
+
+# Misma descripción de método que usa la interfaz para Regula Falsi sin modificación, de modo
+# que ambas comparten las raíces guardadas
+METODO_ALMACEN = "Interpolación Lineal|None|True|{max_iter}"
+
+
+def leer_trabajos(ruta):
+    """
+    Lee los trabajos de un archivo CSV, JSON (lista de objetos) o JSONL.
+
+    Con ruta "-" se lee JSONL desde stdin.
+    """
+    if ruta == "-":
+        return [json.loads(linea) for linea in sys.stdin if linea.strip()]
+
+    extension = os.path.splitext(ruta)[1].lower()
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        if extension == ".csv":
+            return [{k: v for k, v in fila.items() if v not in (None, "")} for fila in csv.DictReader(archivo)]
+        if extension == ".json":
+            return json.load(archivo)
+        if extension == ".jsonl":
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+    raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+
+def _booleano(valor):
+    if isinstance(valor, str):
+        return valor.strip().lower() in ("1", "true", "si", "sí", "yes")
+    return bool(valor)
+
+
+def _numero(valor):
+    # Los valores no finitos no son JSON válido
+    valor = float(valor)
+    return valor if math.isfinite(valor) else None
+
+
+def _lista(valor):
+    # Las celdas de CSV traen las componentes como "1; 2"
+    if isinstance(valor, str):
+        return [v.strip() for v in valor.split(";") if v.strip()]
+    return valor
+
+
+def _precision(salida, raiz, encierro, dps):
+    # Los valores de mpmath se escriben como texto para no perder dígitos
+    import mpmath
+    salida["raiz_mp"] = None if raiz is None else mpmath.nstr(raiz, dps)
+    if encierro is not None:
+        salida["encierro"] = [mpmath.nstr(v, dps) for v in encierro]
+
+
+def resolver_trabajo(trabajo):
+    """
+    Resuelve un trabajo y devuelve un diccionario serializable como JSON.
+
+    Los errores de parámetros o de la función se informan en el campo "error"
+    en lugar de detener el lote.
+    """
+    # El estado de errores de NumPy no se hereda en los procesos del lote: se fija aquí.
+    # Los avisos que los métodos imprimen van a stderr para no mezclarse con el JSONL.
+    with np.errstate(all="ignore"), contextlib.redirect_stdout(sys.stderr):
+        return _resolver_trabajo(trabajo)
+
+
+def _colapsar_nodos(intervalos, fa, fb):
+    # Una raíz exacta en un nodo de la malla cierra un intervalo y abre el siguiente.
+    # Regula Falsi devuelve ese nodo en ambos, así que se reemplazan por el
+    # intervalo degenerado [z, z] y la raíz se informa una sola vez.
+    ceros = np.unique(np.concatenate([intervalos[fa == 0, 0], intervalos[fb == 0, 1]]))
+    intervalos = np.concatenate([intervalos[(fa != 0) & (fb != 0)], np.column_stack([ceros, ceros])])
+    return intervalos[np.lexsort((intervalos[:, 1], intervalos[:, 0]))]
+
+
+def _resolver_trabajo(trabajo):
+    metodo = trabajo.get("metodo") or "interpolacion"
+    salida = {"id": trabajo.get("id"), "metodo": metodo}
+    try:
+        tol = float(trabajo.get("tol", 1e-8))
+        max_iter = int(trabajo.get("max_iter", 100))
+        backend = trabajo.get("backend", "numpy")
+        dps = int(trabajo["precision"]) if trabajo.get("precision") else None
+        verificar = dps is not None and _booleano(trabajo.get("verificar", False))
+
+        # Los polinomios se resuelven de una vez con la matriz compañera, sin escaneo
+        factores = None
+        if metodo == "interpolacion" and _booleano(trabajo.get("polinomio", False)):
+            factores = coeficientes_polinomio(trabajo["expr"])
+
+        if factores is not None:
+            fx_str = trabajo["expr"]
+            a, b = float(trabajo["a"]), float(trabajo["b"])
+            filas, multiplicidades = resolver_polinomio(factores, a, b, f_lambd=compilar(fx_str, backend)[1],
+                                                        df_lambd=compilar_derivada(fx_str, backend)[1])
+            raices = []
+            for filas_raiz, multiplicidad in zip(filas, multiplicidades):
+                it, _, _, xr, fr, err = filas_raiz[-1]
+                raices.append({"intervalo": [a, b], "raiz": _numero(xr), "f_raiz": _numero(fr),
+                               "error": None if err is None else _numero(err), "iteraciones": it,
+                               "multiplicidad": multiplicidad})
+            salida["raices"] = raices
+
+        elif metodo == "interpolacion":
+            fx_str = trabajo["expr"]
+            a, b = float(trabajo["a"]), float(trabajo["b"])
+            delta = float(trabajo.get("delta", 0.5))
+
+            almacen = AlmacenResultados(trabajo["almacen"]) if trabajo.get("almacen") else None
+            metodo_almacen = METODO_ALMACEN.format(max_iter=max_iter) + (f"|mp{dps}" if dps is not None else "")
+
+            # El escaneo ya evalúa los extremos de cada intervalo; la caché evita repetirlos
+            f_lambd = CacheEvaluaciones(compilar(fx_str, backend)[1])
+            intervalos = almacen.intervalos(fx_str, a, b, delta) if almacen is not None else None
+            if intervalos is None:
+                intervalos = buscar_intervalos(fx_str, a, b, delta=delta, f_lambd=f_lambd)
+                if almacen is not None:
+                    almacen.guardar_intervalos(fx_str, a, b, delta, intervalos)
+            intervalos = np.array(intervalos, dtype=float).reshape(-1, 2)
+            fa = np.broadcast_to(f_lambd(intervalos[:, 0]), intervalos[:, 0].shape)
+            fb = np.broadcast_to(f_lambd(intervalos[:, 1]), intervalos[:, 1].shape)
+            validos = fa * fb <= 0
+            intervalos = _colapsar_nodos(intervalos[validos], fa[validos], fb[validos])
+
+            finales, precisas, pendientes, inicio = {}, {}, list(range(len(intervalos))), intervalos
+            if almacen is not None:
+                servidas, pendientes, inicio = almacen.preparar_intervalos(f_lambd, fx_str, metodo_almacen, tol,
+                                                                           intervalos)
+                finales.update(servidas)
+            for k, filas in zip(pendientes, interpolacion_lineal_lotes(f_lambd, inicio[:, 0], inicio[:, 1], tol,
+                                                                        max_iter, True)):
+                if dps is not None:
+                    nuevas, raiz, encierro = refinar_interpolacion(filas, fx_str, f_lambd, tol, dps, verificar)
+                    filas = filas + nuevas
+                    precisas[k] = (raiz, encierro)
+                if almacen is not None:
+                    almacen.guardar_filas(fx_str, metodo_almacen, tol, *intervalos[k].tolist(), filas)
+                if filas:
+                    finales[k] = filas[-1]
+
+            raices = []
+            for k, (a_i, b_i) in enumerate(intervalos.tolist()):
+                if k not in finales:
+                    continue
+                it, _, _, xr, fr, err = finales[k]
+                raices.append({"intervalo": [a_i, b_i], "raiz": _numero(xr), "f_raiz": _numero(fr),
+                               "error": _numero(err), "iteraciones": it})
+                if dps is not None:
+                    _precision(raices[-1], *precisas.get(k, (None, None)), dps)
+            salida["raices"] = raices
+            salida["evaluaciones"] = f_lambd.evaluaciones
+            salida["evaluaciones_ahorradas"] = f_lambd.ahorradas
+
+        elif metodo == "punto_fijo":
+            resultados, _, _, f_lambd, _ = punto_fijo(trabajo["g"], float(trabajo["x0"]), tol, max_iter,
+                                                      _booleano(trabajo.get("aitken", False)),
+                                                      trabajo.get("expr", "0"), backend)
+            if resultados and dps is not None:
+                nuevas, raiz, encierro = refinar_punto_fijo(resultados, trabajo["g"], tol, dps, verificar)
+                resultados = resultados + nuevas
+                _precision(salida, raiz, encierro, dps)
+            if resultados:
+                it, xn, err = resultados[-1]
+                salida.update({"raiz": _numero(xn), "f_raiz": _numero(f_lambd(xn)), "error": _numero(err),
+                               "iteraciones": it, "convergio": bool(err < tol)})
+            else:
+                salida.update({"raiz": None, "iteraciones": 0, "convergio": False})
+
+        elif metodo in ("sistema_newton", "sistema_punto_fijo"):
+            ecuaciones = _lista(trabajo["ecuaciones"])
+            variables = _lista(trabajo.get("variables"))
+            # Cada punto inicial es una fila en la entrada y una columna para el solver
+            x0 = np.array(_lista(trabajo["x0"]), dtype=float)
+            puntos = x0.reshape(-1, len(ecuaciones)).T
+            if metodo == "sistema_newton":
+                X, iteraciones, estado = newton_sistema(ecuaciones, puntos, tol, max_iter, variables)
+            else:
+                X, iteraciones, estado = punto_fijo_sistema(ecuaciones, puntos, tol, max_iter,
+                                                            trabajo.get("aceleracion") or None, variables=variables)
+            salida["soluciones"] = [{"raiz": [_numero(v) for v in columna], "iteraciones": int(it),
+                                     "convergio": bool(e == CONVERGIO)}
+                                    for columna, it, e in zip(X.T, iteraciones, estado)]
+
+        else:
+            raise ValueError(f"Método desconocido: {metodo} (use uno de {', '.join(METODOS)})")
+
+    except (KeyError, ValueError, TypeError, ArithmeticError) as e:
+        salida["error"] = f"{type(e).__name__}: {e}"
+    return salida
+
+
+def ejecutar_lote(trabajos, procesos=1, backend="numpy", almacen=None, polinomios=False, precision=None,
+                  verificar=False):
+    """
+    Resuelve los trabajos y produce sus resultados en el orden de entrada.
+
+    `backend`, `almacen` (ruta de la base de resultados), `polinomios`,
+    `precision` y `verificar` se aplican a los trabajos que no indican uno propio.
+
+    Con procesos > 1 los trabajos se reparten en un ProcessPoolExecutor; cada
+    proceso compila las expresiones por su cuenta a partir del texto.
+    """
+    for i, trabajo in enumerate(trabajos, start=1):
+        trabajo.setdefault("id", i)
+        trabajo.setdefault("backend", backend)
+        trabajo.setdefault("polinomio", polinomios)
+        if precision:
+            trabajo.setdefault("precision", precision)
+        trabajo.setdefault("verificar", verificar)
+        if almacen:
+            trabajo.setdefault("almacen", almacen)
+
+    if procesos <= 1:
+        for trabajo in trabajos:
+            yield resolver_trabajo(trabajo)
+        return
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        yield from pool.map(resolver_trabajo, trabajos, chunksize=max(1, len(trabajos) // (procesos * 4)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resuelve lotes de ecuaciones sin interfaz gráfica.")
+    parser.add_argument("entrada", help="Archivo de trabajos (.csv, .json, .jsonl) o '-' para JSONL por stdin.")
+    parser.add_argument("--salida", help="Archivo JSONL de resultados (por defecto, stdout).")
+    parser.add_argument("--procesos", type=int, default=1, help="Número de procesos en paralelo.")
+    parser.add_argument("--backend", choices=BACKENDS, default="numpy",
+                        help="Backend de evaluación por defecto (con respaldo automático a numpy).")
+    parser.add_argument("--almacen", help="Base SQLite donde guardar y reutilizar resultados.")
+    parser.add_argument("--polinomios", action="store_true",
+                        help="Resolver los polinomios con la matriz compañera en lugar de escanear.")
+    parser.add_argument("--precision", type=int,
+                        help="Dígitos de mpmath para pulir las raíces que se estancan en float64.")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Con --precision, certificar encierros con aritmética de intervalos.")
+    args = parser.parse_args(argv)
+
+    trabajos = leer_trabajos(args.entrada)
+    destino = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        for resultado in ejecutar_lote(trabajos, args.procesos, args.backend, args.almacen,
+                                       args.polinomios, args.precision, args.verificar):
+            destino.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            destino.flush()
+    finally:
+        if destino is not sys.stdout:
+            destino.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
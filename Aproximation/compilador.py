@@ -0,0 +1,436 @@
+# compilador.py
+import importlib.util
+import re
+import shelve
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from instrumentacion import fase, instrumentar
+
+# SymPy se importa la primera vez que se compila una expresión, no al importar
+# este módulo, para no pagar su costo en el arranque de la interfaz.
+
+# numpy: referencia, sirve para escalares y arreglos.
+# math: funciones del módulo math, más baratas por llamada en bucles escalares.
+# numexpr: evaluación multihilo de arreglos grandes (escaneos).
+# numba: ufunc compilada con JIT, rápida tanto con escalares como con arreglos.
+# Con compilar_numba la expresión se compila además como función njit escalar,
+# para los bucles de bucles_numba.
+BACKENDS = ("numpy", "math", "numexpr", "numba")
+
+# Muestra donde cada backend se compara contra NumPy antes de usarse
+_PUNTOS_VALIDACION = np.concatenate([np.linspace(-10.0, 10.0, 41), [-1e3, -0.5, 0.0, 0.5, 1e3]])
+
+_cache = OrderedDict()
+_tam_max = 128
+_estadisticas = {"aciertos": 0, "fallos": 0, "aciertos_disco": 0, "respaldos": 0}
+_candado = threading.Lock()
+_ruta_disco = None
+
+
+def transformaciones_por_defecto():
+    """Transformaciones usadas por todos los puntos de entrada al parsear expresiones."""
+    from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
+    return standard_transformations + (implicit_multiplication_application,)
+
+
+def normalizar(expr_str):
+    """
+    Normaliza el texto de la expresión para usarlo como clave.
+
+    Solo quita los espacios que no cambian el significado: con multiplicación
+    implícita "sin x" no es lo mismo que "sinx", así que se conserva un espacio
+    entre dos nombres o números y se quitan los que rodean a los operadores.
+    """
+    texto = re.sub(r"\s+", " ", str(expr_str).strip())
+    return re.sub(r"(?<=[\w.]) (?=[^\w.])|(?<=[^\w.]) (?=[\w.])", "", texto)
+
+
+def _clave_transformaciones(transformaciones):
+    return tuple(getattr(t, "__name__", repr(t)) for t in transformaciones)
+
+
+def _guardar_lru(clave, valor):
+    with _candado:
+        _cache[clave] = valor
+        _cache.move_to_end(clave)
+        while len(_cache) > _tam_max:
+            _cache.popitem(last=False)
+
+
+def _buscar_lru(clave, contar=True):
+    # contar=False para las búsquedas internas de una compilación que ya contó su fallo
+    with _candado:
+        if clave in _cache:
+            _cache.move_to_end(clave)
+            if contar:
+                _estadisticas["aciertos"] += 1
+            return _cache[clave]
+        if contar:
+            _estadisticas["fallos"] += 1
+        return None
+
+
+def parsear(expr_str, transformaciones=None):
+    """
+    Convierte el texto de una expresión en una expresión de SymPy, usando la caché.
+
+    Args:
+        expr_str (str): La expresión como string (ej. "x**2 - 4").
+        transformaciones (tuple): Transformaciones de parse_expr (por defecto,
+            las estándar más multiplicación implícita).
+
+    Returns:
+        sympy.Expr: La expresión parseada.
+    """
+    if transformaciones is None:
+        transformaciones = transformaciones_por_defecto()
+    return _parsear(expr_str, transformaciones, contar=True)
+
+
+def _parsear(expr_str, transformaciones, contar):
+    # El texto normalizado es solo la clave; se parsea siempre el texto original
+    clave = ("expr", normalizar(expr_str), _clave_transformaciones(transformaciones))
+    expr = _buscar_lru(clave, contar)
+    if expr is not None:
+        return expr
+
+    expr = _leer_disco(clave)
+    if expr is None:
+        from sympy.parsing.sympy_parser import parse_expr
+        try:
+            with fase("parse"):
+                expr = parse_expr(str(expr_str).strip(), transformations=transformaciones)
+        except Exception as e:
+            raise ValueError(f"Error al interpretar la función: {e}")
+        _escribir_disco(clave, expr)
+
+    _guardar_lru(clave, expr)
+    return expr
+
+
+def backend_disponible(backend):
+    """Indica si el backend se puede usar (numexpr y numba son dependencias opcionales)."""
+    if backend in ("numexpr", "numba"):
+        return importlib.util.find_spec(backend) is not None
+    return backend in BACKENDS
+
+
+def backends_disponibles():
+    """Devuelve los backends utilizables en este entorno."""
+    return tuple(b for b in BACKENDS if backend_disponible(b))
+
+
+def _evaluar_puntos(f, puntos):
+    # Evaluación punto a punto; los errores de dominio cuentan como NaN
+    valores = np.empty(len(puntos))
+    with np.errstate(all="ignore"):
+        for i, x in enumerate(puntos):
+            try:
+                valores[i] = f(float(x))
+            except (ArithmeticError, ValueError, TypeError):
+                valores[i] = np.nan
+    return valores
+
+
+def concuerda(f, f_ref, puntos=None, rtol=1e-9, atol=1e-12):
+    """
+    Comprueba que f da los mismos valores que la función de referencia (NumPy).
+
+    Ambas se evalúan punto a punto y deben coincidir en qué puntos son finitos
+    y, en esos puntos, en su valor dentro de la tolerancia.
+
+    Args:
+        f, f_ref (callable): Funciones a comparar.
+        puntos (array): Puntos de prueba (por defecto, una muestra fija en [-1000, 1000]).
+        rtol, atol (float): Tolerancias relativa y absoluta.
+
+    Returns:
+        bool: True si concuerdan.
+    """
+    puntos = _PUNTOS_VALIDACION if puntos is None else np.asarray(puntos, dtype=float)
+    valores, referencia = _evaluar_puntos(f, puntos), _evaluar_puntos(f_ref, puntos)
+    finitos = np.isfinite(referencia)
+    if not np.array_equal(finitos, np.isfinite(valores)):
+        return False
+    return bool(np.allclose(valores[finitos], referencia[finitos], rtol=rtol, atol=atol))
+
+
+def _escalar_con_respaldo(f_math, f_numpy):
+    """
+    Usa la versión de math y recurre a la de NumPy para arreglos y para los
+    casos donde math lanza una excepción en vez de devolver inf o NaN.
+    """
+    def f(x):
+        try:
+            return f_math(x)
+        except (TypeError, ValueError, OverflowError):
+            return f_numpy(x)
+    return f
+
+
+def _lambdificar(x, expr, backend):
+    import sympy as sp
+    f_numpy = sp.lambdify(x, expr, "numpy")
+    if backend == "numpy":
+        return f_numpy
+    if not backend_disponible(backend):
+        return None
+    try:
+        if backend == "math":
+            f = _escalar_con_respaldo(sp.lambdify(x, expr, "math"), f_numpy)
+        elif backend == "numexpr":
+            f = sp.lambdify(x, expr, "numexpr")
+        else:
+            import numba
+            # Con la firma explícita la compilación ocurre aquí y los errores se detectan ya
+            f = numba.vectorize(["float64(float64)"])(sp.lambdify(x, expr, "math"))
+    except Exception:
+        return None
+    return f if concuerda(f, f_numpy) else None
+
+
+def compilar(expr_str, backend="numpy", transformaciones=None, simbolo="x"):
+    """
+    Parsea y compila (lambdify) una expresión de una variable, usando la caché LRU.
+
+    Si el backend pedido no está instalado, no puede compilar la expresión o
+    no concuerda con NumPy en la muestra de validación, se usa NumPy en su
+    lugar (se cuenta en estadisticas()["respaldos"]).
+
+    Args:
+        expr_str (str): La expresión como string.
+        backend (str): Uno de BACKENDS: "numpy", "math", "numexpr" o "numba".
+        transformaciones (tuple): Transformaciones de parse_expr.
+        simbolo (str): Nombre de la variable independiente.
+
+    Returns:
+        tuple: (expr, f_lambd) con la expresión de SymPy y la función compilada.
+               Con la instrumentación activa, f_lambd cuenta sus llamadas.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}")
+
+    if transformaciones is None:
+        transformaciones = transformaciones_por_defecto()
+    texto = normalizar(expr_str)
+    clave = ("func", texto, backend, _clave_transformaciones(transformaciones), simbolo)
+    compilado = _buscar_lru(clave)
+    if compilado is None:
+        import sympy as sp
+        expr = _parsear(expr_str, transformaciones, contar=False)
+        f_lambd = _compilar_con_respaldo(sp.Symbol(simbolo), expr, backend, "la función")
+
+        compilado = (expr, f_lambd)
+        _guardar_lru(clave, compilado)
+
+    expr, f_lambd = compilado
+    return expr, instrumentar(f_lambd, texto)
+
+
+def _compilar_con_respaldo(x, expr, backend, descripcion):
+    try:
+        with fase("lambdify"):
+            f = _lambdificar(x, expr, backend)
+            if f is None:
+                with _candado:
+                    _estadisticas["respaldos"] += 1
+                f = _lambdificar(x, expr, "numpy")
+    except Exception as e:
+        raise ValueError(f"Error al compilar {descripcion}: {e}")
+    return f
+
+
+def compilar_derivada(expr_str, backend="numpy", transformaciones=None, simbolo="x"):
+    """
+    Compila la derivada simbólica de una expresión de una variable, usando la caché.
+
+    Returns:
+        tuple: (dexpr, df_lambd) con la derivada y su función compilada.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend desconocido: {backend}")
+
+    if transformaciones is None:
+        transformaciones = transformaciones_por_defecto()
+    texto = normalizar(expr_str)
+    clave = ("deriv", texto, backend, _clave_transformaciones(transformaciones), simbolo)
+    compilado = _buscar_lru(clave)
+    if compilado is None:
+        import sympy as sp
+        x = sp.Symbol(simbolo)
+        dexpr = sp.diff(_parsear(expr_str, transformaciones, contar=False), x)
+        df_lambd = _compilar_con_respaldo(x, dexpr, backend, "la derivada")
+
+        compilado = (dexpr, df_lambd)
+        _guardar_lru(clave, compilado)
+
+    dexpr, df_lambd = compilado
+    return dexpr, instrumentar(df_lambd, f"d/d{simbolo}({texto})")
+
+
+def compilar_numba(expr_str, transformaciones=None, simbolo="x"):
+    """
+    Compila la expresión como función escalar de Numba (njit), para llamarla
+    desde los bucles de los métodos compilados también con Numba.
+
+    Usa la caché LRU y valida la función contra NumPy como los demás backends.
+
+    Returns:
+        callable: La función compilada, o None si numba no está instalado, no
+                  puede compilar la expresión o no concuerda con NumPy.
+    """
+    if transformaciones is None:
+        transformaciones = transformaciones_por_defecto()
+    clave = ("njit", normalizar(expr_str), _clave_transformaciones(transformaciones), simbolo)
+    compilado = _buscar_lru(clave)
+    if compilado is None:
+        import sympy as sp
+        x = sp.Symbol(simbolo)
+        expr = _parsear(expr_str, transformaciones, contar=False)
+        f = None
+        if backend_disponible("numba"):
+            import numba
+            try:
+                with fase("lambdify"):
+                    # error_model="numpy": la división por cero da inf o NaN, como en NumPy
+                    f = numba.njit("float64(float64)", error_model="numpy")(sp.lambdify(x, expr, "math"))
+            except Exception:
+                f = None
+            if f is not None and not concuerda(f, sp.lambdify(x, expr, "numpy")):
+                f = None
+        # Se guarda también el None, envuelto, para no reintentar la compilación
+        compilado = (f,)
+        _guardar_lru(clave, compilado)
+    return compilado[0]
+
+
+def _espacio_intervalos():
+    # Solo las funciones de mpmath.iv (también bajo el nombre "mpmath", que usa el
+    # código generado): una función sin versión de intervalos falla en vez de
+    # evaluarse sin cota de error. Las constantes del código pasan a intervalos exactos.
+    import types
+    import mpmath
+    from mpmath import iv
+
+    funciones = {k: getattr(iv, k) for k in dir(iv) if not k.startswith("_")}
+    funciones["mpf"] = lambda v: iv.mpf(mpmath.mpf(v))
+    return dict(funciones, mpmath=types.SimpleNamespace(**funciones))
+
+
+def compilar_mpmath(expr_str, orden=0, intervalos=False, transformaciones=None, simbolo="x"):
+    """
+    Compila una expresión (o su derivada de orden `orden`) para mpmath, usando la caché.
+
+    La precisión es la de mpmath.mp (o mpmath.iv con intervalos=True) al
+    momento de evaluar, así que el llamador la fija con mpmath.workdps.
+
+    Args:
+        expr_str (str): La expresión como string.
+        orden (int): Orden de la derivada (0 para la expresión).
+        intervalos (bool): Si es True, compila para la aritmética de intervalos
+            de mpmath.iv; las funciones sin versión de intervalos lanzan una
+            excepción al evaluar.
+        transformaciones (tuple): Transformaciones de parse_expr.
+        simbolo (str): Nombre de la variable independiente.
+
+    Returns:
+        tuple: (expr, f_mp) con la expresión (o derivada) y su función compilada.
+    """
+    if transformaciones is None:
+        transformaciones = transformaciones_por_defecto()
+    texto = normalizar(expr_str)
+    clave = ("mpmath", texto, orden, intervalos, _clave_transformaciones(transformaciones), simbolo)
+    compilado = _buscar_lru(clave)
+    if compilado is None:
+        import sympy as sp
+        from sympy.printing.pycode import MpmathPrinter
+        x = sp.Symbol(simbolo)
+        expr = _parsear(expr_str, transformaciones, contar=False)
+        if orden:
+            expr = sp.diff(expr, x, orden)
+        try:
+            with fase("lambdify"):
+                if intervalos:
+                    f_mp = sp.lambdify(x, expr, modules=[_espacio_intervalos()], printer=MpmathPrinter)
+                else:
+                    f_mp = sp.lambdify(x, expr, "mpmath")
+        except Exception as e:
+            raise ValueError(f"Error al compilar la función para mpmath: {e}")
+
+        compilado = (expr, f_mp)
+        _guardar_lru(clave, compilado)
+
+    expr, f_mp = compilado
+    nombre = f"d{orden}/d{simbolo}{orden}({texto})" if orden else texto
+    return expr, instrumentar(f_mp, f"mpmath {nombre}")
+
+
+def estadisticas():
+    """
+    Devuelve un diccionario con aciertos, fallos, tamaño actual de la caché y
+    cuántas compilaciones recurrieron a NumPy porque el backend pedido no sirvió.
+    """
+    with _candado:
+        datos = dict(_estadisticas)
+        datos["tamano"] = len(_cache)
+        datos["tamano_max"] = _tam_max
+    return datos
+
+
+def limpiar_cache():
+    """Vacía la caché en memoria y reinicia las estadísticas."""
+    with _candado:
+        _cache.clear()
+        for k in _estadisticas:
+            _estadisticas[k] = 0
+
+
+def configurar_cache(tam_max=None, ruta_disco=None):
+    """
+    Ajusta el tamaño de la caché LRU y activa la caché en disco.
+
+    La caché en disco guarda las expresiones ya parseadas (las funciones
+    compiladas no se pueden serializar), de modo que una sesión nueva evita
+    el costo de parse_expr para expresiones usadas antes.
+
+    Args:
+        tam_max (int): Número máximo de entradas en memoria.
+        ruta_disco (str): Ruta base del archivo shelve; None la desactiva.
+    """
+    global _tam_max, _ruta_disco
+    if tam_max is not None:
+        if tam_max < 1:
+            raise ValueError("El tamaño de la caché debe ser positivo.")
+        with _candado:
+            _tam_max = tam_max
+            while len(_cache) > _tam_max:
+                _cache.popitem(last=False)
+    _ruta_disco = ruta_disco
+
+
+def _leer_disco(clave):
+    if _ruta_disco is None:
+        return None
+    try:
+        with shelve.open(_ruta_disco, flag="c") as db:
+            expr = db.get(repr(clave))
+    except Exception:
+        return None
+    if expr is not None:
+        with _candado:
+            _estadisticas["aciertos_disco"] += 1
+    return expr
+
+
+def _escribir_disco(clave, expr):
+    if _ruta_disco is None:
+        return
+    try:
+        with shelve.open(_ruta_disco, flag="c") as db:
+            db[repr(clave)] = expr
+    except Exception:
+        # La caché en disco es opcional; un fallo no debe detener el cálculo
+        pass
@@ -0,0 +1,67 @@
+# ejecutor.py
+import queue
+import threading
+
+
+class TareaEnSegundoPlano:
+    """
+    Ejecuta un trabajo en un hilo aparte y entrega sus mensajes al hilo de Tk.
+
+    El trabajo recibe dos argumentos: `publicar(mensaje)`, para enviar
+    resultados parciales, y `cancelado`, un threading.Event que debe consultar
+    entre iteraciones para detenerse de forma cooperativa. La ventana sondea la
+    cola con after(), por lo que los callbacks siempre corren en el hilo de Tk.
+
+    Args:
+        ventana: Widget de Tk usado para programar el sondeo con after().
+        trabajo (callable): Función trabajo(publicar, cancelado) -> resultado.
+        al_recibir (callable): Se llama con cada mensaje publicado.
+        al_terminar (callable): Se llama con (resultado, error, cancelado) al finalizar.
+        intervalo_ms (int): Periodo de sondeo de la cola.
+        max_mensajes (int): Mensajes procesados como máximo por sondeo.
+    """
+
+    def __init__(self, ventana, trabajo, al_recibir=None, al_terminar=None, intervalo_ms=50, max_mensajes=500):
+        self.ventana = ventana
+        self.trabajo = trabajo
+        self.al_recibir = al_recibir
+        self.al_terminar = al_terminar
+        self.intervalo_ms = intervalo_ms
+        self.max_mensajes = max_mensajes
+        self.cancelado = threading.Event()
+        self._cola = queue.Queue()
+        self._hilo = None
+        self._resultado = None
+        self._error = None
+
+    def iniciar(self):
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+        self._hilo.start()
+        self.ventana.after(self.intervalo_ms, self._sondear)
+        return self
+
+    def cancelar(self):
+        self.cancelado.set()
+
+    def activa(self):
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def _correr(self):
+        try:
+            self._resultado = self.trabajo(self._cola.put, self.cancelado)
+        except Exception as e:
+            self._error = e
+
+    def _sondear(self):
+        for _ in range(self.max_mensajes):
+            try:
+                mensaje = self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if self.al_recibir is not None:
+                self.al_recibir(mensaje)
+
+        if self._hilo.is_alive() or not self._cola.empty():
+            self.ventana.after(self.intervalo_ms, self._sondear)
+        elif self.al_terminar is not None:
+            self.al_terminar(self._resultado, self._error, self.cancelado.is_set())
@@ -0,0 +1,60 @@
+# historial.py
+from collections import deque
+
+
+class Historial:
+    """
+    Contenedor de registros de iteración con una política de retención.
+
+    Permite conservar solo los últimos N registros y/o uno de cada k, de modo
+    que la memoria no crezca sin límite con max_iter grandes. El primer y el
+    último registro recibidos se conservan siempre (punto inicial y raíz final).
+
+    Args:
+        ultimos (int): Número máximo de registros a conservar (None = todos).
+        cada (int): Conserva uno de cada `cada` registros.
+    """
+
+    def __init__(self, ultimos=None, cada=1):
+        if ultimos is not None and ultimos < 1:
+            raise ValueError("El parámetro 'ultimos' debe ser positivo.")
+        if cada < 1:
+            raise ValueError("El parámetro 'cada' debe ser positivo.")
+        self.cada = cada
+        self.total = 0
+        self._guardados = deque(maxlen=ultimos)
+        self._primero = None
+        self._ultimo = None
+        self._ultimo_guardado = False
+
+    def append(self, registro):
+        if self.total == 0:
+            self._primero = registro
+        elif self.total % self.cada == 0:
+            self._guardados.append(registro)
+        self._ultimo = registro
+        self._ultimo_guardado = self.total > 0 and self.total % self.cada == 0
+        self.total += 1
+
+    def extend(self, registros):
+        for registro in registros:
+            self.append(registro)
+
+    def registros(self):
+        """Devuelve la lista de registros conservados, en orden."""
+        if self.total == 0:
+            return []
+        lista = [self._primero]
+        lista.extend(self._guardados)
+        if self.total > 1 and not self._ultimo_guardado:
+            lista.append(self._ultimo)
+        return lista
+
+    def __iter__(self):
+        return iter(self.registros())
+
+    def __len__(self):
+        return len(self.registros())
+
+    def __getitem__(self, indice):
+        return self.registros()[indice]
@@ -0,0 +1,136 @@
+# instrumentacion.py
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+# Desactivada por defecto: instrumentar() devuelve la función sin envolver y
+# fase() un contexto vacío, así que el costo es una sola comprobación.
+_activo = False
+_candado = threading.Lock()
+_local = threading.local()
+_fases = {}
+_funciones = {}
+
+
+def activar(valor=True):
+    """Activa o desactiva la instrumentación."""
+    global _activo
+    _activo = bool(valor)
+
+
+def activa():
+    return _activo
+
+
+def reiniciar():
+    """Borra los tiempos y contadores acumulados."""
+    with _candado:
+        _fases.clear()
+        _funciones.clear()
+
+
+@contextmanager
+def _fase_activa(nombre):
+    abiertas = getattr(_local, "fases", None)
+    if abiertas is None:
+        abiertas = _local.fases = set()
+    # Las fases anidadas con el mismo nombre solo cuentan una vez
+    if nombre in abiertas:
+        yield
+        return
+
+    abiertas.add(nombre)
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        transcurrido = time.perf_counter() - inicio
+        abiertas.discard(nombre)
+        with _candado:
+            datos = _fases.setdefault(nombre, {"veces": 0, "tiempo_s": 0.0})
+            datos["veces"] += 1
+            datos["tiempo_s"] += transcurrido
+
+
+def fase(nombre):
+    """
+    Contexto que mide el tiempo de una fase (parse, lambdify, escaneo, resolver, graficar).
+
+    Ejemplo:
+        with fase("escaneo"):
+            intervalos = buscar_intervalos(...)
+    """
+    if not _activo:
+        return nullcontext()
+    return _fase_activa(nombre)
+
+
+def medir_fase(nombre):
+    """Decorador equivalente a envolver el cuerpo de la función en fase(nombre)."""
+    def decorador(func):
+        @functools.wraps(func)
+        def envoltura(*args, **kwargs):
+            if not _activo:
+                return func(*args, **kwargs)
+            with _fase_activa(nombre):
+                return func(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def instrumentar(f, nombre):
+    """
+    Envuelve una función compilada para contar llamadas, puntos evaluados y tiempo.
+
+    Si la instrumentación está desactivada devuelve la misma función.
+
+    Args:
+        f (callable): Función ya compilada (por ejemplo, de lambdify).
+        nombre (str): Nombre con el que se acumulan las estadísticas.
+    """
+    if not _activo:
+        return f
+
+    @functools.wraps(f)
+    def envoltura(x):
+        inicio = time.perf_counter()
+        try:
+            return f(x)
+        finally:
+            transcurrido = time.perf_counter() - inicio
+            with _candado:
+                datos = _funciones.setdefault(nombre, {"llamadas": 0, "puntos": 0, "tiempo_s": 0.0})
+                datos["llamadas"] += 1
+                datos["puntos"] += int(np.size(x))
+                datos["tiempo_s"] += transcurrido
+
+    return envoltura
+
+
+def resumen():
+    """Devuelve un diccionario con los tiempos por fase y los contadores por función."""
+    with _candado:
+        return {
+            "fases": {k: dict(v) for k, v in _fases.items()},
+            "funciones": {k: dict(v) for k, v in _funciones.items()},
+        }
+
+
+def texto_resumen():
+    """Resumen de una línea, pensado para la barra de estado."""
+    datos = resumen()
+    partes = [f"{nombre}: {v['tiempo_s'] * 1e3:.1f} ms" for nombre, v in datos["fases"].items()]
+    llamadas = sum(v["llamadas"] for v in datos["funciones"].values())
+    puntos = sum(v["puntos"] for v in datos["funciones"].values())
+    partes.append(f"evaluaciones: {llamadas} llamadas / {puntos} puntos")
+    return " | ".join(partes)
+
+
+def exportar_json(ruta):
+    """Escribe el resumen en un archivo JSON."""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resumen(), archivo, indent=2, ensure_ascii=False)
@@ -1,16 +1,48 @@
+import os
 import tkinter as tk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-from tkinter import ttk, messagebox
-import sympy as sp
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-
-from metodo import interpolacion_lineal
-from graficador import graficar_funcion
-from validador_intervalos import buscar_intervalos as buscar_intervalos
-from punto_fijo import punto_fijo
-from graficador_punto_fijo import graficar_punto_fijo
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
+
+from compilador import compilar, compilar_derivada, parsear
+from metodo import interpolacion_lineal_lotes_iter
+from paralelo import interpolacion_lineal_paralela_iter
+from metodos_rapidos import brent, newton, secante, steffensen
+from validador_intervalos import buscar_intervalos as buscar_intervalos, buscar_intervalos_adaptativo
+from punto_fijo import compilar_punto_fijo, punto_fijo_iter
+from historial import Historial
+from cache_evaluaciones import CacheEvaluaciones
+from almacen_resultados import AlmacenResultados
+from polinomios import coeficientes_polinomio, describir_raices, resolver_polinomio
+from alta_precision import DPS_POR_DEFECTO, refinar_interpolacion, refinar_punto_fijo
+from ejecutor import TareaEnSegundoPlano
+from tabla_resultados import TablaVirtual
+import instrumentacion
+from lienzo import LienzoGrafico, VistaPreviaLatex
+
+
+MODIFICACIONES = {"Ninguna": None, "Illinois": "illinois", "Anderson-Björck": "anderson-bjorck"}
+
+# Métodos que comparten los intervalos de buscar_intervalos y el formato de filas de Regula Falsi
+METODOS_RAPIDOS = {"Brent": brent, "Newton": newton, "Secante": secante, "Steffensen": steffensen}
+
+# Política de retención de filas/puntos por ejecución y tamaño de los bloques de filas enviados a la tabla
+POLITICA_HISTORIAL = {"ultimos": 5000, "cada": 1}
+FILAS_POR_REFRESCO = 200
+
+# Backend de evaluación por uso: (escaneo de la malla, Regula Falsi por lotes, bucles escalares).
+# Los que no estén instalados o no concuerden con NumPy recurren a NumPy al compilar.
+BACKENDS_EVALUACION = {
+    "Automático": ("numexpr", "numpy", "math"),
+    "NumPy": ("numpy", "numpy", "numpy"),
+    "math": ("numpy", "numpy", "math"),
+    "numexpr": ("numexpr", "numexpr", "numexpr"),
+    "Numba": ("numba", "numba", "numba"),
+}
+
+# Resultados guardados entre sesiones
+RUTA_ALMACEN = os.path.join(os.path.expanduser("~"), ".aproximacion", "resultados.sqlite")
 
 
 def lanzar_interfaz():
@@ -18,44 +50,38 @@ def lanzar_interfaz():
         metodo = combo_metodo.get()
 
         # Ocultar todos los campos específicos primero
-        for widget in campos_interpolacion + campos_punto_fijo:
+        for widget in campos_interpolacion + campos_regula_falsi + campos_punto_fijo + campos_precision:
             widget.grid_remove()
+        if metodo in ("Interpolación Lineal", "Punto Fijo"):
+            for widget in campos_precision:
+                widget.grid()
 
         # Mostrar campos según el método seleccionado
-        if metodo == "Interpolación Lineal":
-            for widget in campos_interpolacion:
+        if metodo == "Interpolación Lineal" or metodo in METODOS_RAPIDOS:
+            for widget in campos_interpolacion + (campos_regula_falsi if metodo == "Interpolación Lineal" else []):
                 widget.grid()
             # Actualizar columnas de la tabla
-            configurar_tabla(["Iter", "a", "b", "xr", "f(xr)", "Error"])
+            tabla.configurar(["Iter", "a", "b", "xr", "f(xr)", "Error"], ["d", ".6f", ".6f", ".6f", ".2e", ".2e"])
         elif metodo == "Punto Fijo":
             for widget in campos_punto_fijo:
                 widget.grid()
             # Actualizar columnas de la tabla
-            configurar_tabla(["Iter", "x_n", "Error"])
-
-    def configurar_tabla(columnas):
-        tabla['columns'] = columnas
-        for col in columnas:
-            tabla.heading(col, text=col)
-            tabla.column(col, anchor="center", width=100)
+            tabla.configurar(["Iter", "x_n", "Error"], ["d", ".8f", ".8f"])
 
     def validar_ecuacion():
         fx_str = entrada_funcion.get()
         try:
-            f = sp.sympify(fx_str)
-            latex_str = sp.latex(f)
-            fig, ax = plt.subplots(figsize=(3.5, 0.8))
-            ax.axis("off")
-            ax.text(0.5, 0.5, f"${latex_str}$", fontsize=18, ha="center", va="center")
-            for widget in frame_preview.winfo_children(): widget.destroy()
-            canvas = FigureCanvasTkAgg(fig, master=frame_preview)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
-            plt.close(fig)
+            # SymPy y matplotlib se cargan en la primera vista previa, no al arrancar
+            import sympy as sp
+
+            vista_previa.mostrar(sp.latex(parsear(fx_str)))
         except Exception as e:
-            for widget in frame_preview.winfo_children(): widget.destroy()
-            lbl_error_preview = tk.Label(frame_preview, text=f"Error: {e}", fg="red")
-            lbl_error_preview.pack()
+            vista_previa.mostrar(f"Error: {e}", error=True)
+
+    def mostrar_grafica(graficar, *args):
+        # Dibuja en el lienzo embebido y cambia a su pestaña
+        pestanas.select(frame_grafica)
+        graficar(*args)
 
     # ---- Popup selección de intervalos ----
     def seleccionar_intervalos_multi(intervalos):
@@ -81,7 +107,61 @@ def lanzar_interfaz():
         popup.wait_window()
         return seleccion["valores"]
 
+    def mostrar_encierros(encierros):
+        # encierros: pares (etiqueta, (lo, hi)) certificados con aritmética de intervalos
+        if encierros:
+            import mpmath
+            lineas = [f"{etiqueta}: [{mpmath.nstr(lo, 20)}, {mpmath.nstr(hi, 20)}]" for etiqueta, (lo, hi) in encierros]
+            messagebox.showinfo("Encierros verificados", "\n".join(lineas))
+
     # ---- Ejecución del método ----
+    tarea_actual = {"tarea": None}
+
+    def aplicar_filtro(event=None):
+        seleccion = combo_filtro.get()
+        grupo = None if seleccion in ("", "Todos") else int(seleccion) - 1
+        tabla.filtrar(grupo, var_finales.get() == 1)
+
+    def actualizar_filtros():
+        combo_filtro.config(values=["Todos"] + [str(g + 1) for g in tabla.grupos()])
+
+    def iniciar_tarea(trabajo, al_recibir, al_terminar, mensaje, nombre_fase):
+        def trabajo_medido(publicar, cancelado):
+            with instrumentacion.fase(nombre_fase):
+                return trabajo(publicar, cancelado)
+
+        def terminar(resultado, error, cancelado):
+            tarea_actual["tarea"] = None
+            boton_ejecutar.config(state="normal")
+            boton_cancelar.config(state="disabled")
+            if cancelado:
+                lbl_estado.config(text="Operación cancelada.")
+            elif error is not None:
+                lbl_estado.config(text="")
+                if isinstance(error, ValueError):
+                    messagebox.showerror("Error en parámetros", str(error))
+                else:
+                    messagebox.showerror("Error inesperado", str(error))
+            else:
+                lbl_estado.config(text="")
+            al_terminar(resultado, error, cancelado)
+            if instrumentacion.activa():
+                lbl_estado.config(text=f"{lbl_estado.cget('text')} | {instrumentacion.texto_resumen()}")
+
+        boton_ejecutar.config(state="disabled")
+        boton_cancelar.config(state="normal")
+        lbl_estado.config(text=mensaje)
+        tarea_actual["tarea"] = TareaEnSegundoPlano(ventana, trabajo_medido, al_recibir, terminar).iniciar()
+
+    def exportar_perfil():
+        ruta = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if ruta:
+            instrumentacion.exportar_json(ruta)
+
+    def cancelar():
+        if tarea_actual["tarea"] is not None:
+            tarea_actual["tarea"].cancelar()
+
     def ejecutar():
         metodo = combo_metodo.get()
         fx_str = entrada_funcion.get()
@@ -89,59 +169,279 @@ def lanzar_interfaz():
             max_iter = int(entrada_iter.get())
             tol = float(entrada_tol.get())
 
-            # Limpiar tabla
-            for row in tabla.get_children(): tabla.delete(row)
-
-            if metodo == "Interpolación Lineal":
+            # La instrumentación se activa antes de compilar para envolver las funciones
+            instrumentacion.activar(var_perfil.get() == 1)
+            instrumentacion.reiniciar()
+
+            # Limpiar tabla (solo se vacía el almacén; el widget se reutiliza)
+            tabla.limpiar()
+            combo_filtro.set("Todos")
+            var_finales.set(0)
+
+            backend_escaneo, backend_lotes, backend_escalar = BACKENDS_EVALUACION[combo_backend.get()]
+            almacen = AlmacenResultados(RUTA_ALMACEN) if var_almacen.get() == 1 else None
+            # Alta precisión: float64 y, solo si se estanca, pulido final con mpmath
+            dps = int(entrada_dps.get()) if var_precision.get() == 1 else None
+            if dps is not None and dps < 16:
+                raise ValueError("La precisión debe ser de al menos 16 dígitos.")
+            verificar = dps is not None and var_verificar.get() == 1
+            sufijo_precision = f"|mp{dps}" if dps is not None else ""
+
+            if metodo == "Interpolación Lineal" or metodo in METODOS_RAPIDOS:
                 a = float(entrada_a.get())
                 b = float(entrada_b.get())
                 delta = float(entrada_delta.get())
                 use_tol = var_condicion.get() == 1
-
-                x = sp.Symbol('x')
-                f_expr = sp.sympify(fx_str)
-                f_lambd = sp.lambdify(x, f_expr, "numpy")
-
-                intervalos = buscar_intervalos(fx_str, a, b, delta=delta)
-                if not intervalos: messagebox.showerror("Error", "No se encontraron raíces en el intervalo."); return
-
-                seleccionados = seleccionar_intervalos_multi(intervalos) if len(intervalos) > 1 else intervalos
-                if seleccionados is None or not seleccionados: messagebox.showinfo("Info",
-                                                                                   "Operación cancelada."); return
-
-                resultados_totales = []
-                for a_i, b_i in seleccionados:
-                    if f_lambd(a_i) * f_lambd(b_i) > 0: continue
-                    resultados = interpolacion_lineal(f_lambd, a_i, b_i, tol, max_iter, use_tol)
-                    resultados_totales.extend(resultados)
-                    for it, a_, b_, xr, fr, err in resultados:
-                        tabla.insert("", "end", values=(it, f"{a_:.6f}", f"{b_:.6f}", f"{xr:.6f}", f"{fr:.2e}",
-                                                        f"{err:.2e}" if err is not None else "-"))
-
-                if not resultados_totales: messagebox.showwarning("Sin resultados",
-                                                                  "Ningún intervalo seleccionado era válido."); return
-
-                boton_graficar.config(command=lambda: graficar_funcion(f_lambd, resultados_totales, str(f_expr), a, b))
+                modificacion = MODIFICACIONES[combo_modificacion.get()]
+                usar_paralelo = var_paralelo.get() == 1
+                usar_adaptativo = var_adaptativo.get() == 1
+
+                f_expr, f_lotes = compilar(fx_str, backend_lotes)
+                # Una caché por ejecución: el escaneo, los métodos y la gráfica comparten los puntos ya evaluados
+                f_lambd = CacheEvaluaciones(f_lotes, compilar(fx_str, backend_escalar)[1],
+                                            compilar(fx_str, backend_escaneo)[1])
+                extra = {"df_lambd": compilar_derivada(fx_str, backend_escalar)[1]} if metodo == "Newton" else {}
+
+                # Los polinomios se resuelven de una vez con la matriz compañera, sin escaneo ni selección
+                factores = None
+                if metodo == "Interpolación Lineal" and var_polinomio.get() == 1:
+                    factores = coeficientes_polinomio(fx_str)
+
+                def resolver_polinomio_tarea():
+                    resultados_totales = []
+                    df_lambd = compilar_derivada(fx_str, backend_escalar)[1]
+
+                    def trabajo(publicar, cancelado):
+                        filas, multiplicidades = resolver_polinomio(factores, a, b, f_lambd=f_lambd,
+                                                                    df_lambd=df_lambd)
+                        for k, filas_raiz in enumerate(filas):
+                            publicar((k, filas_raiz))
+                        return multiplicidades
+
+                    def al_recibir(mensaje):
+                        k, filas_raiz = mensaje
+                        resultados_totales.extend(filas_raiz)
+                        tabla.agregar(filas_raiz, k)
+
+                    def al_terminar(multiplicidades, error, cancelado):
+                        actualizar_filtros()
+                        if error is not None or cancelado: return
+                        if not multiplicidades: messagebox.showerror("Error", "No se encontraron raíces en el intervalo."); return
+                        lbl_estado.config(text=f"Polinomio: {describir_raices(multiplicidades)} en [{a}, {b}].")
+                        boton_graficar.config(
+                            command=lambda: mostrar_grafica(lienzo.graficar_funcion, f_lambd, resultados_totales,
+                                                         str(f_expr), a, b))
+
+                    iniciar_tarea(trabajo, al_recibir, al_terminar, "Resolviendo polinomio...", "resolver")
+
+                # Fase 1: búsqueda de intervalos en segundo plano (o los de una búsqueda idéntica guardada)
+                escaneo = "adaptativo" if usar_adaptativo else "uniforme"
+
+                def buscar(publicar, cancelado):
+                    if almacen is not None:
+                        guardados = almacen.intervalos(fx_str, a, b, delta, escaneo)
+                        if guardados is not None:
+                            return guardados
+                    if usar_adaptativo:
+                        # Las raíces tangentes (sin cambio de signo) viajan como intervalos degenerados (t, t)
+                        intervalos, tangentes = buscar_intervalos_adaptativo(fx_str, a, b, delta=delta,
+                                                                             devolver_tangentes=True,
+                                                                             f_lambd=f_lambd,
+                                                                             backend=backend_escaneo)
+                        intervalos = sorted(intervalos + [(t, t) for t in tangentes])
+                    else:
+                        intervalos = buscar_intervalos(fx_str, a, b, delta=delta, f_lambd=f_lambd)
+                    if almacen is not None:
+                        almacen.guardar_intervalos(fx_str, a, b, delta, intervalos, escaneo)
+                    return intervalos
+
+                def al_encontrar(intervalos, error, cancelado):
+                    if error is not None or cancelado: return
+                    # Los degenerados con f = 0 son raíces exactas y se resuelven como los demás
+                    tangentes = [x0 for x0, x1 in intervalos if x0 == x1 and f_lambd(x0) != 0]
+                    intervalos = [par for par in intervalos if par[0] != par[1] or par[0] not in tangentes]
+                    if tangentes:
+                        lineas = [f"x ≈ {t:.10g}   f(x) = {float(f_lambd(t)):.3e}" for t in tangentes]
+                        messagebox.showinfo("Raíces tangentes",
+                                            "Raíces sin cambio de signo (no se pueden acotar para el método):\n"
+                                            + "\n".join(lineas))
+                        if not intervalos: return
+                    if not intervalos: messagebox.showerror("Error", "No se encontraron raíces en el intervalo."); return
+
+                    seleccionados = seleccionar_intervalos_multi(intervalos) if len(intervalos) > 1 else intervalos
+                    if seleccionados is None or not seleccionados: messagebox.showinfo("Info",
+                                                                                       "Operación cancelada."); return
+
+                    extremos = np.array(seleccionados, dtype=float)
+                    with np.errstate(all="ignore"):
+                        validos = np.broadcast_to(f_lambd(extremos[:, 0]) * f_lambd(extremos[:, 1]) <= 0,
+                                                  extremos[:, 0].shape)
+                    extremos = extremos[validos]
+                    resolver(extremos)
+
+                # Fase 2: Regula Falsi por lotes; cada intervalo se publica en cuanto termina
+                def resolver(extremos):
+                    resultados_totales = []
+                    total = len(extremos)
+                    clave_metodo = f"{metodo}|{modificacion}|{use_tol}|{max_iter}{sufijo_precision}"
+                    pulidas, encierros = [], []
+
+                    def trabajo(publicar, cancelado):
+                        # Los intervalos ya resueltos con estos parámetros muestran la fila final guardada
+                        pendientes, inicio = list(range(total)), extremos
+                        if almacen is not None:
+                            servidas, pendientes, inicio = almacen.preparar_intervalos(f_lambd, fx_str, clave_metodo,
+                                                                                        tol, extremos)
+                            for k, fila in servidas:
+                                publicar((k, [fila]))
+
+                        def entregar(j, resultados):
+                            k = pendientes[j]
+                            if dps is not None and metodo == "Interpolación Lineal":
+                                nuevas, raiz, encierro = refinar_interpolacion(resultados, fx_str, f_lambd, tol, dps,
+                                                                              verificar)
+                                resultados = resultados + nuevas
+                                if raiz is not None:
+                                    pulidas.append(k)
+                                if encierro is not None:
+                                    encierros.append((k, encierro))
+                            if almacen is not None:
+                                almacen.guardar_filas(fx_str, clave_metodo, tol, *extremos[k].tolist(), resultados)
+                            publicar((k, resultados))
+
+                        if metodo in METODOS_RAPIDOS:
+                            # Devuelve el total de evaluaciones de f para comparar el costo por raíz
+                            evaluaciones = 0
+                            for j, (a_i, b_i) in enumerate(inicio.tolist()):
+                                if cancelado.is_set():
+                                    break
+                                resultados, ev = METODOS_RAPIDOS[metodo](f_lambd, a_i, b_i, tol, max_iter,
+                                                                         use_tol, **extra)
+                                evaluaciones += ev
+                                entregar(j, resultados)
+                            return evaluaciones
+                        if not pendientes:
+                            return
+                        if usar_paralelo:
+                            # Cada bloque se entrega al terminar; al cancelar se descartan los que no terminaron
+                            for j, resultados in interpolacion_lineal_paralela_iter(
+                                    fx_str, inicio[:, 0], inicio[:, 1], tol, max_iter, use_tol, modificacion,
+                                    politica_historial=POLITICA_HISTORIAL, cancelado=cancelado):
+                                entregar(j, resultados)
+                            return
+                        for j, resultados in interpolacion_lineal_lotes_iter(
+                                f_lambd, inicio[:, 0], inicio[:, 1], tol, max_iter, use_tol, modificacion,
+                                lambda: Historial(**POLITICA_HISTORIAL), cancelado):
+                            entregar(j, list(resultados))
+
+                    def al_recibir(mensaje):
+                        k, resultados = mensaje
+                        resultados_totales.extend(resultados)
+                        tabla.agregar(resultados, k)
+                        lbl_estado.config(text=f"Resolviendo intervalos... ({len(resultados_totales)} filas)")
+
+                    def al_terminar(evaluaciones, error, cancelado):
+                        actualizar_filtros()
+                        if error is not None: return
+                        if not resultados_totales: messagebox.showwarning("Sin resultados",
+                                                                          "Ningún intervalo seleccionado era válido."); return
+                        estado = f"{total} intervalo(s) resueltos."
+                        if evaluaciones is not None:
+                            estado += f" Evaluaciones de f: {evaluaciones} ({evaluaciones / total:.1f} por raíz)."
+                        estado += " " + f_lambd.texto_resumen()
+                        if dps is not None and metodo == "Interpolación Lineal":
+                            estado += f" Alta precisión: {len(pulidas)} raíz(es) pulidas con mpmath ({dps} dígitos)."
+                            if verificar:
+                                estado += f" {len(encierros)} encierro(s) verificados."
+                        lbl_estado.config(text=estado if not cancelado else "Operación cancelada.")
+                        if not cancelado:
+                            encierros.sort(key=lambda t: t[0])
+                            mostrar_encierros([(f"Intervalo {k + 1}", e) for k, e in encierros])
+                        boton_graficar.config(
+                            command=lambda: mostrar_grafica(lienzo.graficar_funcion, f_lambd, resultados_totales,
+                                                         str(f_expr), a, b))
+
+                    iniciar_tarea(trabajo, al_recibir, al_terminar, "Resolviendo intervalos...", "resolver")
+
+                if factores is not None:
+                    resolver_polinomio_tarea()
+                else:
+                    iniciar_tarea(buscar, None, al_encontrar, "Buscando intervalos...", "escaneo")
 
             elif metodo == "Punto Fijo":
                 g_str = entrada_g.get()
                 x0 = float(entrada_x0.get())
                 use_aitken = var_aitken.get() == 1
 
-                resultados, x_vals_iter, g_lambd, f_lambd, g_expr = punto_fijo(g_str, x0, tol, max_iter, use_aitken,
-                                                                               fx_str)
-
-                if not resultados: messagebox.showerror("Error", "El método no convergió o no se ejecutó."); return
-
-                for it, xn, err in resultados:
-                    tabla.insert("", "end", values=(it, f"{xn:.8f}", f"{err:.8f}"))
-
-                # Verificar f(raiz) al final
-                raiz_final = resultados[-1][1]
-                print(f"Verificación final: f({raiz_final:.6f}) = {f_lambd(raiz_final):.6f}")
-
-                boton_graficar.config(
-                    command=lambda: graficar_punto_fijo(g_lambd, resultados, x_vals_iter, str(g_expr), use_aitken))
+                g_lambd, f_lambd, g_expr = compilar_punto_fijo(g_str, fx_str, backend_escalar)
+                # La gráfica vuelve a pedir g en cada iterado; la caché devuelve los valores ya calculados
+                g_lambd = CacheEvaluaciones(g_lambd)
+
+                # Las filas se publican en bloques a medida que el método las produce
+                resultados = Historial(**POLITICA_HISTORIAL)
+                x_vals_iter = Historial(**POLITICA_HISTORIAL)
+
+                clave_metodo = f"{use_aitken}|{max_iter}{sufijo_precision}"
+
+                def trabajo(publicar, cancelado):
+                    # Repetición exacta: se muestra la fila final guardada. No se arranca desde un
+                    # punto fijo previo cercano: x0 decide a qué punto fijo converge la iteración.
+                    if almacen is not None:
+                        fila = almacen.raiz(g_str, "punto_fijo", clave_metodo, tol, x0, x0)
+                        if fila is not None:
+                            x_vals_iter.extend([x0, fila[1]])
+                            publicar([fila])
+                            return
+
+                    bloque, anterior, final = [], None, None
+                    for fila in punto_fijo_iter(g_lambd, x0, tol, max_iter, use_aitken, x_vals_iter):
+                        bloque.append(fila)
+                        anterior, final = final, fila
+                        if len(bloque) >= FILAS_POR_REFRESCO:
+                            publicar(bloque)
+                            bloque = []
+                        if cancelado.is_set():
+                            break
+                    raiz = encierro = None
+                    if dps is not None and final is not None and not cancelado.is_set():
+                        nuevas, raiz, encierro = refinar_punto_fijo([f for f in (anterior, final) if f is not None],
+                                                                    g_str, tol, dps, verificar)
+                        bloque.extend(nuevas)
+                        final = nuevas[-1] if nuevas else final
+                    if bloque:
+                        publicar(bloque)
+                    if almacen is not None and final is not None and final[2] < tol:
+                        almacen.guardar_raiz(g_str, "punto_fijo", clave_metodo, tol, x0, x0, final[1], final)
+                    return raiz, encierro
+
+                def al_recibir(filas):
+                    resultados.extend(filas)
+                    tabla.agregar(filas)
+
+                def al_terminar(precisa, error, cancelado):
+                    if error is not None: return
+                    if not resultados.total: messagebox.showerror("Error", "El método no convergió o no se ejecutó."); return
+
+                    filas, puntos = resultados.registros(), x_vals_iter.registros()
+
+                    # Verificar f(raiz) al final
+                    raiz_final = filas[-1][1]
+                    print(f"Verificación final: f({raiz_final:.6f}) = {f_lambd(raiz_final):.6f}")
+                    if not cancelado:
+                        estado = g_lambd.texto_resumen()
+                        raiz, encierro = precisa or (None, None)
+                        if raiz is not None:
+                            import mpmath
+                            estado += f" Alta precisión: x = {mpmath.nstr(raiz, dps)}."
+                        lbl_estado.config(text=estado)
+                        if encierro is not None:
+                            mostrar_encierros([("Punto fijo", encierro)])
+
+                    boton_graficar.config(
+                        command=lambda: mostrar_grafica(lienzo.graficar_punto_fijo, g_lambd, filas, puntos,
+                                                     str(g_expr), use_aitken))
+
+                iniciar_tarea(trabajo, al_recibir, al_terminar, "Iterando punto fijo...", "resolver")
 
         except ValueError as ve:
             messagebox.showerror("Error en parámetros", str(ve))
@@ -159,7 +459,8 @@ def lanzar_interfaz():
     frame_func.columnconfigure(1, weight=1)
 
     ttk.Label(frame_func, text="Método:").grid(row=0, column=0, sticky="w")
-    combo_metodo = ttk.Combobox(frame_func, values=["Interpolación Lineal", "Punto Fijo"], state="readonly")
+    combo_metodo = ttk.Combobox(frame_func, values=["Interpolación Lineal", "Punto Fijo"] + list(METODOS_RAPIDOS),
+                                state="readonly")
     combo_metodo.set("Interpolación Lineal")
     combo_metodo.grid(row=0, column=1, columnspan=2, sticky="ew", padx=5)
     combo_metodo.bind("<<ComboboxSelected>>", actualizar_campos_metodo)  # <-- Evento clave
@@ -175,6 +476,7 @@ def lanzar_interfaz():
     frame_preview = tk.Frame(ventana, bd=1, relief="solid", height=60)
     frame_preview.pack(fill="x", padx=10, pady=5)
     frame_preview.pack_propagate(False)
+    vista_previa = VistaPreviaLatex(frame_preview)
 
     # --- Frame de parámetros (aquí estarán TODOS los campos) ---
     frame_params = tk.Frame(ventana)
@@ -191,7 +493,18 @@ def lanzar_interfaz():
     entrada_delta.insert(0, "0.5")
     var_condicion = tk.IntVar()
     check_tol = tb.Checkbutton(frame_params, text="Usar tolerancia", variable=var_condicion)
-    campos_interpolacion = [lbl_a, entrada_a, lbl_b, entrada_b, lbl_delta, entrada_delta, check_tol]
+    lbl_modificacion = ttk.Label(frame_params, text="Modificación:")
+    combo_modificacion = ttk.Combobox(frame_params, values=list(MODIFICACIONES), state="readonly")
+    combo_modificacion.set("Ninguna")
+    var_paralelo = tk.IntVar()
+    check_paralelo = tb.Checkbutton(frame_params, text="Resolver en paralelo", variable=var_paralelo)
+    var_adaptativo = tk.IntVar()
+    check_adaptativo = tb.Checkbutton(frame_params, text="Búsqueda adaptativa", variable=var_adaptativo)
+    campos_interpolacion = [lbl_a, entrada_a, lbl_b, entrada_b, lbl_delta, entrada_delta, check_tol,
+                            check_adaptativo]
+    var_polinomio = tk.IntVar(value=1)
+    check_polinomio = tb.Checkbutton(frame_params, text="Vía rápida para polinomios", variable=var_polinomio)
+    campos_regula_falsi = [lbl_modificacion, combo_modificacion, check_paralelo, check_polinomio]
 
     # Campos para Punto Fijo
     lbl_g = ttk.Label(frame_params, text="g(x):")
@@ -209,7 +522,12 @@ def lanzar_interfaz():
     entrada_b.grid(row=1, column=1, sticky="ew", pady=2)
     lbl_delta.grid(row=2, column=0, sticky="w")
     entrada_delta.grid(row=2, column=1, sticky="ew", pady=2)
+    lbl_modificacion.grid(row=3, column=0, sticky="w")
+    combo_modificacion.grid(row=3, column=1, sticky="ew", pady=2)
     check_tol.grid(row=6, column=0, columnspan=2, sticky="w")
+    check_paralelo.grid(row=7, column=0, columnspan=2, sticky="w")
+    check_adaptativo.grid(row=8, column=0, columnspan=2, sticky="w")
+    check_polinomio.grid(row=11, column=0, columnspan=2, sticky="w")
 
     lbl_g.grid(row=0, column=0, sticky="w")
     entrada_g.grid(row=0, column=1, sticky="ew", pady=2)
@@ -224,22 +542,67 @@ def lanzar_interfaz():
     ttk.Label(frame_params, text="Tolerancia:").grid(row=5, column=0, sticky="w")
     entrada_tol = tb.Entry(frame_params)
     entrada_tol.grid(row=5, column=1, sticky="ew", pady=2)
+    ttk.Label(frame_params, text="Evaluación:").grid(row=9, column=0, sticky="w")
+    combo_backend = ttk.Combobox(frame_params, values=list(BACKENDS_EVALUACION), state="readonly")
+    combo_backend.set("Automático")
+    combo_backend.grid(row=9, column=1, sticky="ew", pady=2)
+    var_almacen = tk.IntVar()
+    tb.Checkbutton(frame_params, text="Reutilizar resultados guardados", variable=var_almacen).grid(
+        row=10, column=0, columnspan=2, sticky="w")
+
+    # Alta precisión (Interpolación Lineal y Punto Fijo)
+    var_precision = tk.IntVar()
+    check_precision = tb.Checkbutton(frame_params, text="Alta precisión (mpmath)", variable=var_precision)
+    lbl_dps = ttk.Label(frame_params, text="Dígitos:")
+    entrada_dps = tb.Entry(frame_params)
+    entrada_dps.insert(0, str(DPS_POR_DEFECTO))
+    var_verificar = tk.IntVar()
+    check_verificar = tb.Checkbutton(frame_params, text="Verificar con intervalos", variable=var_verificar)
+    campos_precision = [check_precision, lbl_dps, entrada_dps, check_verificar]
+    check_precision.grid(row=12, column=0, columnspan=2, sticky="w")
+    lbl_dps.grid(row=13, column=0, sticky="w")
+    entrada_dps.grid(row=13, column=1, sticky="ew", pady=2)
+    check_verificar.grid(row=14, column=0, columnspan=2, sticky="w")
 
     # --- Frame botones y tabla ---
     frame_botones = tk.Frame(ventana)
     frame_botones.pack(fill="x", padx=10, pady=5)
-    tb.Button(frame_botones, text="Ejecutar", command=ejecutar, bootstyle="success").pack(side="left", fill="x",
-                                                                                          expand=True, padx=5)
+    boton_ejecutar = tb.Button(frame_botones, text="Ejecutar", command=ejecutar, bootstyle="success")
+    boton_ejecutar.pack(side="left", fill="x", expand=True, padx=5)
+    boton_cancelar = tb.Button(frame_botones, text="Cancelar", command=cancelar, bootstyle="danger-outline",
+                               state="disabled")
+    boton_cancelar.pack(side="left", fill="x", expand=True, padx=5)
     boton_graficar = tb.Button(frame_botones, text="Graficar", bootstyle="primary-outline")
     boton_graficar.pack(side="left", fill="x", expand=True, padx=5)
-
-    frame_tabla = tk.Frame(ventana)
-    frame_tabla.pack(fill="both", expand=True, padx=10, pady=5)
-    tabla = ttk.Treeview(frame_tabla, show="headings")
-    scrollbar = ttk.Scrollbar(frame_tabla, orient="vertical", command=tabla.yview)
-    tabla.configure(yscrollcommand=scrollbar.set)
-    tabla.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
+    var_perfil = tk.IntVar()
+    tb.Checkbutton(frame_botones, text="Perfilar", variable=var_perfil).pack(side="left", padx=5)
+    tb.Button(frame_botones, text="Exportar perfil", command=exportar_perfil,
+              bootstyle="secondary-outline").pack(side="left", padx=5)
+    lbl_estado = ttk.Label(ventana, text="", anchor="w")
+    lbl_estado.pack(side="bottom", fill="x", padx=10, pady=2)
+
+    pestanas = ttk.Notebook(ventana)
+    pestanas.pack(fill="both", expand=True, padx=10, pady=5)
+    frame_resultados = tk.Frame(pestanas)
+    frame_grafica = tk.Frame(pestanas)
+    pestanas.add(frame_resultados, text="Tabla")
+    pestanas.add(frame_grafica, text="Gráfica")
+    lienzo = LienzoGrafico(frame_grafica)
+
+    frame_filtros = tk.Frame(frame_resultados)
+    frame_filtros.pack(fill="x")
+    ttk.Label(frame_filtros, text="Intervalo:").pack(side="left")
+    combo_filtro = ttk.Combobox(frame_filtros, values=["Todos"], state="readonly", width=8)
+    combo_filtro.set("Todos")
+    combo_filtro.pack(side="left", padx=5)
+    combo_filtro.bind("<<ComboboxSelected>>", aplicar_filtro)
+    var_finales = tk.IntVar()
+    tb.Checkbutton(frame_filtros, text="Solo fila final por intervalo", variable=var_finales,
+                   command=aplicar_filtro).pack(side="left", padx=10)
+
+    frame_tabla = tk.Frame(frame_resultados)
+    frame_tabla.pack(fill="both", expand=True, pady=5)
+    tabla = TablaVirtual(frame_tabla)
 
     # --- Inicialización de la UI ---
     actualizar_campos_metodo()
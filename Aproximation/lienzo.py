@@ -0,0 +1,229 @@
+# lienzo.py
+import numpy as np
+
+from graficador_punto_fijo import escalera
+from instrumentacion import fase
+from validador_intervalos import evaluar_malla
+
+
+def muestrear_adaptativo(f, a, b, n_base=200, profundidad=8, tol_relativa=2e-3):
+    """
+    Muestrea f en [a, b] agregando puntos solo donde la curva se aparta de la
+    recta entre dos muestras vecinas (curvatura, picos, asíntotas).
+
+    Args:
+        f (callable): Función compilada.
+        a, b (float): Límites del muestreo.
+        n_base (int): Puntos uniformes iniciales (por ejemplo, según el ancho en píxeles).
+        profundidad (int): Rondas máximas de refinamiento.
+        tol_relativa (float): Desvío tolerado, relativo al rango visible de f.
+
+    Returns:
+        tuple: (xs, ys) ordenados por x.
+    """
+    xs = np.linspace(a, b, max(int(n_base), 2))
+    ys = evaluar_malla(f, xs)
+
+    for _ in range(profundidad):
+        finitos = ys[np.isfinite(ys)]
+        escala = (finitos.max() - finitos.min()) if finitos.size else 0.0
+        escala = escala if escala > 0 else 1.0
+
+        xm = (xs[:-1] + xs[1:]) / 2
+        ym = evaluar_malla(f, xm)
+        with np.errstate(invalid="ignore"):
+            desvio = np.abs(ym - (ys[:-1] + ys[1:]) / 2) > tol_relativa * escala
+        # También se refina donde cambia la finitud (bordes del dominio)
+        desvio |= np.isfinite(ym) != (np.isfinite(ys[:-1]) & np.isfinite(ys[1:]))
+        if not np.any(desvio):
+            break
+
+        xs = np.concatenate([xs, xm[desvio]])
+        ys = np.concatenate([ys, ym[desvio]])
+        orden = np.argsort(xs, kind="stable")
+        xs, ys = xs[orden], ys[orden]
+
+    return xs, ys
+
+
+class LienzoGrafico:
+    """
+    Gráfica persistente embebida en la ventana principal.
+
+    La figura, el FigureCanvasTkAgg y los artistas se crean una sola vez (la
+    primera vez que se grafica, lo que también difiere la carga de
+    matplotlib) y luego se actualizan en su lugar. Al hacer zoom o desplazar
+    la vista, la curva se vuelve a muestrear en el nuevo rango.
+
+    Args:
+        master: Contenedor de Tk donde se empaqueta el lienzo.
+    """
+
+    def __init__(self, master):
+        self.master = master
+        self.figura = None
+        self._f = None
+        self._remuestreando = False
+
+    def _asegurar(self):
+        if self.figura is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        self.figura = Figure(figsize=(7, 5))
+        self.ax = self.figura.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.figura, master=self.master)
+        self.barra = NavigationToolbar2Tk(self.canvas, self.master, pack_toolbar=False)
+        self.barra.pack(side="bottom", fill="x")
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        ax = self.ax
+        ax.axhline(0, color='black', linewidth=0.8)
+        ax.grid(True, linestyle="--", alpha=0.6)
+        self.linea_identidad = ax.axline((0, 0), slope=1, color='black', linestyle='--')
+        self.curva, = ax.plot([], [], 'b-')
+        self.linea_escalera, = ax.plot([], [], 'r-', linewidth=0.8)
+        self.puntos, = ax.plot([], [], 'ro', markersize=4)
+        self.punto_inicial, = ax.plot([], [], 'go', markersize=7)
+        self.punto_raiz, = ax.plot([], [], 'm*', markersize=10)
+
+        ax.callbacks.connect("xlim_changed", self._al_cambiar_limites)
+
+    def _muestras_base(self):
+        # Unas dos muestras por píxel de ancho del eje
+        return max(200, int(self.ax.bbox.width) // 2)
+
+    def _actualizar_curva(self, a, b):
+        xs, ys = muestrear_adaptativo(self._f, a, b, self._muestras_base())
+        self.curva.set_data(xs, ys)
+
+    def _al_cambiar_limites(self, ax):
+        if self._f is None or self._remuestreando:
+            return
+        self._remuestreando = True
+        try:
+            self._actualizar_curva(*ax.get_xlim())
+            self.canvas.draw_idle()
+        finally:
+            self._remuestreando = False
+
+    def _preparar(self, titulo, ylabel, identidad):
+        self._asegurar()
+        # Cada gráfica vuelve a etiquetar solo los artistas que usa, así la leyenda
+        # no arrastra las entradas de la gráfica anterior
+        for artista in (self.curva, self.linea_escalera, self.puntos, self.punto_inicial, self.punto_raiz):
+            artista.set_data([], [])
+            artista.set_label("_nolegend_")
+        self.linea_identidad.set_visible(identidad)
+        self.linea_identidad.set_label("y = x" if identidad else "_nolegend_")
+        self.ax.set_title(titulo)
+        self.ax.set_xlabel("x")
+        self.ax.set_ylabel(ylabel)
+
+    def _ajustar_y(self, *ys):
+        valores = np.concatenate([np.asarray(y, dtype=float).ravel() for y in ys])
+        valores = valores[np.isfinite(valores)]
+        if valores.size:
+            margen = 0.05 * (valores.max() - valores.min()) or 1.0
+            self.ax.set_ylim(valores.min() - margen, valores.max() + margen)
+
+    def _dibujar(self):
+        self.ax.legend(loc="best")
+        self.canvas.draw_idle()
+
+    def graficar_funcion(self, f_lambd, resultados, fx_str, a, b):
+        """Grafica f(x) en [a, b] con las aproximaciones (xr, f(xr)) de cada fila."""
+        with fase("graficar"):
+            self._preparar("Método de Interpolación Lineal", "f(x)", identidad=False)
+            self._f = f_lambd
+            self.curva.set_label(f"f(x) = {fx_str}")
+            self.puntos.set_label("Aproximaciones")
+
+            self._remuestreando = True
+            try:
+                self.ax.set_xlim(a, b)
+            finally:
+                self._remuestreando = False
+            self._actualizar_curva(a, b)
+
+            filas = np.array([(r[3], r[4]) for r in resultados], dtype=float).reshape(-1, 2)
+            self.puntos.set_data(filas[:, 0], filas[:, 1])
+            self._ajustar_y(self.curva.get_ydata(), filas[:, 1])
+            self._dibujar()
+
+    def graficar_punto_fijo(self, g_lambd, resultados, x_vals_iter, g_str, use_aitken):
+        """Grafica g(x), la identidad y la escalera de convergencia de punto fijo."""
+        if not resultados:
+            return
+        with fase("graficar"):
+            titulo = "Método de Iteración de Punto Fijo" + (" con Aitken" if use_aitken else "")
+            self._preparar(titulo, "y", identidad=True)
+            self._f = g_lambd
+            self.curva.set_label(f"y = g(x) = {g_str}")
+            self.puntos.set_label("Aproximaciones $x_n$")
+
+            x_aprox = np.array([res[1] for res in resultados], dtype=float)
+            raiz_final = x_aprox[-1]
+            x0 = x_vals_iter[0]
+
+            # Rango para la gráfica, centrado en las iteraciones
+            x_min = min(min(x_vals_iter), raiz_final) - 1
+            x_max = max(max(x_vals_iter), raiz_final) + 1
+            self._remuestreando = True
+            try:
+                self.ax.set_xlim(x_min, x_max)
+            finally:
+                self._remuestreando = False
+            self._actualizar_curva(x_min, x_max)
+
+            if not use_aitken:
+                self.linea_escalera.set_data(*escalera(x_vals_iter))
+                self.linea_escalera.set_label("Trayectoria")
+
+            extremos = evaluar_malla(g_lambd, np.array([x0, raiz_final], dtype=float))
+            self.puntos.set_data(x_aprox, evaluar_malla(g_lambd, x_aprox))
+            self.punto_inicial.set_data([x0], [extremos[0]])
+            self.punto_inicial.set_label("Punto inicial $x_0$")
+            self.punto_raiz.set_data([raiz_final], [extremos[1]])
+            self.punto_raiz.set_label(f"Raíz ≈ {raiz_final:.6f}")
+
+            self.ax.set_ylim(x_min, x_max)
+            self._dibujar()
+
+
+class VistaPreviaLatex:
+    """
+    Vista previa de la ecuación en LaTeX que reutiliza una sola figura y un
+    solo artista de texto en lugar de crear una figura por cada vista previa.
+    """
+
+    def __init__(self, master):
+        self.master = master
+        self.figura = None
+
+    def mostrar(self, latex_str, error=False):
+        if self.figura is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            self.figura = Figure(figsize=(3.5, 0.8))
+            ax = self.figura.add_subplot(111)
+            ax.axis("off")
+            self.texto = ax.text(0.5, 0.5, "", fontsize=18, ha="center", va="center")
+            self.canvas = FigureCanvasTkAgg(self.figura, master=self.master)
+            self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        if error:
+            self.texto.set_text(latex_str)
+            self.texto.set_color("red")
+            self.texto.set_fontsize(10)
+        else:
+            self.texto.set_text(f"${latex_str}$")
+            self.texto.set_color("black")
+            self.texto.set_fontsize(18)
+        try:
+            self.canvas.draw()
+        except Exception as e:
+            # LaTeX que mathtext no sabe dibujar
+            self.mostrar(f"Error: {e}", error=True)
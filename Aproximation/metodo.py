@@ -1,29 +1,25 @@
 import numpy as np
 
+from instrumentacion import medir_fase
 
-def interpolacion_lineal(f_lambd, a, b, tol, max_iter, use_tol):
-    """
-    Calcula la raíz de una función usando el método de interpolación lineal (Regula Falsi).
 
-    Args:
-        f_lambd (callable): La función lambda ya compilada.
-        a (float): Extremo izquierdo del intervalo.
-        b (float): Extremo derecho del intervalo.
-        tol (float): Tolerancia para el criterio de parada.
-        max_iter (int): Número máximo de iteraciones.
-        use_tol (bool): Si es True, usa la tolerancia como criterio de parada.
+def interpolacion_lineal_iter(f_lambd, a, b, tol, max_iter, use_tol):
     """
-    # La validación se hace una sola vez en la interfaz
-    # if f_lambd(a) * f_lambd(b) > 0:
-    #     raise ValueError("El intervalo no encierra raíz (f(a) y f(b) del mismo signo).")
+    Versión generadora de interpolacion_lineal: produce cada fila
+    (i, a, b, xr, fr, error) en cuanto se calcula, sin acumular la lista.
 
-    resultados = []
+    Los argumentos son los mismos que los de interpolacion_lineal.
+    """
     xr_old = a  # Usamos 'a' o 'b' para tener un valor inicial en la primera iteración
+    fa = f_lambd(a)
+    fb = f_lambd(b)
 
-    for i in range(1, max_iter + 1):
-        fa = f_lambd(a)
-        fb = f_lambd(b)
+    # Intervalo degenerado [z, z] con f(z) = 0: raíz exacta en un nodo del escaneo
+    if a == b and fa == 0:
+        yield (1, a, b, a, fa, 0.0)
+        return
 
+    for i in range(1, max_iter + 1):
         # Verificación de denominador para evitar división por cero
         if abs(fa - fb) < np.finfo(float).eps:  # np.finfo().eps es un número demasiao chiquito
             print("Advertencia: f(a) y f(b) son muy similares, el método puede fallar.")
@@ -38,7 +34,7 @@ def interpolacion_lineal(f_lambd, a, b, tol, max_iter, use_tol):
         else:
             error = abs(xr - xr_old)  # Usamos error absoluto si xr es 0
 
-        resultados.append((i, a, b, xr, fr, error))
+        yield (i, a, b, xr, fr, error)
 
         # Criterio de parada si se encuentra la raíz exacta
         if abs(fr) < np.finfo(float).eps:
@@ -47,11 +43,176 @@ def interpolacion_lineal(f_lambd, a, b, tol, max_iter, use_tol):
         if use_tol and error is not None and error < tol:
             break
 
+        # El extremo reemplazado toma el valor f(xr) ya calculado
         if fa * fr < 0:
-            b = xr
+            b, fb = xr, fr
         else:
-            a = xr
+            a, fa = xr, fr
 
         xr_old = xr
 
+
+@medir_fase("resolver")
+def interpolacion_lineal(f_lambd, a, b, tol, max_iter, use_tol):
+    """
+    Calcula la raíz de una función usando el método de interpolación lineal (Regula Falsi).
+
+    Args:
+        f_lambd (callable): La función lambda ya compilada.
+        a (float): Extremo izquierdo del intervalo.
+        b (float): Extremo derecho del intervalo.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_tol (bool): Si es True, usa la tolerancia como criterio de parada.
+    """
+    # La validación se hace una sola vez en la interfaz
+    # if f_lambd(a) * f_lambd(b) > 0:
+    #     raise ValueError("El intervalo no encierra raíz (f(a) y f(b) del mismo signo).")
+
+    return list(interpolacion_lineal_iter(f_lambd, a, b, tol, max_iter, use_tol))
+
+
+def interpolacion_lineal_lotes_iter(f_lambd, a, b, tol, max_iter, use_tol, modificacion=None, historial=list,
+                                    cancelado=None):
+    """
+    Versión generadora de interpolacion_lineal_lotes.
+
+    Produce (k, filas) cada vez que el intervalo k se retira, de modo que los
+    resultados pueden mostrarse mientras los demás intervalos siguen iterando.
+
+    Args:
+        historial (callable): Fábrica del contenedor de filas de cada intervalo
+            (por ejemplo list o un Historial con política de retención).
+        cancelado (threading.Event): Si se activa, la iteración se detiene
+            y se entregan los intervalos pendientes tal como están.
+
+    El resto de los argumentos son los de interpolacion_lineal_lotes.
+    """
+    if modificacion not in (None, "illinois", "anderson-bjorck"):
+        raise ValueError(f"Modificación desconocida: {modificacion}")
+
+    a = np.array(a, dtype=float, ndmin=1)
+    b = np.array(b, dtype=float, ndmin=1)
+    n = a.size
+    eps = np.finfo(float).eps
+
+    def evaluar(x):
+        with np.errstate(all="ignore"):
+            return np.broadcast_to(np.asarray(f_lambd(x), dtype=float), x.shape).astype(float)
+
+    fa = evaluar(a)
+    fb = evaluar(b)
+    xr_old = a.copy()
+    # Último extremo reemplazado: -1 = a, +1 = b, 0 = ninguno todavía
+    lado = np.zeros(n, dtype=int)
+    activos = np.arange(n)
+    filas = [historial() for _ in range(n)]
+
+    # Intervalos degenerados [z, z] con f(z) = 0: raíces exactas en un nodo del escaneo
+    exactos = (a == b) & (fa == 0)
+    for k in np.flatnonzero(exactos).tolist():
+        filas[k].append((1, float(a[k]), float(b[k]), float(a[k]), float(fa[k]), 0.0))
+        yield k, filas[k]
+    activos = activos[~exactos]
+
+    for i in range(1, max_iter + 1):
+        if activos.size == 0 or (cancelado is not None and cancelado.is_set()):
+            break
+
+        a_act, b_act = a[activos], b[activos]
+        fa_act, fb_act = fa[activos], fb[activos]
+
+        # Los intervalos con f(a) ≈ f(b) se retiran sin registrar fila
+        denominador = fa_act - fb_act
+        utiles = np.abs(denominador) >= eps
+        for k in activos[~utiles].tolist():
+            yield k, filas[k]
+        activos = activos[utiles]
+        a_act, b_act = a_act[utiles], b_act[utiles]
+        fa_act, fb_act = fa_act[utiles], fb_act[utiles]
+        denominador = denominador[utiles]
+        if activos.size == 0:
+            break
+
+        xr = b_act - fb_act * (a_act - b_act) / denominador
+        fr = evaluar(xr)
+
+        viejo = xr_old[activos]
+        with np.errstate(all="ignore"):
+            error = np.where(xr != 0, np.abs((xr - viejo) / xr), np.abs(xr - viejo))
+
+        for k, a_, b_, xr_, fr_, err in zip(activos.tolist(), a_act.tolist(), b_act.tolist(), xr.tolist(),
+                                            fr.tolist(), error.tolist()):
+            filas[k].append((i, a_, b_, xr_, fr_, err))
+
+        terminados = np.abs(fr) < eps
+        if use_tol:
+            terminados |= error < tol
+        for k in activos[terminados].tolist():
+            yield k, filas[k]
+
+        # Actualización de extremos (solo para los que continúan)
+        sigue = ~terminados
+        idx = activos[sigue]
+        xr_s, fr_s = xr[sigue], fr[sigue]
+        reemplaza_b = fa_act[sigue] * fr_s < 0
+
+        if modificacion is not None:
+            # Si se reemplaza el mismo extremo dos veces seguidas, se reduce
+            # el valor de f en el extremo retenido.
+            repite_b = reemplaza_b & (lado[idx] == 1)
+            repite_a = ~reemplaza_b & (lado[idx] == -1)
+            if modificacion == "illinois":
+                m_b = m_a = np.full(idx.size, 0.5)
+            else:
+                with np.errstate(all="ignore"):
+                    m_b = 1 - fr_s / fb[idx]
+                    m_a = 1 - fr_s / fa[idx]
+                m_b = np.where(m_b > 0, m_b, 0.5)
+                m_a = np.where(m_a > 0, m_a, 0.5)
+            fa[idx[repite_b]] *= m_b[repite_b]
+            fb[idx[repite_a]] *= m_a[repite_a]
+
+        b[idx[reemplaza_b]] = xr_s[reemplaza_b]
+        fb[idx[reemplaza_b]] = fr_s[reemplaza_b]
+        a[idx[~reemplaza_b]] = xr_s[~reemplaza_b]
+        fa[idx[~reemplaza_b]] = fr_s[~reemplaza_b]
+        lado[idx] = np.where(reemplaza_b, 1, -1)
+        xr_old[idx] = xr_s
+
+        activos = idx
+
+    # Intervalos que agotaron max_iter (o que quedaron pendientes al cancelar)
+    for k in activos.tolist():
+        yield k, filas[k]
+
+
+@medir_fase("resolver")
+def interpolacion_lineal_lotes(f_lambd, a, b, tol, max_iter, use_tol, modificacion=None):
+    """
+    Aplica Regula Falsi a varios intervalos a la vez usando NumPy.
+
+    En cada iteración se evalúa f una sola vez sobre los intervalos que siguen
+    activos; f(a) y f(b) se reutilizan de la iteración anterior en lugar de
+    recalcularse. Cada intervalo se retira por separado cuando cumple su
+    criterio de parada.
+
+    Args:
+        f_lambd (callable): La función lambda ya compilada (debe aceptar arreglos).
+        a (array_like): Extremos izquierdos de los intervalos.
+        b (array_like): Extremos derechos de los intervalos.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_tol (bool): Si es True, usa la tolerancia como criterio de parada.
+        modificacion (str): None para Regula Falsi clásico, "illinois" o
+            "anderson-bjorck" para evitar el estancamiento en un extremo.
+
+    Returns:
+        list: Una lista por intervalo con las filas (i, a, b, xr, fr, error),
+              en el mismo formato que interpolacion_lineal.
+    """
+    a = np.array(a, dtype=float, ndmin=1)
+    resultados = [[] for _ in range(a.size)]
+    for k, filas in interpolacion_lineal_lotes_iter(f_lambd, a, b, tol, max_iter, use_tol, modificacion):
+        resultados[k] = filas
     return resultados
@@ -0,0 +1,366 @@
+# metodos_rapidos.py
+import numpy as np
+
+from instrumentacion import medir_fase
+
+# Todas las funciones devuelven (resultados, evaluaciones): las filas siguen el
+# formato (i, a, b, xr, fr, error) de interpolacion_lineal y `evaluaciones`
+# cuenta las llamadas a f (y a f' en Newton) para comparar el costo por raíz.
+
+
+def _error_relativo(xr, xr_old):
+    # Mismo criterio que interpolacion_lineal: relativo, o absoluto si xr es 0
+    if xr != 0:
+        return abs((xr - xr_old) / xr)
+    return abs(xr - xr_old)
+
+
+def _verificar_intervalo(fa, fb):
+    if fa * fb > 0:
+        raise ValueError("El intervalo no encierra raíz (f(a) y f(b) del mismo signo).")
+
+
+def _actualizar_intervalo(a, fa, b, fb, x, fx):
+    # Reemplaza el extremo con el mismo signo que f(x) para conservar el cambio de signo
+    if fa * fx < 0:
+        return a, fa, x, fx
+    return x, fx, b, fb
+
+
+def _siguiente_iterado(x, paso, a, b):
+    """
+    Aplica el paso x - paso salvaguardado por el intervalo [a, b] (x es uno de sus extremos).
+
+    Un paso no finito, nulo o que sale del intervalo se reemplaza por la
+    bisección; uno más pequeño que la resolución de x avanza un ulp hacia el
+    otro extremo, de modo que el cambio de signo decide si ya se llegó a la raíz.
+    """
+    if not np.isfinite(paso) or paso == 0:
+        return (a + b) / 2
+    xr = x - paso
+    if xr == x:
+        return float(np.nextafter(x, b if x == a else a))
+    if not min(a, b) < xr < max(a, b):
+        return (a + b) / 2
+    return xr
+
+
+def _sin_progreso(anchos, pasos):
+    # Regla al estilo de Brent: si en las dos últimas iteraciones no se redujo a
+    # la mitad ni el intervalo ni el paso, el método rápido no está avanzando y
+    # se biseca. Con el paso se admite la convergencia rápida desde un solo lado.
+    return (len(anchos) >= 3 and anchos[-1] > anchos[-3] / 2
+            and len(pasos) >= 3 and pasos[-1] > pasos[-3] / 2)
+
+
+def _sondear(f_lambd, xr, fr, a, b, tol):
+    """
+    Comprueba que un paso menor que tol dejó la raíz cerca de xr.
+
+    Un paso pequeño también aparece cuando el método se estanca lejos de la
+    raíz (f casi plana), así que se evalúa f a distancia tol de xr, hacia el
+    otro extremo del intervalo [a, b] (xr ya es uno de sus extremos).
+
+    Returns:
+        tuple: (confirmado, xs, fs) con el punto sondeado; confirmado es True
+               si f cambia de signo (o se anula) entre xr y xs.
+    """
+    otro = b if xr == a else a
+    h = min(tol * abs(xr) if xr != 0 else tol, abs(otro - xr) / 2)
+    xs = xr + h if otro > xr else xr - h
+    fs = f_lambd(xs)
+    return fs == 0 or fr * fs < 0, xs, fs
+
+
+@medir_fase("resolver")
+def brent(f_lambd, a, b, tol, max_iter, use_tol):
+    """
+    Calcula la raíz de una función con el método de Brent.
+
+    Combina interpolación cuadrática inversa, secante y bisección, con la
+    garantía de convergencia de la bisección y convergencia superlineal cerca
+    de la raíz.
+
+    Args:
+        f_lambd (callable): La función lambda ya compilada.
+        a (float): Extremo izquierdo del intervalo.
+        b (float): Extremo derecho del intervalo.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_tol (bool): Si es True, usa la tolerancia como criterio de parada.
+
+    Returns:
+        tuple: (resultados, evaluaciones)
+    """
+    eps = np.finfo(float).eps
+    fa, fb = f_lambd(a), f_lambd(b)
+    evaluaciones = 2
+    _verificar_intervalo(fa, fb)
+
+    resultados = []
+    if fa == 0 or fb == 0:
+        xr, fr = (a, fa) if fa == 0 else (b, fb)
+        resultados.append((1, a, b, xr, fr, 0.0))
+        return resultados, evaluaciones
+
+    # b es siempre la mejor aproximación
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = c
+    biseccion = True
+    xr_old = b
+
+    for i in range(1, max_iter + 1):
+        if fa != fc and fb != fc:
+            # Interpolación cuadrática inversa
+            s = (a * fb * fc / ((fa - fb) * (fa - fc))
+                 + b * fa * fc / ((fb - fa) * (fb - fc))
+                 + c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            # Secante
+            s = b - fb * (b - a) / (fb - fa)
+
+        delta = 2 * eps * abs(b)
+        fuera = not (min((3 * a + b) / 4, b) < s < max((3 * a + b) / 4, b))
+        if (fuera
+                or (biseccion and abs(s - b) >= abs(b - c) / 2)
+                or (not biseccion and abs(s - b) >= abs(c - d) / 2)
+                or (biseccion and abs(b - c) < delta)
+                or (not biseccion and abs(c - d) < delta)):
+            s = (a + b) / 2
+            biseccion = True
+        else:
+            biseccion = False
+
+        fs = f_lambd(s)
+        evaluaciones += 1
+        d, c, fc = c, b, fb
+
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+
+        error = _error_relativo(s, xr_old)
+        resultados.append((i, min(a, b), max(a, b), s, fs, error))
+
+        if abs(fs) < eps:
+            break
+        if use_tol and error < tol:
+            break
+        # El intervalo ya no se puede reducir en punto flotante
+        if abs(b - a) <= 2 * eps * abs(b):
+            break
+
+        xr_old = s
+
+    return resultados, evaluaciones
+
+
+@medir_fase("resolver")
+def newton(f_lambd, a, b, tol, max_iter, use_tol, df_lambd=None):
+    """
+    Calcula la raíz de una función con Newton salvaguardado por bisección.
+
+    Usa la derivada simbólica de la misma expresión y mantiene un intervalo
+    con cambio de signo: si el paso de Newton sale del intervalo o f'(x) es
+    nula, se da un paso de bisección.
+
+    Args:
+        df_lambd (callable): La derivada f'(x) ya compilada.
+
+    El resto de los argumentos son los de brent.
+
+    Returns:
+        tuple: (resultados, evaluaciones), contando las evaluaciones de f y f'.
+    """
+    if df_lambd is None:
+        raise ValueError("El método de Newton necesita la derivada f'(x).")
+
+    eps = np.finfo(float).eps
+    fa, fb = f_lambd(a), f_lambd(b)
+    evaluaciones = 2
+    _verificar_intervalo(fa, fb)
+
+    resultados = []
+    if fa == 0 or fb == 0:
+        xr, fr = (a, fa) if fa == 0 else (b, fb)
+        resultados.append((1, a, b, xr, fr, 0.0))
+        return resultados, evaluaciones
+
+    # Se parte del extremo con menor |f|
+    x, fx = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+    xr_old = x
+
+    for i in range(1, max_iter + 1):
+        dfx = df_lambd(x)
+        evaluaciones += 1
+
+        xr = x - fx / dfx if dfx != 0 and np.isfinite(dfx) else None
+        if xr is None or not (min(a, b) <= xr <= max(a, b)):
+            xr = (a + b) / 2
+
+        fr = f_lambd(xr)
+        evaluaciones += 1
+
+        error = _error_relativo(xr, xr_old)
+        resultados.append((i, a, b, xr, fr, error))
+
+        if abs(fr) < eps or xr == x:
+            break
+        if use_tol and error < tol:
+            break
+
+        if fa * fr < 0:
+            b, fb = xr, fr
+        else:
+            a, fa = xr, fr
+        if abs(b - a) <= 2 * eps * max(abs(a), abs(b)):
+            break
+
+        x, fx = xr, fr
+        xr_old = xr
+
+    return resultados, evaluaciones
+
+
+@medir_fase("resolver")
+def secante(f_lambd, a, b, tol, max_iter, use_tol):
+    """
+    Calcula la raíz de una función con el método de la secante salvaguardado.
+
+    La secante se traza por los dos últimos iterados y se mantiene un
+    intervalo con cambio de signo: si el iterado sale del intervalo (o la
+    secante es horizontal), o si el intervalo no se redujo a la mitad en las
+    dos últimas iteraciones, se da un paso de bisección.
+
+    Los argumentos son los de brent.
+
+    Returns:
+        tuple: (resultados, evaluaciones)
+    """
+    eps = np.finfo(float).eps
+    fa, fb = f_lambd(a), f_lambd(b)
+    evaluaciones = 2
+    _verificar_intervalo(fa, fb)
+
+    resultados = []
+    if fa == 0 or fb == 0:
+        xr, fr = (a, fa) if fa == 0 else (b, fb)
+        resultados.append((1, a, b, xr, fr, 0.0))
+        return resultados, evaluaciones
+
+    x_ant, f_ant, x_act, f_act = a, fa, b, fb
+    anchos, pasos = [abs(b - a)], [abs(b - a)]
+
+    for i in range(1, max_iter + 1):
+        if _sin_progreso(anchos, pasos):
+            xr = (a + b) / 2
+        else:
+            with np.errstate(all="ignore"):
+                paso = f_act * (x_act - x_ant) / (f_act - f_ant) if f_act != f_ant else np.nan
+            xr = _siguiente_iterado(x_act, paso, a, b)
+
+        fr = f_lambd(xr)
+        evaluaciones += 1
+
+        error = _error_relativo(xr, x_act)
+        resultados.append((i, a, b, xr, fr, error))
+
+        if abs(fr) < eps:
+            break
+        a, fa, b, fb = _actualizar_intervalo(a, fa, b, fb, xr, fr)
+        if use_tol and error < tol:
+            confirmado, xr, fr = _sondear(f_lambd, xr, fr, a, b, tol)
+            evaluaciones += 1
+            if confirmado:
+                break
+            a, fa, b, fb = _actualizar_intervalo(a, fa, b, fb, xr, fr)
+        if abs(b - a) <= 2 * eps * max(abs(a), abs(b)):
+            break
+        anchos.append(abs(b - a))
+        pasos.append(abs(xr - x_act))
+
+        x_ant, f_ant = x_act, f_act
+        x_act, f_act = xr, fr
+
+    return resultados, evaluaciones
+
+
+@medir_fase("resolver")
+def steffensen(f_lambd, a, b, tol, max_iter, use_tol):
+    """
+    Calcula la raíz de una función con el método de Steffensen salvaguardado.
+
+    Convergencia cuadrática sin derivada, con dos evaluaciones de f por
+    iteración. Parte del punto de falsa posición del intervalo y mantiene un
+    intervalo con cambio de signo: si el paso sale del intervalo o su
+    denominador se anula, o si el intervalo no se redujo a la mitad en las
+    dos últimas iteraciones, se da un paso de bisección.
+
+    Los argumentos son los de brent.
+
+    Returns:
+        tuple: (resultados, evaluaciones)
+    """
+    eps = np.finfo(float).eps
+    fa, fb = f_lambd(a), f_lambd(b)
+    evaluaciones = 2
+    _verificar_intervalo(fa, fb)
+
+    resultados = []
+    if fa == 0 or fb == 0:
+        xr, fr = (a, fa) if fa == 0 else (b, fb)
+        resultados.append((1, a, b, xr, fr, 0.0))
+        return resultados, evaluaciones
+
+    x = b - fb * (a - b) / (fa - fb)
+    fx = f_lambd(x)
+    evaluaciones += 1
+    if fx == 0:
+        resultados.append((1, a, b, x, fx, 0.0))
+        return resultados, evaluaciones
+    a, fa, b, fb = _actualizar_intervalo(a, fa, b, fb, x, fx)
+    anchos, pasos = [abs(b - a)], [abs(b - a)]
+
+    for i in range(1, max_iter + 1):
+        if _sin_progreso(anchos, pasos):
+            xr = (a + b) / 2
+        else:
+            # El paso auxiliar es f(x), recortado al ancho del intervalo para que la
+            # pendiente se mida a la escala de la raíz y no a la de |f|
+            h = float(np.clip(fx, -abs(b - a), abs(b - a)))
+            f_aux = f_lambd(x + h)
+            evaluaciones += 1
+            denominador = f_aux - fx
+
+            with np.errstate(all="ignore"):
+                paso = fx * h / denominador if denominador != 0 else np.nan
+            xr = _siguiente_iterado(x, paso, a, b)
+
+        fr = f_lambd(xr)
+        evaluaciones += 1
+
+        error = _error_relativo(xr, x)
+        resultados.append((i, a, b, xr, fr, error))
+
+        if abs(fr) < eps:
+            break
+        a, fa, b, fb = _actualizar_intervalo(a, fa, b, fb, xr, fr)
+        if use_tol and error < tol:
+            confirmado, xr, fr = _sondear(f_lambd, xr, fr, a, b, tol)
+            evaluaciones += 1
+            if confirmado:
+                break
+            a, fa, b, fb = _actualizar_intervalo(a, fa, b, fb, xr, fr)
+        if abs(b - a) <= 2 * eps * max(abs(a), abs(b)):
+            break
+        anchos.append(abs(b - a))
+        pasos.append(abs(xr - x))
+
+        x, fx = xr, fr
+
+    return resultados, evaluaciones
@@ -0,0 +1,120 @@
+# paralelo.py
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from compilador import compilar
+from historial import Historial
+from instrumentacion import medir_fase
+from metodo import interpolacion_lineal_lotes_iter
+
+# Intervalos por proceso por debajo de los cuales se resuelve en el proceso actual
+UMBRAL_PARALELO = 64
+
+
+def _resolver_bloque(fx_str, a, b, tol, max_iter, use_tol, modificacion, politica_historial=None,
+                     cancelado=None):
+    # Cada proceso reconstruye la función a partir del texto: las funciones
+    # generadas por lambdify no se serializan de forma fiable.
+    _, f_lambd = compilar(fx_str)
+    historial = list if politica_historial is None else (lambda: Historial(**politica_historial))
+    resultados = [[] for _ in range(np.size(a))]
+    for k, filas in interpolacion_lineal_lotes_iter(f_lambd, a, b, tol, max_iter, use_tol, modificacion,
+                                                    historial, cancelado):
+        resultados[k] = list(filas)
+    return resultados
+
+
+def interpolacion_lineal_paralela_iter(fx_str, a, b, tol, max_iter, use_tol, modificacion=None, procesos=None,
+                                       tam_bloque=None, politica_historial=None, cancelado=None):
+    """
+    Versión generadora de interpolacion_lineal_paralela.
+
+    Produce (k, filas) por cada intervalo k en cuanto su bloque termina, en el
+    orden en que terminan los bloques, de modo que los resultados pueden
+    mostrarse mientras los demás bloques siguen en curso.
+
+    Al activarse `cancelado` se deja de producir: solo se entregan los
+    intervalos resueltos hasta ese momento, tanto en el proceso actual como
+    con varios procesos. Los bloques que aún no empezaron se descartan y los
+    que están corriendo terminan sin que se esperen sus resultados.
+
+    Los argumentos son los de interpolacion_lineal_paralela.
+    """
+    a = np.array(a, dtype=float, ndmin=1)
+    b = np.array(b, dtype=float, ndmin=1)
+    if a.shape != b.shape:
+        raise ValueError("Los arreglos de extremos a y b deben tener el mismo tamaño.")
+    n = a.size
+    if n == 0:
+        return
+
+    procesos = procesos or os.cpu_count() or 1
+    if tam_bloque is None:
+        tam_bloque = max(1, -(-n // (procesos * 4)))
+
+    # Pocos intervalos: no compensa levantar procesos
+    if procesos == 1 or n < procesos * UMBRAL_PARALELO:
+        _, f_lambd = compilar(fx_str)
+        historial = list if politica_historial is None else (lambda: Historial(**politica_historial))
+        for k, filas in interpolacion_lineal_lotes_iter(f_lambd, a, b, tol, max_iter, use_tol, modificacion,
+                                                        historial, cancelado):
+            # Al cancelar, el motor entrega los pendientes a medio iterar: se descartan
+            if cancelado is not None and cancelado.is_set():
+                return
+            yield k, list(filas)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=procesos)
+    try:
+        pendientes = {pool.submit(_resolver_bloque, fx_str, a[i:i + tam_bloque], b[i:i + tam_bloque], tol,
+                                  max_iter, use_tol, modificacion, politica_historial): i
+                      for i in range(0, n, tam_bloque)}
+        while pendientes:
+            listos, _ = wait(pendientes, timeout=0.1, return_when=FIRST_COMPLETED)
+            if cancelado is not None and cancelado.is_set():
+                return
+            for futuro in listos:
+                inicio = pendientes.pop(futuro)
+                for j, filas in enumerate(futuro.result()):
+                    yield inicio + j, filas
+    finally:
+        # No se espera a los bloques en curso (al cancelar o si se deja de consumir)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@medir_fase("resolver")
+def interpolacion_lineal_paralela(fx_str, a, b, tol, max_iter, use_tol, modificacion=None, procesos=None,
+                                  tam_bloque=None, politica_historial=None, cancelado=None):
+    """
+    Resuelve muchos intervalos con Regula Falsi repartiéndolos entre procesos.
+
+    Los intervalos se agrupan en bloques para amortizar la comunicación entre
+    procesos; cada bloque se resuelve con el motor por lotes y los resultados
+    se devuelven en el mismo orden que los intervalos de entrada.
+
+    Args:
+        fx_str (str): La expresión de la función como string.
+        a (array_like): Extremos izquierdos de los intervalos.
+        b (array_like): Extremos derechos de los intervalos.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_tol (bool): Si es True, usa la tolerancia como criterio de parada.
+        modificacion (str): None, "illinois" o "anderson-bjorck".
+        procesos (int): Número de procesos (por defecto, os.cpu_count()).
+        tam_bloque (int): Intervalos por bloque (por defecto, unos 4 bloques por proceso).
+        politica_historial (dict): Argumentos de Historial para limitar las filas
+            que se conservan de cada intervalo (None = todas).
+        cancelado (threading.Event): Si se activa, se dejan de recoger resultados
+            (ver interpolacion_lineal_paralela_iter).
+
+    Returns:
+        list: Una lista por intervalo con las filas (i, a, b, xr, fr, error).
+              Los intervalos no resueltos al cancelar quedan con la lista vacía.
+    """
+    resultados = [[] for _ in range(np.size(a))]
+    for k, filas in interpolacion_lineal_paralela_iter(fx_str, a, b, tol, max_iter, use_tol, modificacion, procesos,
+                                                       tam_bloque, politica_historial, cancelado):
+        resultados[k] = filas
+    return resultados
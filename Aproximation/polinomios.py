@@ -0,0 +1,155 @@
+# polinomios.py
+import numpy as np
+
+from compilador import parsear
+from instrumentacion import medir_fase
+
+
+def coeficientes_polinomio(expr_str, simbolo="x"):
+    """
+    Detecta si la expresión es un polinomio en x con coeficientes reales.
+
+    Args:
+        expr_str (str): La expresión como string.
+        simbolo (str): Nombre de la variable.
+
+    Returns:
+        list: Factores libres de cuadrados como pares (coeficientes, multiplicidad),
+              con los coeficientes de mayor a menor grado. Si la factorización
+              no es posible se devuelve el polinomio completo con multiplicidad
+              None. None si la expresión no es un polinomio de grado >= 1 en x.
+    """
+    import sympy as sp
+
+    x = sp.Symbol(simbolo)
+    expr = parsear(expr_str)
+    if not expr.free_symbols <= {x} or not expr.is_polynomial(x):
+        return None
+    # Los decimales escritos por el usuario pasan a racionales exactos (0.5 -> 1/2)
+    poli = sp.Poly(sp.nsimplify(expr, rational=True), x)
+    if poli.degree() < 1 or not all(c.is_real for c in poli.all_coeffs()):
+        return None
+
+    try:
+        # Con coeficientes exactos, las raíces múltiples pasan a ser simples en su factor
+        _, factores = poli.sqf_list()
+    except Exception:
+        factores = [(poli, None)]
+    return [(np.array([float(c) for c in f.all_coeffs()]), m) for f, m in factores if f.degree() >= 1]
+
+
+def describir_raices(multiplicidades):
+    """
+    Resumen de una línea de las raíces encontradas, por ejemplo
+    "3 raíces reales (1 doble)".
+    """
+    nombres = {2: "doble", 3: "triple"}
+    total = len(multiplicidades)
+    texto = f"{total} raíz real" if total == 1 else f"{total} raíces reales"
+    multiples = {}
+    for m in multiplicidades:
+        if m and m > 1:
+            multiples[m] = multiples.get(m, 0) + 1
+    if multiples:
+        partes = [f"{n} {nombres.get(m, f'de multiplicidad {m}')}" for m, n in sorted(multiples.items())]
+        texto += f" ({', '.join(partes)})"
+    return texto
+
+
+def _raices_reales(coefs, tol_imag):
+    raices = np.roots(coefs)
+    reales = raices[np.abs(raices.imag) <= tol_imag * np.maximum(1.0, np.abs(raices))].real
+    return np.sort(reales)
+
+
+def _agrupar(raices, tol):
+    # Raíces reales que el redondeo separó (una raíz múltiple) se unen; devuelve (raíz, veces)
+    grupos = []
+    for r in raices:
+        if grupos and abs(r - grupos[-1][0]) <= tol * max(1.0, abs(r)):
+            r0, m0 = grupos[-1]
+            grupos[-1] = ((r0 * m0 + r) / (m0 + 1), m0 + 1)
+        else:
+            grupos.append((r, 1))
+    return grupos
+
+
+@medir_fase("resolver")
+def resolver_polinomio(factores, a, b, pulir=3, tol=1e-12, f_lambd=None, df_lambd=None):
+    """
+    Calcula todas las raíces reales de un polinomio en [a, b] de una sola vez.
+
+    Cada factor libre de cuadrados se resuelve con los autovalores de su
+    matriz compañera (np.roots) y se conservan las raíces reales dentro del
+    intervalo. Las raíces dobles y los pares de raíces muy cercanas, que no
+    producen cambio de signo o caen en una misma celda de buscar_intervalos,
+    se obtienen igual. Opcionalmente se pulen con unas iteraciones de Newton:
+    las raíces simples sobre f tal como se escribió (si se pasan f_lambd y
+    df_lambd; la forma expandida pierde precisión con raíces muy cercanas) y
+    las múltiples sobre su factor libre de cuadrados, donde son simples.
+
+    Args:
+        factores (list): Resultado de coeficientes_polinomio.
+        a, b (float): Intervalo de búsqueda.
+        pulir (int): Iteraciones máximas de Newton por raíz (0 para no pulir).
+        tol (float): Tolerancia relativa del pulido.
+        f_lambd, df_lambd (callable): f y su derivada compiladas (opcionales).
+
+    Returns:
+        tuple: (filas, multiplicidades). filas tiene una lista por raíz, con
+               filas (i, a, b, xr, f(xr), error) como las de Regula Falsi; la
+               fila 0 es la raíz de la matriz compañera.
+    """
+    if a > b:
+        a, b = b, a
+    coefs_total = np.array([1.0])
+    for coefs, m in factores:
+        for _ in range(m or 1):
+            coefs_total = np.polymul(coefs_total, coefs)
+
+    raices = []
+    for coefs, m in factores:
+        derivada = np.polyder(coefs)
+        if m is not None:
+            # Factor libre de cuadrados: todas sus raíces son simples
+            raices.extend((r, m, 1, coefs, derivada) for r in _raices_reales(coefs, 1e-9))
+        else:
+            # Sin factorización una raíz múltiple aparece como un grupo de
+            # autovalores cercanos, a veces con parte imaginaria pequeña
+            raices.extend((r, veces, veces, coefs, derivada)
+                          for r, veces in _agrupar(_raices_reales(coefs, 1e-6), 1e-6))
+    raices.sort(key=lambda t: t[0])
+
+    def evaluar(x):
+        return float(f_lambd(x) if f_lambd is not None else np.polyval(coefs_total, x))
+
+    margen = 1e-9 * max(1.0, abs(a), abs(b))
+    filas, multiplicidades = [], []
+    with np.errstate(all="ignore"):
+        for r, multiplicidad, veces, coefs, derivada in raices:
+            if not a - margen <= r <= b + margen:
+                continue
+            if multiplicidad == 1 and f_lambd is not None and df_lambd is not None:
+                q, dq = f_lambd, df_lambd
+            else:
+                q, dq = (lambda x, c=coefs: np.polyval(c, x)), (lambda x, d=derivada: np.polyval(d, x))
+            # Las raíces agrupadas no se pulen: cerca de ellas p y p' son puro redondeo
+            iteraciones = pulir if veces == 1 else 0
+
+            filas_raiz = [(0, a, b, float(r), evaluar(r), None)]
+            xr = r
+            for i in range(1, iteraciones + 1):
+                pendiente = dq(xr)
+                if pendiente == 0 or not np.isfinite(pendiente):
+                    break
+                nuevo = xr - q(xr) / pendiente
+                if not np.isfinite(nuevo):
+                    break
+                error = abs((nuevo - xr) / nuevo) if nuevo != 0 else abs(nuevo - xr)
+                xr = nuevo
+                filas_raiz.append((i, a, b, float(xr), evaluar(xr), float(error)))
+                if error < tol:
+                    break
+            filas.append(filas_raiz)
+            multiplicidades.append(multiplicidad)
+    return filas, multiplicidades
@@ -1,38 +1,26 @@
-import sympy as sp
-from sympy.parsing.sympy_parser import (
-    parse_expr, standard_transformations, implicit_multiplication_application
-)
+import numpy as np
 
+from compilador import compilar
+from instrumentacion import medir_fase
 
-def punto_fijo(g_str, x0, tol, max_iter, use_aitken, f_str="0"):
+
+def punto_fijo_iter(g_lambd, x0, tol, max_iter, use_aitken, x_vals_iter=None):
     """
-    Calcula la raíz de una función usando el método de iteración de punto fijo.
+    Versión generadora de punto_fijo: produce cada fila (i, x_n, error) en
+    cuanto se calcula, sin acumular la lista de resultados.
 
     Args:
-        g_str (str): La función de iteración g(x) como string.
+        g_lambd (callable): La función de iteración g(x) ya compilada.
         x0 (float): Valor inicial.
         tol (float): Tolerancia para el criterio de parada.
         max_iter (int): Número máximo de iteraciones.
         use_aitken (bool): Si es True, usa la aceleración de Aitken.
-        f_str (str): La función original f(x) para verificación final (opcional).
-
-    Returns:
-        tuple: (resultados, x_vals_iter, g_lambd, f_lambd, g_expr)
+        x_vals_iter (list): Contenedor opcional (list o Historial) donde se
+            agregan los puntos de la "escalera" para graficar.
     """
-    # Configuración para parsear las funciones
-    transformations = (standard_transformations + (implicit_multiplication_application,))
-    x_sym = sp.symbols('x')
-    try:
-        g_expr = parse_expr(g_str, transformations=transformations)
-        f_expr = parse_expr(f_str, transformations=transformations)
-        g_lambd = sp.lambdify(x_sym, g_expr, "numpy")
-        f_lambd = sp.lambdify(x_sym, f_expr, "numpy")
-    except Exception as e:
-        raise ValueError(f"Error al interpretar la función g(x): {e}")
-
-    resultados = []
-    # Almacena la secuencia de puntos para graficar la "escalera"
-    x_vals_iter = [x0]
+    if x_vals_iter is None:
+        x_vals_iter = []
+    x_vals_iter.append(x0)
 
     if not use_aitken:
         # --- Método de Punto Fijo estándar ---
@@ -41,8 +29,8 @@ def punto_fijo(g_str, x0, tol, max_iter, use_aitken, f_str="0"):
             x_siguiente = g_lambd(x_actual)
             error = abs(x_siguiente - x_actual)
 
-            resultados.append((i, x_siguiente, error))
             x_vals_iter.append(x_siguiente)
+            yield (i, x_siguiente, error)
 
             if error < tol:
                 break
@@ -67,11 +55,147 @@ def punto_fijo(g_str, x0, tol, max_iter, use_aitken, f_str="0"):
             x_aitken = x_i - ((x_i_1 - x_i) ** 2) / denominador
             error = abs(x_aitken - x_i)
 
-            resultados.append((i, x_aitken, error))
+            yield (i, x_aitken, error)
 
             if error < tol:
                 break
 
             x_i = x_aitken
 
+
+def compilar_punto_fijo(g_str, f_str="0", backend="numpy"):
+    """
+    Compila g(x) y f(x) para el método de punto fijo.
+
+    La iteración evalúa g en un escalar por paso, así que backend="math"
+    reduce el costo por llamada.
+
+    Returns:
+        tuple: (g_lambd, f_lambd, g_expr)
+    """
+    # Parseo y compilación de las funciones (compartidos con el resto de la app)
+    try:
+        g_expr, g_lambd = compilar(g_str, backend)
+        _, f_lambd = compilar(f_str, backend)
+    except ValueError as e:
+        raise ValueError(f"Error al interpretar la función g(x): {e}")
+    return g_lambd, f_lambd, g_expr
+
+
+@medir_fase("resolver")
+def punto_fijo(g_str, x0, tol, max_iter, use_aitken, f_str="0", backend="numpy"):
+    """
+    Calcula la raíz de una función usando el método de iteración de punto fijo.
+
+    Args:
+        g_str (str): La función de iteración g(x) como string.
+        x0 (float): Valor inicial.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_aitken (bool): Si es True, usa la aceleración de Aitken.
+        f_str (str): La función original f(x) para verificación final (opcional).
+        backend (str): Backend de compilador.compilar para g y f.
+
+    Returns:
+        tuple: (resultados, x_vals_iter, g_lambd, f_lambd, g_expr)
+    """
+    g_lambd, f_lambd, g_expr = compilar_punto_fijo(g_str, f_str, backend)
+
+    if backend == "numba":
+        # El bucle completo se compila junto con g; sin Numba se itera en Python
+        from bucles_numba import punto_fijo_numba
+        resultados, x_vals_iter = punto_fijo_numba(g_str, x0, tol, max_iter, use_aitken)
+        return resultados, x_vals_iter, g_lambd, f_lambd, g_expr
+
+    # Almacena la secuencia de puntos para graficar la "escalera"
+    x_vals_iter = []
+    resultados = list(punto_fijo_iter(g_lambd, x0, tol, max_iter, use_aitken, x_vals_iter))
+
     return resultados, x_vals_iter, g_lambd, f_lambd, g_expr
+
+
+# Códigos de estado de punto_fijo_lotes
+CONVERGIO = 0
+MAX_ITER = 1
+DIVERGIO = 2
+DENOMINADOR_CERO = 3
+
+
+@medir_fase("resolver")
+def punto_fijo_lotes(g_str, x0s, tol, max_iter, use_aitken, limite=1e100):
+    """
+    Aplica la iteración de punto fijo a muchos puntos iniciales a la vez con NumPy.
+
+    Útil para mapear las cuencas de convergencia de g(x): g se compila una sola
+    vez y cada punto inicial se retira de forma individual cuando converge,
+    diverge o (con Aitken) su denominador se anula.
+
+    Args:
+        g_str (str): La función de iteración g(x) como string.
+        x0s (array_like): Valores iniciales.
+        tol (float): Tolerancia para el criterio de parada.
+        max_iter (int): Número máximo de iteraciones.
+        use_aitken (bool): Si es True, usa la aceleración de Aitken.
+        limite (float): Magnitud a partir de la cual se considera que el punto diverge.
+
+    Returns:
+        tuple: (x_final, iteraciones, estado) como arreglos de NumPy. El estado
+               es CONVERGIO, MAX_ITER, DIVERGIO o DENOMINADOR_CERO.
+    """
+    try:
+        _, g_lambd = compilar(g_str)
+    except ValueError as e:
+        raise ValueError(f"Error al interpretar la función g(x): {e}")
+
+    def g(x):
+        return np.broadcast_to(np.asarray(g_lambd(x), dtype=float), x.shape).astype(float)
+
+    x_final = np.array(x0s, dtype=float, ndmin=1).ravel()
+    iteraciones = np.zeros(x_final.size, dtype=int)
+    estado = np.full(x_final.size, MAX_ITER, dtype=int)
+    activos = np.arange(x_final.size)
+
+    with np.errstate(all="ignore"):
+        for i in range(1, max_iter + 1):
+            if activos.size == 0:
+                break
+
+            x_act = x_final[activos]
+            if not use_aitken:
+                x_nuevo = g(x_act)
+            else:
+                x_1 = g(x_act)
+                x_2 = g(x_1)
+                denominador = (x_2 - x_1) - (x_1 - x_act)
+
+                # Si g ya no mueve el punto, convergió: el denominador nulo es
+                # consecuencia de la convergencia y no un fallo de Aitken
+                quieto = np.abs(x_1 - x_act) < tol
+                estado[activos[quieto]] = CONVERGIO
+                iteraciones[activos[quieto]] = i
+                x_final[activos[quieto]] = x_1[quieto]
+                activos, x_act = activos[~quieto], x_act[~quieto]
+                x_1, denominador = x_1[~quieto], denominador[~quieto]
+
+                # El denominador casi nulo detiene solo a ese punto
+                nulo = np.abs(denominador) < 1e-12
+                iteraciones[activos[nulo]] = i
+                estado[activos[nulo]] = DENOMINADOR_CERO
+                activos, x_act = activos[~nulo], x_act[~nulo]
+                x_1, denominador = x_1[~nulo], denominador[~nulo]
+
+                x_nuevo = x_act - ((x_1 - x_act) ** 2) / denominador
+
+            error = np.abs(x_nuevo - x_act)
+            iteraciones[activos] = i
+
+            divergente = ~np.isfinite(x_nuevo) | (np.abs(x_nuevo) > limite)
+            convergido = ~divergente & (error < tol)
+            estado[activos[divergente]] = DIVERGIO
+            estado[activos[convergido]] = CONVERGIO
+
+            # En los divergentes se conserva el último iterado finito
+            x_final[activos[~divergente]] = x_nuevo[~divergente]
+            activos = activos[~(divergente | convergido)]
+
+    return x_final, iteraciones, estado
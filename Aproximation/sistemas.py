@@ -0,0 +1,227 @@
+# sistemas.py
+import numpy as np
+
+from compilador import parsear
+from instrumentacion import fase, medir_fase
+from punto_fijo import CONVERGIO, MAX_ITER, DIVERGIO, DENOMINADOR_CERO
+
+ACELERACIONES = (None, "aitken", "anderson")
+
+
+def compilar_sistema(expr_strs, variables=None, jacobiano=False):
+    """
+    Parsea y compila un sistema de expresiones en varias variables.
+
+    Las expresiones usan las mismas transformaciones que el resto de la
+    aplicación (multiplicación implícita incluida), así que "xy" se lee como
+    x*y y "x1" como x*1: conviene nombrar las variables con una sola letra.
+
+    Args:
+        expr_strs (list): Expresiones como strings, una por componente.
+        variables (list): Nombres de las variables, en orden; por defecto,
+            los símbolos que aparecen en las expresiones, ordenados por nombre.
+        jacobiano (bool): Si es True, compila también la matriz jacobiana.
+
+    Returns:
+        tuple: (exprs, variables, F, J). F recibe un arreglo de forma (n, m)
+               (n variables, m puntos) y devuelve (n, m); J devuelve
+               (n, n, m), o es None si jacobiano=False.
+    """
+    import sympy as sp
+
+    if isinstance(expr_strs, str):
+        expr_strs = [e for e in expr_strs.split(";") if e.strip()]
+    exprs = [parsear(e) for e in expr_strs]
+    if variables is None:
+        simbolos = sorted(set().union(*(e.free_symbols for e in exprs)), key=lambda s: s.name)
+    else:
+        simbolos = [sp.Symbol(v) for v in variables]
+    if len(exprs) != len(simbolos):
+        raise ValueError(f"El sistema debe tener tantas ecuaciones como variables "
+                         f"({len(exprs)} ecuaciones, {len(simbolos)} variables).")
+
+    n = len(exprs)
+    try:
+        with fase("lambdify"):
+            f_lambd = sp.lambdify(simbolos, exprs, "numpy")
+            j_lambd = sp.lambdify(simbolos, list(sp.Matrix(exprs).jacobian(simbolos)), "numpy") if jacobiano else None
+    except Exception as e:
+        raise ValueError(f"Error al compilar el sistema: {e}")
+
+    def F(X):
+        # Las componentes constantes se amplían a la forma de los puntos
+        return np.array(np.broadcast_arrays(*f_lambd(*X), X[0]), dtype=float)[:-1]
+
+    def J(X):
+        return np.array(np.broadcast_arrays(*j_lambd(*X), X[0]), dtype=float)[:-1].reshape(n, n, -1)
+
+    return exprs, [s.name for s in simbolos], F, (J if jacobiano else None)
+
+
+def _puntos_iniciales(X0, n):
+    X = np.array(X0, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(n, -1)
+    if X.shape[0] != n:
+        raise ValueError(f"Los puntos iniciales deben tener {n} componentes.")
+    return X
+
+
+@medir_fase("resolver")
+def punto_fijo_sistema(g_strs, X0, tol, max_iter, aceleracion=None, memoria=5, variables=None, limite=1e100):
+    """
+    Iteración de punto fijo X = G(X) para sistemas, sobre muchos puntos iniciales a la vez.
+
+    Todas las operaciones son sobre arreglos (n, m): cada punto inicial es
+    una columna y se retira de forma individual cuando converge o diverge,
+    como en punto_fijo.punto_fijo_lotes.
+
+    Args:
+        g_strs (list): Componentes de G como strings (o un string separado por ";").
+        X0 (array_like): Puntos iniciales, de forma (n,) o (n, m).
+        tol (float): Tolerancia sobre max|X_nuevo - X|.
+        max_iter (int): Número máximo de iteraciones.
+        aceleracion (str): None, "aitken" (Aitken vectorial) o "anderson".
+        memoria (int): Número de diferencias que guarda Anderson.
+        variables (list): Nombres de las variables (ver compilar_sistema).
+        limite (float): Magnitud a partir de la cual se considera que el punto diverge.
+
+    Returns:
+        tuple: (X_final, iteraciones, estado), con X_final de forma (n, m) y
+               los códigos de estado de punto_fijo.
+    """
+    if aceleracion not in ACELERACIONES:
+        raise ValueError(f"Aceleración desconocida: {aceleracion}")
+    if aceleracion == "anderson" and memoria < 1:
+        raise ValueError("La memoria de Anderson debe ser positiva.")
+
+    _, nombres, G, _ = compilar_sistema(g_strs, variables)
+    X_final = _puntos_iniciales(X0, len(nombres))
+    iteraciones = np.zeros(X_final.shape[1], dtype=int)
+    estado = np.full(X_final.shape[1], MAX_ITER, dtype=int)
+    activos = np.arange(X_final.shape[1])
+
+    # Historia de Anderson: diferencias de residuos y de imágenes, cada una (n, activos)
+    dF, dG = [], []
+    anterior = None
+
+    with np.errstate(all="ignore"):
+        for i in range(1, max_iter + 1):
+            if activos.size == 0:
+                break
+
+            X = X_final[:, activos]
+            if aceleracion is None:
+                X_nuevo = G(X)
+
+            elif aceleracion == "aitken":
+                # Aitken vectorial (Irons-Tuck): extrapola sobre la dirección de la última diferencia
+                X_1 = G(X)
+                X_2 = G(X_1)
+                d1, d2 = X_1 - X, X_2 - X_1
+                D = d2 - d1
+                denominador = np.sum(D * D, axis=0)
+
+                # Si D es del orden del redondeo de X la extrapolación no es fiable: se usa el doble paso simple
+                nulo = np.sqrt(denominador) <= 1e-13 * (np.max(np.abs(X_2), axis=0) + 1)
+                coeficiente = np.where(nulo, 0.0, np.sum(d2 * D, axis=0) / np.where(nulo, 1.0, denominador))
+                X_nuevo = X_2 - coeficiente * d2
+
+            else:
+                GX = G(X)
+                R = GX - X
+                if anterior is not None:
+                    GX_ant, R_ant = anterior
+                    dF.append(R - R_ant)
+                    dG.append(GX - GX_ant)
+                    del dF[:-memoria], dG[:-memoria]
+                anterior = (GX, R)
+
+                if dF:
+                    # min ||R - dF gamma|| por columna, resuelto en lote con la pseudoinversa
+                    A = np.stack(dF, axis=-1).transpose(1, 0, 2)  # (activos, n, historia)
+                    B = np.stack(dG, axis=-1).transpose(1, 0, 2)
+                    gamma = np.linalg.pinv(A) @ R.T[..., None]
+                    X_nuevo = GX - (B @ gamma)[..., 0].T
+                    # Si la combinación no es finita se usa el paso simple
+                    X_nuevo = np.where(np.isfinite(X_nuevo), X_nuevo, GX)
+                else:
+                    X_nuevo = GX
+
+            error = np.max(np.abs(X_nuevo - X), axis=0)
+            iteraciones[activos] = i
+
+            divergente = ~np.all(np.isfinite(X_nuevo), axis=0) | (np.max(np.abs(X_nuevo), axis=0) > limite)
+            convergido = ~divergente & (error < tol)
+            estado[activos[divergente]] = DIVERGIO
+            estado[activos[convergido]] = CONVERGIO
+
+            X_final[:, activos[~divergente]] = X_nuevo[:, ~divergente]
+            siguen = ~(divergente | convergido)
+            activos = activos[siguen]
+            if aceleracion == "anderson":
+                dF = [d[:, siguen] for d in dF]
+                dG = [d[:, siguen] for d in dG]
+                anterior = (anterior[0][:, siguen], anterior[1][:, siguen])
+
+    return X_final, iteraciones, estado
+
+
+@medir_fase("resolver")
+def newton_sistema(f_strs, X0, tol, max_iter, variables=None, limite=1e100):
+    """
+    Método de Newton para F(X) = 0 con el jacobiano simbólico, sobre muchos puntos iniciales a la vez.
+
+    Cada paso resuelve J(X) dX = -F(X) para todas las columnas con una sola
+    llamada a np.linalg.solve. Las columnas con jacobiano singular se
+    retiran con estado DENOMINADOR_CERO.
+
+    Args:
+        f_strs (list): Componentes de F como strings (o un string separado por ";").
+        X0 (array_like): Puntos iniciales, de forma (n,) o (n, m).
+        tol (float): Tolerancia sobre max|dX|.
+        max_iter (int): Número máximo de iteraciones.
+        variables (list): Nombres de las variables (ver compilar_sistema).
+        limite (float): Magnitud a partir de la cual se considera que el punto diverge.
+
+    Returns:
+        tuple: (X_final, iteraciones, estado), con X_final de forma (n, m).
+    """
+    _, nombres, F, J = compilar_sistema(f_strs, variables, jacobiano=True)
+    X_final = _puntos_iniciales(X0, len(nombres))
+    iteraciones = np.zeros(X_final.shape[1], dtype=int)
+    estado = np.full(X_final.shape[1], MAX_ITER, dtype=int)
+    activos = np.arange(X_final.shape[1])
+
+    with np.errstate(all="ignore"):
+        for i in range(1, max_iter + 1):
+            if activos.size == 0:
+                break
+
+            X = X_final[:, activos]
+            FX = F(X)
+            JX = J(X).transpose(2, 0, 1)  # (activos, n, n)
+
+            try:
+                dX = np.linalg.solve(JX, -FX.T[..., None])[..., 0].T
+            except np.linalg.LinAlgError:
+                # Solo se calcula el condicionamiento cuando alguna matriz es singular
+                singular = ~(np.linalg.cond(JX) < 1 / np.finfo(float).eps)
+                estado[activos[singular]] = DENOMINADOR_CERO
+                iteraciones[activos[singular]] = i
+                activos, X, FX, JX = activos[~singular], X[:, ~singular], FX[:, ~singular], JX[~singular]
+                dX = np.linalg.solve(JX, -FX.T[..., None])[..., 0].T
+
+            X_nuevo = X + dX
+            error = np.max(np.abs(dX), axis=0)
+            iteraciones[activos] = i
+
+            divergente = ~np.all(np.isfinite(X_nuevo), axis=0) | (np.max(np.abs(X_nuevo), axis=0) > limite)
+            convergido = ~divergente & (error < tol)
+            estado[activos[divergente]] = DIVERGIO
+            estado[activos[convergido]] = CONVERGIO
+
+            X_final[:, activos[~divergente]] = X_nuevo[:, ~divergente]
+            activos = activos[~(divergente | convergido)]
+
+    return X_final, iteraciones, estado
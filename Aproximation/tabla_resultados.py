@@ -0,0 +1,196 @@
+# tabla_resultados.py
+from tkinter import ttk
+
+import numpy as np
+
+
+class AlmacenColumnar:
+    """
+    Guarda las filas de resultados como arreglos de NumPy por columna.
+
+    Cada fila pertenece a un grupo (el intervalo que la produjo). La capacidad
+    crece al doble cuando se llena, así que agregar filas es O(1) amortizado.
+    Los valores None se guardan como NaN.
+    """
+
+    def __init__(self, n_columnas, capacidad=1024):
+        self.n = 0
+        self.datos = np.empty((capacidad, n_columnas))
+        self.grupos = np.empty(capacidad, dtype=int)
+
+    def agregar(self, filas, grupo=0):
+        bloque = np.array([[np.nan if v is None else v for v in fila] for fila in filas], dtype=float)
+        if bloque.size == 0:
+            return
+        nuevo_n = self.n + len(bloque)
+        if nuevo_n > len(self.datos):
+            capacidad = max(nuevo_n, 2 * len(self.datos))
+            datos = np.empty((capacidad, self.datos.shape[1]))
+            grupos = np.empty(capacidad, dtype=int)
+            datos[:self.n], grupos[:self.n] = self.datos[:self.n], self.grupos[:self.n]
+            self.datos, self.grupos = datos, grupos
+        self.datos[self.n:nuevo_n] = bloque
+        self.grupos[self.n:nuevo_n] = grupo
+        self.n = nuevo_n
+
+    def limpiar(self):
+        self.n = 0
+
+
+class TablaVirtual:
+    """
+    Tabla de resultados que solo dibuja las filas visibles.
+
+    El Treeview tiene siempre tantos ítems como filas caben en pantalla; al
+    desplazarse se reescriben sus valores desde el AlmacenColumnar, formateando
+    solo lo que se ve. Ordenar, filtrar por intervalo o mostrar solo la fila
+    final de cada intervalo recalculan un vector de índices, sin reconstruir
+    el widget.
+
+    Args:
+        master: Contenedor de Tk.
+        filas_visibles (int): Altura inicial de la tabla, en filas.
+    """
+
+    def __init__(self, master, filas_visibles=20):
+        self.tabla = ttk.Treeview(master, show="headings", height=filas_visibles, selectmode="browse")
+        self.scrollbar = ttk.Scrollbar(master, orient="vertical", command=self._desplazar)
+        self.tabla.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.columnas = []
+        self.formatos = []
+        self.almacen = AlmacenColumnar(1)
+        self._vista = np.arange(0)
+        self._inicio = 0
+        self._orden = None  # (columna, descendente)
+        self._grupo = None
+        self._solo_finales = False
+        self._refresco_pendiente = False
+
+        self.tabla.bind("<MouseWheel>", lambda e: self._desplazar("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.tabla.bind("<Button-4>", lambda e: self._desplazar("scroll", -1, "units"))
+        self.tabla.bind("<Button-5>", lambda e: self._desplazar("scroll", 1, "units"))
+        self.tabla.bind("<Configure>", lambda e: self._programar_refresco())
+
+    # ---- Configuración y datos ----
+    def configurar(self, columnas, formatos):
+        """
+        Define las columnas y su formato ("d" para enteros, o una especificación
+        de format como ".6f" o ".2e"). Borra los datos existentes.
+        """
+        self.columnas = list(columnas)
+        self.formatos = list(formatos)
+        self.tabla["columns"] = self.columnas
+        for i, col in enumerate(self.columnas):
+            self.tabla.heading(col, text=col, command=lambda i=i: self.ordenar(i))
+            self.tabla.column(col, anchor="center", width=100)
+        self.almacen = AlmacenColumnar(len(self.columnas))
+        self.limpiar()
+
+    def limpiar(self):
+        self.almacen.limpiar()
+        self._orden = None
+        self._grupo = None
+        self._solo_finales = False
+        self._recalcular_vista()
+
+    def agregar(self, filas, grupo=0):
+        """Agrega un bloque de filas del grupo indicado y programa un único refresco."""
+        self.almacen.agregar(filas, grupo)
+        self._recalcular_vista()
+
+    def grupos(self):
+        """Devuelve los grupos presentes, en orden de aparición."""
+        grupos = self.almacen.grupos[:self.almacen.n]
+        _, primeros = np.unique(grupos, return_index=True)
+        return grupos[np.sort(primeros)].tolist()
+
+    # ---- Ordenamiento y filtros ----
+    def ordenar(self, indice_columna):
+        """Ordena por la columna; un segundo clic invierte el orden."""
+        descendente = self._orden is not None and self._orden == (indice_columna, False)
+        self._orden = (indice_columna, descendente)
+        self._recalcular_vista()
+
+    def filtrar(self, grupo=None, solo_finales=False):
+        """Muestra solo un grupo (None = todos) y/o solo la última fila de cada grupo."""
+        self._grupo = grupo
+        self._solo_finales = solo_finales
+        self._recalcular_vista()
+
+    def _recalcular_vista(self):
+        n = self.almacen.n
+        grupos = self.almacen.grupos[:n]
+        vista = np.arange(n)
+        if self._solo_finales and n:
+            # Índice de la última aparición de cada grupo
+            _, ultimos = np.unique(grupos[::-1], return_index=True)
+            vista = np.sort(n - 1 - ultimos)
+        if self._grupo is not None:
+            vista = vista[grupos[vista] == self._grupo]
+        if self._orden is not None:
+            columna, descendente = self._orden
+            orden = np.argsort(self.almacen.datos[vista, columna], kind="stable")
+            vista = vista[orden[::-1] if descendente else orden]
+        self._vista = vista
+        self._programar_refresco()
+
+    # ---- Dibujo de las filas visibles ----
+    def _programar_refresco(self):
+        if not self._refresco_pendiente:
+            self._refresco_pendiente = True
+            self.tabla.after_idle(self._refrescar)
+
+    def _filas_visibles(self):
+        # Filas que caben en la altura actual; antes de mostrarse se usa la altura inicial
+        alto = self.tabla.winfo_height()
+        if alto <= 1:
+            return max(1, int(self.tabla.cget("height")))
+        alto_fila = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, (alto - alto_fila) // alto_fila)
+
+    def _formatear(self, valor, formato):
+        if np.isnan(valor):
+            return "-"
+        if formato == "d":
+            return str(int(valor))
+        return format(valor, formato)
+
+    def _refrescar(self):
+        self._refresco_pendiente = False
+        visibles = self._filas_visibles()
+        total = len(self._vista)
+        self._inicio = max(0, min(self._inicio, total - visibles))
+
+        items = self.tabla.get_children()
+        if len(items) < visibles:
+            for _ in range(visibles - len(items)):
+                self.tabla.insert("", "end", values=())
+        elif len(items) > visibles:
+            self.tabla.delete(*items[visibles:])
+        items = self.tabla.get_children()
+
+        indices = self._vista[self._inicio:self._inicio + visibles]
+        filas = self.almacen.datos[indices]
+        for item, fila in zip(items, filas):
+            self.tabla.item(item, values=[self._formatear(v, f) for v, f in zip(fila, self.formatos)])
+        for item in items[len(indices):]:
+            self.tabla.item(item, values=())
+
+        if total:
+            self.scrollbar.set(self._inicio / total, min(1.0, (self._inicio + visibles) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        visibles = self._filas_visibles()
+        total = len(self._vista)
+        if accion == "moveto":
+            self._inicio = int(float(cantidad) * total)
+        elif accion == "scroll":
+            paso = visibles if unidad == "pages" else 1
+            self._inicio += int(cantidad) * paso
+        self._inicio = max(0, min(self._inicio, total - visibles))
+        self._programar_refresco()
+        return "break"
@@ -0,0 +1,6 @@
+# Los módulos del proyecto se importan por nombre (from compilador import ...),
+# igual que al ejecutar main.py o cli.py desde esta carpeta.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from cli import main
+
+
+def test_ida_y_vuelta_jsonl(tmp_path):
+    entrada, salida = tmp_path / "trabajos.jsonl", tmp_path / "resultados.jsonl"
+    trabajos = [
+        {"expr": "sin x", "a": 1, "b": 7, "delta": 0.5, "tol": 1e-10},
+        {"id": "pf", "metodo": "punto_fijo", "g": "cos(x)", "x0": 1.0, "tol": 1e-10},
+        {"expr": "x +* 2", "a": 0, "b": 1},
+    ]
+    entrada.write_text("\n".join(json.dumps(t) for t in trabajos) + "\n", encoding="utf-8")
+
+    main([str(entrada), "--salida", str(salida)])
+    resultados = [json.loads(linea) for linea in salida.read_text(encoding="utf-8").splitlines()]
+
+    assert [r["id"] for r in resultados] == [1, "pf", 3]
+    assert resultados[0]["metodo"] == "interpolacion"
+    assert [r["intervalo"] for r in resultados[0]["raices"]] == [[3.0, 3.5], [6.0, 6.5]]
+    assert [r["raiz"] for r in resultados[0]["raices"]] == pytest.approx([3.141592653589793, 6.283185307179586])
+
+    assert resultados[1]["convergio"] is True
+    assert resultados[1]["raiz"] == pytest.approx(0.7390851332151607)
+
+    assert "error" in resultados[2]
+
+
+def test_sin_advertencias_de_numpy(tmp_path, capfd):
+    entrada = tmp_path / "trabajos.jsonl"
+    entrada.write_text(json.dumps({"expr": "log(x)", "a": -1, "b": 3, "delta": 0.5}) + "\n", encoding="utf-8")
+    main([str(entrada), "--salida", str(tmp_path / "resultados.jsonl")])
+    assert "RuntimeWarning" not in capfd.readouterr().err
+
+
+def test_salida_estandar_solo_jsonl(tmp_path, capsys):
+    entrada = tmp_path / "trabajos.jsonl"
+    trabajos = [
+        # Aitken imprime un aviso al anularse el denominador
+        {"metodo": "punto_fijo", "g": "cos(x)", "x0": 1, "aitken": True, "tol": 1e-14},
+        # Raíz exacta en un nodo de la malla: se informa una sola vez
+        {"expr": "x - 1", "a": 0, "b": 2, "delta": 1},
+    ]
+    entrada.write_text("\n".join(json.dumps(t) for t in trabajos) + "\n", encoding="utf-8")
+
+    main([str(entrada)])
+    lineas = capsys.readouterr().out.splitlines()
+    resultados = [json.loads(linea) for linea in lineas]
+
+    assert len(resultados) == 2
+    assert [r["raiz"] for r in resultados[1]["raices"]] == [1.0]
@@ -0,0 +1,29 @@
+import pytest
+
+from compilador import compilar, estadisticas, limpiar_cache, normalizar, parsear
+
+
+def test_espacios_que_separan_nombres_se_conservan():
+    import sympy as sp
+    x = sp.Symbol("x")
+    assert parsear("sin x") == sp.sin(x)
+    assert parsear("x exp x") == x * sp.exp(x)
+
+
+def test_espacios_alrededor_de_operadores_comparten_clave():
+    assert normalizar(" x**2 - 4 ") == normalizar("x**2-4") == "x**2-4"
+    assert normalizar("sin x") != normalizar("sinx")
+
+
+def test_un_fallo_de_compilacion_se_cuenta_una_vez():
+    limpiar_cache()
+    compilar("x**3 - 2")
+    assert estadisticas()["fallos"] == 1
+    compilar("x**3-2")
+    assert estadisticas()["aciertos"] == 1
+    assert estadisticas()["fallos"] == 1
+
+
+def test_expresion_invalida():
+    with pytest.raises(ValueError):
+        parsear("x +* 2")
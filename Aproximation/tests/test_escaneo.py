@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from cache_evaluaciones import CacheEvaluaciones
+from compilador import compilar
+from validador_intervalos import buscar_intervalos, buscar_intervalos_adaptativo
+
+
+def test_intervalos_como_la_version_original():
+    esperados = [(3.0, 3.5), (6.0, 6.5)]
+    assert buscar_intervalos("sin x", 1, 7, 0.5) == esperados
+    assert [tuple(map(float, par)) for par in buscar_intervalos("sin x", 1, 7, 0.5, vectorizado=False)] == esperados
+
+
+def test_raiz_en_un_nodo_y_huecos_de_dominio():
+    assert buscar_intervalos("x**2 - 4", 0, 3, 0.5) == [(1.5, 2.0), (2.0, 2.5)]
+    assert buscar_intervalos("log(x)", -1, 3, 0.5) == [(0.5, 1.0), (1.0, 1.5)]
+
+
+def test_paso_menor_que_el_redondeo():
+    assert buscar_intervalos("x - 1e-9", 0, 1e-8, 7e-10) == [(7e-10, 1.4e-09)]
+
+
+def test_adaptativo_raiz_doble():
+    # El nodo exacto en la raíz doble se informa una sola vez, como intervalo degenerado
+    assert buscar_intervalos_adaptativo("(x-1)**2", 0, 3, 0.5) == [(1.0, 1.0)]
+    intervalos, tangentes = buscar_intervalos_adaptativo("(x-pi)**2*(x-1)", 0, 5, 0.5, devolver_tangentes=True)
+    assert intervalos == [(1.0, 1.0)]
+    assert np.allclose(tangentes, [np.pi], atol=1e-6)
+
+
+@pytest.mark.parametrize("expr, a, b, delta, raices", [
+    # Un cero exacto en un nodo no impide encontrar otra raíz en la misma celda
+    ("x*(x-0.3)", 0, 1, 0.5, [0.0, 0.3]),
+    ("sin(10*x)", 0, 1, 0.4, [0.0, np.pi / 10, 2 * np.pi / 10, 3 * np.pi / 10]),
+    ("(x-1.05)*(x-1.06)", 0, 2.1, 0.3, [1.05, 1.06]),
+    # La cola [último nodo, b] también se revisa
+    ("x-0.95", 0, 1, 0.4, [0.95]),
+])
+def test_adaptativo_encuentra_todas_las_raices(expr, a, b, delta, raices):
+    intervalos = buscar_intervalos_adaptativo(expr, a, b, delta)
+    assert len(intervalos) == len(raices)
+    for (x0, x1), raiz in zip(intervalos, raices):
+        assert x0 - 1e-12 <= raiz <= x1 + 1e-12
+
+
+def test_cache_guarda_solo_los_extremos_de_las_mallas_grandes():
+    f = CacheEvaluaciones(compilar("sin(x)")[1])
+    intervalos = buscar_intervalos("sin(x)", 0, 100, 1e-3, f_lambd=f)
+    assert len(f) == 2 * len(intervalos)
+    evaluaciones = f.evaluaciones
+    for a, b in intervalos:
+        f(a), f(b)
+    assert f.evaluaciones == evaluaciones
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from compilador import compilar, compilar_derivada
+from metodo import interpolacion_lineal, interpolacion_lineal_lotes
+from metodos_rapidos import brent, newton, secante, steffensen
+from paralelo import interpolacion_lineal_paralela
+from punto_fijo import CONVERGIO, DIVERGIO, punto_fijo, punto_fijo_lotes
+
+
+def _f(expr):
+    return compilar(expr)[1]
+
+
+def test_interpolacion_lineal():
+    resultados = interpolacion_lineal(_f("x**2 - 2"), 0, 2, 1e-10, 100, True)
+    assert resultados[-1][3] == pytest.approx(np.sqrt(2), abs=1e-8)
+
+
+def test_lotes_igual_que_uno_por_uno():
+    f = _f("sin(x)")
+    a, b = np.array([3.0, 6.0]), np.array([3.5, 6.5])
+    lotes = interpolacion_lineal_lotes(f, a, b, 1e-10, 100, True)
+    for filas, a_i, b_i in zip(lotes, a, b):
+        assert filas == interpolacion_lineal(f, a_i, b_i, 1e-10, 100, True)
+
+
+def test_intervalo_degenerado_en_raiz_exacta():
+    # Así informa el escaneo adaptativo un nodo con f = 0
+    f = _f("x*(x-0.3)")
+    assert interpolacion_lineal(f, 0.0, 0.0, 1e-10, 100, True) == [(1, 0.0, 0.0, 0.0, 0.0, 0.0)]
+    assert interpolacion_lineal_lotes(f, [0.0], [0.0], 1e-10, 100, True) == [[(1, 0.0, 0.0, 0.0, 0.0, 0.0)]]
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_paralelo_igual_que_lotes_y_cancelacion(procesos):
+    import threading
+    # 200 intervalos alcanzan para repartirlos entre dos procesos
+    a = np.pi * np.arange(1, 201) - 0.5
+    b = a + 1.0
+    esperados = interpolacion_lineal_lotes(_f("sin(x)"), a, b, 1e-10, 100, True)
+    assert interpolacion_lineal_paralela("sin(x)", a, b, 1e-10, 100, True, procesos=procesos) == esperados
+
+    # Cancelado de antemano: ningún intervalo se entrega, sin importar la vía
+    cancelado = threading.Event()
+    cancelado.set()
+    resultados = interpolacion_lineal_paralela("sin(x)", a, b, 1e-10, 100, True, procesos=procesos,
+                                               cancelado=cancelado)
+    assert resultados == [[] for _ in a]
+
+
+@pytest.mark.parametrize("metodo", [brent, newton, secante, steffensen])
+@pytest.mark.parametrize("expr, a, b, raiz", [
+    ("x**2 - 2", 0, 2, np.sqrt(2)),
+    ("cos(x) - x", 0, 1, 0.7390851332151607),
+    ("exp(x) - 10", 0, 5, np.log(10)),
+    # Plana lejos de la raíz: la secante y Steffensen sin salvaguarda se escapaban
+    ("x**10 - 1", 0, 1.3, 1.0),
+    # Intervalo que no se achica si no se fuerza la bisección
+    ("exp(x) - 1e6", 0, 20, np.log(1e6)),
+])
+def test_metodos_rapidos(metodo, expr, a, b, raiz):
+    extra = {"df_lambd": compilar_derivada(expr)[1]} if metodo is newton else {}
+    for use_tol in (True, False):
+        resultados, evaluaciones = metodo(_f(expr), a, b, 1e-10, 100, use_tol, **extra)
+        _, a_i, b_i, xr, fr, _ = resultados[-1]
+        assert xr == pytest.approx(raiz, abs=1e-8)
+        assert abs(fr) < 1e-8
+        assert min(a_i, b_i) <= xr <= max(a_i, b_i)
+        assert evaluaciones >= len(resultados)
+        # Nunca mucho peor que la bisección pura
+        assert evaluaciones <= 2 * (np.log2((b - a) / 1e-10) + 5)
+
+
+def test_intervalo_sin_cambio_de_signo():
+    with pytest.raises(ValueError):
+        secante(_f("x**2 + 1"), -1, 1, 1e-10, 100, True)
+
+
+def test_bucles_numba_igual_que_python():
+    pytest.importorskip("numba")
+    from bucles_numba import interpolacion_lineal_numba, punto_fijo_numba
+
+    for expr, a, b in [("x**2 - 2", 0, 2), ("exp(x) - 1e6", 0, 20), ("x*(x-0.3)", 0.0, 0.0)]:
+        assert interpolacion_lineal_numba(expr, a, b, 1e-10, 100, True) == \
+            interpolacion_lineal(_f(expr), a, b, 1e-10, 100, True)
+    for use_aitken in (False, True):
+        resultados, x_vals, *_ = punto_fijo("cos(x)", 1.0, 1e-10, 200, use_aitken)
+        assert punto_fijo_numba("cos(x)", 1.0, 1e-10, 200, use_aitken) == (resultados, x_vals)
+
+
+def test_punto_fijo():
+    resultados, *_ = punto_fijo("cos(x)", 1.0, 1e-10, 200, False)
+    assert resultados[-1][1] == pytest.approx(0.7390851332151607, abs=1e-9)
+    resultados, *_ = punto_fijo("cos(x)", 1.0, 1e-10, 200, True)
+    assert resultados[-1][1] == pytest.approx(0.7390851332151607, abs=1e-9)
+
+
+@pytest.mark.parametrize("use_aitken", [False, True])
+def test_punto_fijo_lotes_estados(use_aitken):
+    x, _, estado = punto_fijo_lotes("cos(x)", np.linspace(0, 2, 10000), 1e-10, 200, use_aitken)
+    assert np.all(estado == CONVERGIO)
+    assert np.allclose(x, 0.7390851332151607, atol=1e-9)
+
+    x, _, estado = punto_fijo_lotes("x**2", [0.5, 2.0], 1e-10, 200, use_aitken)
+    assert estado[0] == CONVERGIO and x[0] == pytest.approx(0, abs=1e-9)
+    if use_aitken:
+        # Aitken también converge al punto fijo repulsor x = 1
+        assert estado[1] == CONVERGIO and x[1] == pytest.approx(1, abs=1e-9)
+    else:
+        assert estado[1] == DIVERGIO
@@ -1,12 +1,49 @@
 # validador_intervalos_corregido.py
 import numpy as np
-import sympy as sp
-from sympy.parsing.sympy_parser import (
-    parse_expr, standard_transformations, implicit_multiplication_application
-)
 
+from compilador import compilar, compilar_derivada
+from instrumentacion import medir_fase
 
-def buscar_intervalos(fx_str, a, b, delta=1.0):
+
+def evaluar_malla(f, puntos, tam_bloque=4096):
+    """
+    Evalúa f sobre toda la malla de una sola vez.
+
+    Si la expresión no acepta arreglos (no es compatible con ufuncs), se evalúa
+    por bloques y, dentro de un bloque que falle, punto por punto. Los puntos
+    donde la función no está definida quedan como NaN.
+    """
+    with np.errstate(all="ignore"):
+        try:
+            valores = np.asarray(f(puntos), dtype=float)
+            # Las expresiones constantes devuelven un escalar: se expande a la malla
+            return np.broadcast_to(valores, puntos.shape).astype(float)
+        except (ValueError, TypeError, ZeroDivisionError, AttributeError):
+            pass
+
+        valores = np.full(puntos.shape, np.nan)
+        for inicio in range(0, len(puntos), tam_bloque):
+            bloque = puntos[inicio:inicio + tam_bloque]
+            try:
+                valores[inicio:inicio + len(bloque)] = np.broadcast_to(
+                    np.asarray(f(bloque), dtype=float), bloque.shape)
+            except (ValueError, TypeError, ZeroDivisionError, AttributeError):
+                for j, xj in enumerate(bloque):
+                    try:
+                        valores[inicio + j] = float(f(xj))
+                    except (ValueError, TypeError, ZeroDivisionError, AttributeError):
+                        continue
+    return valores
+
+
+def _decimales(paso):
+    # Los extremos se redondean a 8 decimales, o a más si el paso es tan fino
+    # que con 8 se juntarían puntos distintos de la malla
+    return max(8, int(np.ceil(-np.log10(paso))) + 4)
+
+
+@medir_fase("escaneo")
+def buscar_intervalos(fx_str, a, b, delta=1.0, vectorizado=True, f_lambd=None, backend="numpy"):
     """
     Busca subintervalos en [a, b] donde la función f(x) cambia de signo o toca el cero.
 
@@ -18,6 +55,13 @@ def buscar_intervalos(fx_str, a, b, delta=1.0):
         a (float): Límite inferior del intervalo de búsqueda.
         b (float): Límite superior del intervalo de búsqueda.
         delta (float): El tamaño del paso para crear los subintervalos.
+        vectorizado (bool): Si es True, evalúa toda la malla en una sola llamada
+            y detecta los cambios de signo con operaciones de arreglos. Si es
+            False, recorre la malla punto por punto (modo original).
+        f_lambd (callable): Función ya compilada (opcional); si se omite se
+            compila fx_str.
+        backend (str): Backend de compilador.compilar para fx_str; "numexpr"
+            conviene con mallas grandes.
 
     Returns:
         list: Una lista de tuplas, donde cada tupla es un intervalo (x0, x1)
@@ -30,21 +74,20 @@ def buscar_intervalos(fx_str, a, b, delta=1.0):
     if a > b:
         a, b = b, a
 
-    # Configuración para parsear la función con SymPy
-    transformations = (standard_transformations + (implicit_multiplication_application,))
-    x_symbol = sp.symbols('x')
-    try:
-        f_expr = parse_expr(fx_str, transformations=transformations)
-    except Exception as e:
-        raise ValueError(f"Error al interpretar la función: {e}")
-
-    # Se convierte la expresión de SymPy a una función numérica de NumPy para eficiencia
-    f = sp.lambdify(x_symbol, f_expr, "numpy")
+    # Se parsea y convierte la expresión a una función de NumPy (reutilizando la caché)
+    f = f_lambd if f_lambd is not None else compilar(fx_str, backend)[1]
 
     # Usamos b + delta/2 para asegurar que 'b' se incluya en el rango si es un múltiplo.
     puntos = np.arange(a, b + delta / 2, delta)
     if puntos[-1] > b:
         puntos[-1] = b
+    # La malla se redondea antes de evaluar, así los extremos devueltos son
+    # exactamente los puntos evaluados y una CacheEvaluaciones los reconoce.
+    decimales = _decimales(delta)
+    puntos = np.round(puntos, decimales)
+
+    if vectorizado:
+        return _intervalos_vectorizado(f, puntos, decimales)
 
     intervalos_con_raiz = []
 
@@ -58,10 +101,195 @@ def buscar_intervalos(fx_str, a, b, delta=1.0):
             # 1. Si f0 * f1 < 0: Hay un cambio de signo, por lo tanto, una raíz dentro del intervalo.
             # 2. Si f0 * f1 == 0: Uno de los extremos (o ambos) es una raíz exacta.
             if f0 * f1 <= 0:
-                intervalos_con_raiz.append((round(x0, 8), round(x1, 8)))
+                intervalos_con_raiz.append((round(x0, decimales), round(x1, decimales)))
 
         except (ValueError, TypeError, ZeroDivisionError):
             # Si la función no está definida en un punto (ej. log(0)), lo ignoramos y continuamos
             continue
 
     return intervalos_con_raiz
+
+
+def _intervalos_vectorizado(f, puntos, decimales=8):
+    """
+    Variante vectorizada de la búsqueda: cada punto de la malla se evalúa una
+    sola vez y los pares (x0, x1) con f0 * f1 <= 0 se localizan con máscaras.
+    """
+    valores = evaluar_malla(f, puntos)
+
+    # Los puntos fuera del dominio (log, sqrt, divisiones por cero) producen
+    # NaN/inf; se descartan los pares que los contengan.
+    finitos = np.isfinite(valores)
+    f0, f1 = valores[:-1], valores[1:]
+    validos = finitos[:-1] & finitos[1:]
+
+    # Comparar signos evita el desbordamiento del producto f0 * f1
+    signo0, signo1 = np.sign(f0), np.sign(f1)
+    con_raiz = validos & ((signo0 * signo1) <= 0)
+
+    indices = np.flatnonzero(con_raiz)
+    x0s = np.round(puntos[indices], decimales)
+    x1s = np.round(puntos[indices + 1], decimales)
+    return list(zip(x0s.tolist(), x1s.tolist()))
+
+
+@medir_fase("escaneo")
+def buscar_intervalos_adaptativo(fx_str, a, b, delta=1.0, profundidad_max=20, seguridad=2.0, tol_tangente=1e-10,
+                                 devolver_tangentes=False, f_lambd=None, df_lambd=None, backend="numpy"):
+    """
+    Busca intervalos con raíz refinando la malla solo donde puede haber raíces.
+
+    Parte de una malla gruesa de paso `delta` y usa la derivada simbólica de f
+    para acotar |f| en cada celda: si min|f| en los puntos evaluados supera
+    la variación máxima que permite la pendiente, la celda no puede contener
+    raíces y se descarta. Las celdas sospechosas (|f| pequeño frente a la
+    pendiente) se bisecan, lo que revela pares de raíces dentro de una misma
+    celda y raíces dobles tangentes como (x - 1)**2, con muchas menos
+    evaluaciones que una malla uniforme de la misma resolución. La cota usa
+    la pendiente en puntos de muestra, así que `delta` debe seguir siendo del
+    orden de la escala de oscilación de f.
+
+    Args:
+        fx_str (str): La expresión de la función como un string.
+        a (float): Límite inferior del intervalo de búsqueda.
+        b (float): Límite superior del intervalo de búsqueda.
+        delta (float): Paso de la malla inicial.
+        profundidad_max (int): Número máximo de bisecciones por celda.
+        seguridad (float): Factor que amplía la cota de la pendiente.
+        tol_tangente (float): |f| por debajo del cual un extremo local se
+            considera una raíz tangente.
+        devolver_tangentes (bool): Si es True, devuelve también los puntos
+            aproximados de las raíces tangentes (sin cambio de signo).
+        f_lambd (callable): Función ya compilada (opcional).
+        df_lambd (callable): Derivada ya compilada (opcional).
+        backend (str): Backend de compilador.compilar para f y su derivada.
+
+    Returns:
+        list: Intervalos (x0, x1) con cambio de signo, ordenados. Un nodo
+              donde f vale exactamente cero se informa una sola vez, como el
+              intervalo degenerado (z, z). Con devolver_tangentes=True, la
+              tupla (intervalos, tangentes).
+    """
+    if delta <= 0:
+        raise ValueError("El valor de delta debe ser positivo.")
+
+    if a > b:
+        a, b = b, a
+
+    f = f_lambd if f_lambd is not None else compilar(fx_str, backend)[1]
+    df = df_lambd if df_lambd is not None else compilar_derivada(fx_str, backend)[1]
+
+    # A diferencia de la malla uniforme, el último nodo es siempre b, así no
+    # queda sin revisar la cola [último nodo, b] cuando b - a no es múltiplo de delta
+    puntos = np.arange(a, b + delta / 2, delta)
+    puntos = np.append(puntos[puntos < b], b)
+    # Los extremos deben distinguir también las celdas más finas de la bisección
+    decimales = _decimales(delta / 2 ** profundidad_max)
+    puntos = np.unique(np.round(puntos, decimales))
+    valores = evaluar_malla(f, puntos)
+    derivadas = evaluar_malla(df, puntos)
+
+    x0, x1 = puntos[:-1], puntos[1:]
+    f0, f1 = valores[:-1], valores[1:]
+    d0, d1 = derivadas[:-1], derivadas[1:]
+
+    encontrados = []
+    tangentes = []
+    ceros = [puntos[valores == 0]]
+
+    for nivel in range(profundidad_max + 1):
+        if x0.size == 0:
+            break
+
+        # Un extremo con f = 0 ya es una raíz (guardada en `ceros`); la celda sigue
+        # con la cota y la bisección como las demás porque puede contener otras
+        finitos = np.isfinite(f0) & np.isfinite(f1)
+        cambio = finitos & (np.sign(f0) * np.sign(f1) < 0)
+        encontrados.append((x0[cambio], x1[cambio]))
+
+        resto = finitos & ~cambio
+        x0, x1, f0, f1, d0, d1 = x0[resto], x1[resto], f0[resto], f1[resto], d0[resto], d1[resto]
+        if x0.size == 0:
+            break
+
+        xm = (x0 + x1) / 2
+        fm = evaluar_malla(f, xm)
+        dm = evaluar_malla(df, xm)
+        ceros.append(xm[fm == 0])
+
+        # Cota inferior de |f| en la celda: todo punto está a h/4 de alguno de los tres evaluados
+        h = x1 - x0
+        with np.errstate(invalid="ignore"):
+            pendiente = np.nanmax(np.abs(np.stack([d0, dm, d1])), axis=0)
+            pendiente = np.where(np.isfinite(pendiente), pendiente, np.inf)
+            cota = np.minimum(np.minimum(np.abs(f0), np.abs(f1)), np.abs(fm)) - seguridad * pendiente * h / 4
+        sospechosas = np.isfinite(fm) & (cota <= 0)
+
+        if nivel == profundidad_max:
+            # Última resolución: se busca el extremo local donde f' cambia de signo
+            # Las celdas pegadas a un cero exacto no se distinguen de él a esta resolución
+            extremo = sospechosas & (f0 != 0) & (f1 != 0) & (np.sign(d0) * np.sign(d1) <= 0)
+            if np.any(extremo):
+                xe0, xe1, fe0 = x0[extremo], x1[extremo], f0[extremo]
+                de0, de1 = d0[extremo], d1[extremo]
+                with np.errstate(all="ignore"):
+                    t = np.where(de0 != de1, de0 / (de0 - de1), 0.5)
+                xe = xe0 + np.clip(t, 0, 1) * (xe1 - xe0)
+                fe = evaluar_malla(f, xe)
+                signo = np.isfinite(fe) & (np.sign(fe) != np.sign(fe0))
+                ceros.append(xe[fe == 0])
+                signo &= fe != 0
+                encontrados.append((xe0[signo], xe[signo]))
+                encontrados.append((xe[signo], xe1[signo]))
+                tangente = np.isfinite(fe) & ~signo & (np.abs(fe) <= tol_tangente)
+                tangentes.extend(xe[tangente].tolist())
+            break
+
+        # Se bisecan solo las celdas sospechosas
+        x0, xm, x1 = x0[sospechosas], xm[sospechosas], x1[sospechosas]
+        f0, fm, f1 = f0[sospechosas], fm[sospechosas], f1[sospechosas]
+        d0, dm, d1 = d0[sospechosas], dm[sospechosas], d1[sospechosas]
+        x0, x1 = np.concatenate([x0, xm]), np.concatenate([xm, x1])
+        f0, f1 = np.concatenate([f0, fm]), np.concatenate([fm, f1])
+        d0, d1 = np.concatenate([d0, dm]), np.concatenate([dm, d1])
+
+    # Cada cero exacto se informa una vez, como intervalo degenerado
+    ceros = np.unique(np.concatenate(ceros))
+    izquierdos = np.concatenate([e[0] for e in encontrados] + [ceros])
+    derechos = np.concatenate([e[1] for e in encontrados] + [ceros])
+    orden = np.lexsort((derechos, izquierdos))
+    intervalos = list(zip(np.round(izquierdos[orden], decimales).tolist(),
+                          np.round(derechos[orden], decimales).tolist()))
+
+    if devolver_tangentes:
+        return intervalos, sorted(tangentes)
+    return intervalos
+
+
+def acotar_alrededor(f, a, b, x, paso):
+    """
+    Achica el intervalo [a, b] alrededor de una raíz aproximada x.
+
+    Prueba [x - h, x + h] con h = paso, 10·paso, ... (recortado a [a, b]) y
+    devuelve el primero con cambio de signo. Sirve para arrancar un método
+    desde una raíz ya conocida (por ejemplo, de una ejecución anterior).
+
+    Args:
+        f (callable): Función compilada.
+        a, b (float): Intervalo original, que debe contener a x.
+        x (float): Raíz aproximada.
+        paso (float): Semiancho inicial.
+
+    Returns:
+        tuple: (a, b) acotado, o el intervalo original si no se encontró uno menor.
+    """
+    if not a < x < b or paso <= 0:
+        return a, b
+    h = paso
+    while h < b - a:
+        extremos = np.array([max(a, x - h), min(b, x + h)])
+        f0, f1 = evaluar_malla(f, extremos)
+        if np.isfinite(f0) and np.isfinite(f1) and np.sign(f0) * np.sign(f1) <= 0:
+            return float(extremos[0]), float(extremos[1])
+        h *= 10
+    return a, b